@@ -0,0 +1,149 @@
+"""Synthetic Web API responses for benchmarks."""
+
+
+def _object(type_: str, id_: str) -> dict:
+    return {
+        "id": id_,
+        "href": f"https://api.spotify.com/v1/{type_}s/{id_}",
+        "type": type_,
+        "uri": f"spotify:{type_}:{id_}",
+        "external_urls": {"spotify": f"https://open.spotify.com/{type_}/{id_}"},
+    }
+
+
+def _images() -> list[dict]:
+    return [
+        {"url": f"https://i.scdn.co/image/{size}", "height": size, "width": size}
+        for size in (640, 300, 64)
+    ]
+
+
+def _artist(i: int) -> dict:
+    return {**_object("artist", f"artist{i}"), "name": f"Artist {i}"}
+
+
+def _track(i: int) -> dict:
+    artists = [_artist(i), _artist(i + 1)]
+    album = {
+        **_object("album", f"album{i}"),
+        "album_type": "album",
+        "artists": artists,
+        "images": _images(),
+        "name": f"Album {i}",
+        "total_tracks": 12,
+        "release_date": "2020-01-01",
+        "release_date_precision": "day",
+        "available_markets": ["FI", "SE", "US"],
+    }
+    return {
+        **_object("track", f"track{i}"),
+        "artists": artists,
+        "available_markets": ["FI", "SE", "US"],
+        "disc_number": 1,
+        "duration_ms": 200_000 + i,
+        "explicit": False,
+        "is_local": False,
+        "name": f"Track {i}",
+        "preview_url": None,
+        "track_number": i % 12 + 1,
+        "album": album,
+        "external_ids": {"isrc": f"ISRC{i:08d}"},
+        "popularity": i % 100,
+        "episode": False,
+        "track": True,
+    }
+
+
+def _playlist_track(i: int) -> dict:
+    track = _track(i)
+    return {
+        "added_at": "2020-01-01T12:00:00Z",
+        "added_by": {**_object("user", "user"), "display_name": "User"},
+        "is_local": False,
+        "primary_color": None,
+        "video_thumbnail": {"url": None},
+        "track": track,
+        "item": track,
+    }
+
+
+def playlist_track_paging(total: int = 100, offset: int = 0) -> dict:
+    """Build a page of playlist tracks with distinct tracks for each offset."""
+    url = "https://api.spotify.com/v1/playlists/playlist/tracks"
+    return {
+        "href": f"{url}?offset={offset}&limit={total}",
+        "items": [_playlist_track(offset + i) for i in range(total)],
+        "limit": total,
+        "next": None,
+        "offset": offset,
+        "previous": None,
+        "total": total,
+    }
+
+
+def saved_track_paging(total: int = 50) -> dict:
+    """Build a page of saved tracks."""
+    items = [_track(i) for i in range(total)]
+    for item in items:
+        del item["episode"], item["track"]
+    url = "https://api.spotify.com/v1/me/tracks"
+    return {
+        "href": f"{url}?offset=0&limit={total}",
+        "items": [{"added_at": "2020-01-01T12:00:00Z", "track": t} for t in items],
+        "limit": total,
+        "next": None,
+        "offset": 0,
+        "previous": None,
+        "total": total,
+    }
+
+
+def tracks(total: int = 50) -> dict:
+    """Build a response of several tracks."""
+    items = [_track(i) for i in range(total)]
+    for item in items:
+        del item["episode"], item["track"]
+    return {"tracks": items}
+
+
+def artists(total: int = 50) -> dict:
+    """Build a response of several artists."""
+    items = [
+        {
+            **_artist(i),
+            "followers": {"href": None, "total": i},
+            "genres": ["pop", "rock"],
+            "images": _images(),
+            "popularity": i % 100,
+        }
+        for i in range(total)
+    ]
+    return {"artists": items}
+
+
+def audio_features(total: int = 100) -> dict:
+    """Build a response of audio features of several tracks."""
+    items = [
+        {
+            **_object("audio_features", f"track{i}"),
+            "acousticness": 0.5,
+            "analysis_url": f"https://api.spotify.com/v1/audio-analysis/track{i}",
+            "danceability": 0.5,
+            "duration_ms": 200_000 + i,
+            "energy": 0.5,
+            "instrumentalness": 0.0,
+            "key": i % 12,
+            "liveness": 0.1,
+            "loudness": -5.0,
+            "mode": 1,
+            "speechiness": 0.05,
+            "tempo": 120.0,
+            "time_signature": 4,
+            "track_href": f"https://api.spotify.com/v1/tracks/track{i}",
+            "valence": 0.5,
+        }
+        for i in range(total)
+    ]
+    for item in items:
+        del item["href"], item["external_urls"]
+    return {"audio_features": items}
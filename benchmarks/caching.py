@@ -0,0 +1,56 @@
+"""
+Benchmark cache hit latency of CachingSender against cache size.
+
+Run from the repository root with ``python benchmarks/caching.py``.
+Hit latency should stay flat as the size of the cache grows.
+"""
+
+import timeit
+
+import tekore as tk
+
+
+class StaticSender(tk.Sender):
+    """Respond to every request with a cacheable response."""
+
+    @property
+    def is_async(self) -> bool:
+        """Sender is synchronous."""
+        return False
+
+    def send(self, request: tk.Request) -> tk.Response:
+        """Send request."""
+        headers = {"Cache-Control": "public, max-age=3600"}
+        return tk.Response(request.url, headers, 200, None)
+
+    def close(self) -> None:
+        """Close sender."""
+
+
+def hit_latency(size: int, hits: int = 10_000) -> float:
+    """Measure average latency of cache hits in microseconds."""
+    sender = tk.CachingSender(max_size=size, sender=StaticSender())
+    requests = [tk.Request("GET", f"url/{i}") for i in range(size)]
+    for request in requests:
+        sender.send(request)
+
+    # Hit the least recently used items to exercise usage bookkeeping
+    step = max(size // hits, 1)
+    hit_requests = [requests[i % size] for i in range(0, hits * step, step)]
+
+    def run() -> None:
+        for request in hit_requests:
+            sender.send(request)
+
+    return min(timeit.repeat(run, number=1, repeat=5)) / hits * 1e6
+
+
+def main() -> None:
+    """Print hit latencies."""
+    print(f"{'max_size':>10} {'hit (us)':>10}")
+    for size in (100, 1_000, 10_000, 100_000):
+        print(f"{size:>10} {hit_latency(size):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
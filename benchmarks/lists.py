@@ -0,0 +1,53 @@
+"""
+Benchmark validating lists of models.
+
+Compares constructing models one by one with validating
+the whole list in one call, as done by ``model_list``,
+and with validating the response bytes directly.
+Decoding the bytes is included in every case.
+Run from the repository root with ``python benchmarks/lists.py``.
+"""
+
+import json
+import timeit
+from collections.abc import Callable
+
+from _data import artists, audio_features, tracks
+
+from tekore._client.process import validate_json, validate_list
+from tekore._sender.base import parse_json
+from tekore.model import AudioFeatures, FullArtist, FullTrack, Model
+
+
+def _per_call(function: Callable, number: int = 50) -> float:
+    function()
+    return min(timeit.repeat(function, number=number)) / number * 1e3
+
+
+def main() -> None:
+    """Print list validation times."""
+    cases: list[tuple[str, type[Model], dict]] = [
+        ("tracks", FullTrack, tracks(50)),
+        ("artists", FullArtist, artists(50)),
+        ("audio_features", AudioFeatures, audio_features(100)),
+    ]
+    print(f"{'Endpoint':<16}{'Items':>6}{'Loop':>10}{'Batch':>10}{'Bytes':>10}")
+    for key, type_, content in cases:
+        raw = json.dumps(content).encode()
+
+        def loop(t=type_, r=raw, k=key) -> list:
+            return [t(**i) for i in parse_json(r)[k]]
+
+        def batch(t=type_, r=raw, k=key) -> list:
+            return validate_list(t, parse_json(r)[k])
+
+        def from_bytes(t=type_, r=raw, k=key) -> list:
+            return validate_json(t, r, k, many=True)
+
+        times = [_per_call(f) for f in (loop, batch, from_bytes)]
+        columns = "".join(f"{t:>8.3f}ms" for t in times)
+        print(f"{key:<16}{len(content[key]):>6}{columns}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Benchmark memory used by models, compact models and interned models.
+
+Run from the repository root with ``python benchmarks/memory.py``.
+"""
+
+import gc
+import tracemalloc
+from collections.abc import Callable
+
+from _data import playlist_track_paging
+
+from tekore.model import (
+    Followers,
+    Image,
+    Interner,
+    Model,
+    PlaylistTrackPaging,
+    Restrictions,
+    SimpleArtist,
+    TrackLink,
+    compact,
+)
+
+
+def _item(type_: str, i: int) -> dict:
+    return {
+        "id": f"{type_}{i}",
+        "href": f"https://api.spotify.com/v1/{type_}s/{type_}{i}",
+        "type": type_,
+        "uri": f"spotify:{type_}:{type_}{i}",
+        "external_urls": {"spotify": f"https://open.spotify.com/{type_}/{i}"},
+    }
+
+
+samples: dict[type[Model], Callable[[int], dict]] = {
+    SimpleArtist: lambda i: {**_item("artist", i), "name": f"Artist {i}"},
+    Image: lambda i: {"url": f"https://i.scdn.co/image/{i}", "height": 64, "width": 64},
+    TrackLink: lambda i: _item("track", i),
+    Restrictions: lambda i: {"reason": f"reason {i}"},
+    Followers: lambda i: {"href": None, "total": i},
+}
+
+
+def _bytes_per_instance(create: Callable[[dict], object], jsons: list[dict]) -> float:
+    gc.collect()
+    tracemalloc.start()
+    instances = [create(json) for json in jsons]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del instances
+    return size / len(jsons)
+
+
+def main() -> None:
+    """Print memory used per instance."""
+    n = 10_000
+    print(f"{'Type':<14}{'Model':>10}{'Compact':>10}{'Ratio':>8}")
+    for model, sample in samples.items():
+        jsons = [sample(i) for i in range(n)]
+        full = _bytes_per_instance(lambda j, m=model: m(**j), jsons)
+        small = _bytes_per_instance(lambda j, m=model: compact(m(**j)), jsons)
+        print(f"{model.__name__:<14}{full:>9.0f}B{small:>9.0f}B{small / full:>8.2f}")
+
+    print()
+    cases = {
+        "1 page": [playlist_track_paging(100)],
+        "10 distinct pages": [playlist_track_paging(100, 100 * i) for i in range(10)],
+        "10 repeated pages": [playlist_track_paging(100) for _ in range(10)],
+    }
+    print("Pages of 100 playlist tracks, memory per page")
+    print(f"{'Case':<20}{'Models':>10}{'Interned':>10}{'Ratio':>8}")
+    for case, jsons in cases.items():
+        interner = Interner()
+        full = _bytes_per_instance(lambda j: PlaylistTrackPaging(**j), jsons)
+        shared = _bytes_per_instance(
+            lambda j, i=interner: i.intern(PlaylistTrackPaging(**j)), jsons
+        )
+        ratio = shared / full
+        print(f"{case:<20}{full / 1e3:>8.0f}kB{shared / 1e3:>8.0f}kB{ratio:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark constructing response models.
+
+Run from the repository root with ``python benchmarks/models.py``.
+"""
+
+import timeit
+from collections.abc import Callable
+
+from _data import playlist_track_paging
+
+from tekore.model import PlaylistTrackPaging
+
+
+def _report(name: str, function: Callable, number: int = 20) -> None:
+    function()
+    seconds = min(timeit.repeat(function, number=number))
+    per_page = seconds / number * 1e3
+    print(f"{name}: {per_page:.3f} ms per page")
+
+
+def main() -> None:
+    """Print model construction throughput."""
+    json = playlist_track_paging(100)
+
+    def eager_ids() -> list[str]:
+        return [item.track.id for item in PlaylistTrackPaging(**json).items]
+
+    def lazy_first_id() -> str:
+        return PlaylistTrackPaging.lazy_validate(json).items[0].track.id
+
+    def lazy_ids() -> list[str]:
+        items = PlaylistTrackPaging.lazy_validate(json).items
+        return [item.track.id for item in items]
+
+    _report("PlaylistTrackPaging, 100 items", lambda: PlaylistTrackPaging(**json))
+    _report("Eager, IDs of 100 items", eager_ids)
+    _report("Lazy, ID of the first item", lazy_first_id)
+    _report("Lazy, IDs of 100 items", lazy_ids)
+
+
+if __name__ == "__main__":
+    main()
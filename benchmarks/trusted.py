@@ -0,0 +1,53 @@
+"""
+Benchmark constructing models from trusted responses without validation.
+
+Compares validating pages with building them through
+:func:`construct_trusted`, which only converts nested models,
+timestamps and enumerations, both from decoded JSON
+and from response bytes including decoding.
+Run from the repository root with ``python benchmarks/trusted.py``.
+"""
+
+import json
+import timeit
+from collections.abc import Callable
+
+from _data import playlist_track_paging, saved_track_paging
+
+from tekore._client.process import validate_json
+from tekore._model.trusted import construct_trusted
+from tekore._sender.base import parse_json
+from tekore.model import Model, PlaylistTrackPaging, SavedTrackPaging
+
+
+def _per_call(function: Callable, number: int = 30) -> float:
+    function()
+    return min(timeit.repeat(function, number=number, repeat=10)) / number * 1e3
+
+
+def main() -> None:
+    """Print validation and construction times."""
+    cases: list[tuple[type[Model], dict]] = [
+        (SavedTrackPaging, saved_track_paging(50)),
+        (PlaylistTrackPaging, playlist_track_paging(100)),
+    ]
+    print(f"{'':<28}{'JSON':>24}{'Bytes':>24}")
+    print(f"{'Model':<22}{'Items':>6}" + f"{'Validate':>12}{'Trusted':>12}" * 2)
+    for type_, content in cases:
+        if construct_trusted(type_, content) != type_(**content):
+            msg = f"Constructed {type_.__name__} differs from validated."
+            raise ValueError(msg)
+        raw = json.dumps(content).encode()
+
+        times = [
+            _per_call(lambda t=type_, c=content: t(**c)),
+            _per_call(lambda t=type_, c=content: construct_trusted(t, c)),
+            _per_call(lambda t=type_, r=raw: validate_json(t, r, None)),
+            _per_call(lambda t=type_, r=raw: construct_trusted(t, parse_json(r))),
+        ]
+        columns = "".join(f"{t:>10.2f}ms" for t in times)
+        print(f"{type_.__name__:<22}{len(content['items']):>6}{columns}")
+
+
+if __name__ == "__main__":
+    main()
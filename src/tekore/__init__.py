@@ -48,21 +48,30 @@ from ._sender import (
     AsyncSender,
     BadGateway,
     BadRequest,
+    CacheStats,
+    CacheStorage,
     CachingSender,
     Client,
     ClientError,
+    CoalescingSender,
     ExtendingSender,
     Forbidden,
     HTTPError,
     InternalServerError,
+    LazyResponse,
+    MemoryCacheStorage,
     NotFound,
+    RateLimitingSender,
     Request,
     Response,
     RetryingSender,
+    RetryPolicy,
     Sender,
     SenderConflictWarning,
     ServerError,
     ServiceUnavailable,
+    SQLiteCacheStorage,
+    StreamedResponse,
     SyncSender,
     TooManyRequests,
     Unauthorised,
@@ -100,11 +109,20 @@ _classes = [
     AsyncSender,
     ExtendingSender,
     RetryingSender,
+    RetryPolicy,
+    RateLimitingSender,
+    CoalescingSender,
     CachingSender,
+    CacheStats,
+    CacheStorage,
+    MemoryCacheStorage,
+    SQLiteCacheStorage,
     SenderConflictWarning,
     Client,
     Request,
     Response,
+    LazyResponse,
+    StreamedResponse,
     MissingConfigurationWarning,
 ]
 
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from tekore._client.base import SpotifyBase
 from tekore._client.chunked import chunked, join_lists
-from tekore._client.decor import maximise_limit, scopes, send_and_process
+from tekore._client.decor import (
+    maximise_limit,
+    scopes,
+    send_and_process,
+    stored_entities,
+)
 from tekore._client.process import model_list, single
 from tekore.model import FullAlbum, SimpleTrackPaging
 
@@ -11,6 +16,7 @@ class SpotifyAlbum(SpotifyBase):
     """Album API endpoints."""
 
     @scopes()
+    @stored_entities(FullAlbum, "album_id", 1)
     @send_and_process(single(FullAlbum))
     def album(self, album_id: str, market: str | None = None) -> FullAlbum:
         """
@@ -50,6 +56,7 @@ class SpotifyAlbum(SpotifyBase):
         )
 
     @scopes()
+    @stored_entities(FullAlbum, "album_ids", 1, many=True)
     @chunked("album_ids", 1, 20, join_lists)
     @send_and_process(model_list(FullAlbum, "albums"))
     def albums(
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from tekore._client.base import SpotifyBase
 from tekore._client.chunked import chunked, join_lists
-from tekore._client.decor import maximise_limit, scopes, send_and_process
+from tekore._client.decor import (
+    maximise_limit,
+    scopes,
+    send_and_process,
+    stored_entities,
+)
 from tekore._client.process import model_list, single
 from tekore.model import AlbumGroup, FullArtist, FullTrack, SimpleAlbumPaging
 
@@ -11,6 +16,7 @@ class SpotifyArtist(SpotifyBase):
     """Artist API endpoints."""
 
     @scopes()
+    @stored_entities(FullArtist, "artist_id", 1)
     @send_and_process(single(FullArtist))
     def artist(self, artist_id: str) -> FullArtist:
         """
@@ -24,6 +30,7 @@ class SpotifyArtist(SpotifyBase):
         return self._get("artists/" + artist_id)
 
     @scopes()
+    @stored_entities(FullArtist, "artist_ids", 1, many=True)
     @chunked("artist_ids", 1, 50, join_lists)
     @send_and_process(model_list(FullArtist, "artists"))
     def artists(self, artist_ids: list[str]) -> list[FullArtist]:
@@ -2,7 +2,12 @@ from __future__ import annotations
 
 from tekore._client.base import SpotifyBase
 from tekore._client.chunked import chunked, join_lists
-from tekore._client.decor import maximise_limit, scopes, send_and_process
+from tekore._client.decor import (
+    maximise_limit,
+    scopes,
+    send_and_process,
+    stored_entities,
+)
 from tekore._client.process import model_list, single
 from tekore.model import FullAudiobook, SimpleChapterPaging
 
@@ -11,6 +16,7 @@ class SpotifyAudiobook(SpotifyBase):
     """Audiobook API endpoints."""
 
     @scopes()
+    @stored_entities(FullAudiobook, "audiobook_id", 1)
     @send_and_process(single(FullAudiobook))
     def audiobook(self, audiobook_id: str, market: str | None = None) -> FullAudiobook:
         """
@@ -30,6 +36,7 @@ class SpotifyAudiobook(SpotifyBase):
         return self._get("audiobooks/" + audiobook_id, market=market)
 
     @scopes()
+    @stored_entities(FullAudiobook, "audiobook_ids", 1, many=True)
     @chunked("audiobook_ids", 1, 50, join_lists)
     @send_and_process(model_list(FullAudiobook, "audiobooks"))
     def audiobooks(
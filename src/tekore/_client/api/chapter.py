@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from tekore._client.base import SpotifyBase
 from tekore._client.chunked import chunked, join_lists
-from tekore._client.decor import scopes, send_and_process
+from tekore._client.decor import scopes, send_and_process, stored_entities
 from tekore._client.process import model_list, single
 from tekore.model import FullChapter
 
@@ -11,6 +11,7 @@ class SpotifyChapter(SpotifyBase):
     """Chapter API endpoints."""
 
     @scopes()
+    @stored_entities(FullChapter, "chapter_id", 1)
     @send_and_process(single(FullChapter))
     def chapter(self, chapter_id: str, market: str | None = None) -> FullChapter:
         """
@@ -30,6 +31,7 @@ class SpotifyChapter(SpotifyBase):
         return self._get("chapters/" + chapter_id, market=market)
 
     @scopes()
+    @stored_entities(FullChapter, "chapter_ids", 1, many=True)
     @chunked("chapter_ids", 1, 50, join_lists)
     @send_and_process(model_list(FullChapter, "chapters"))
     def chapters(
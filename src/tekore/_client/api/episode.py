@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from tekore._client.base import SpotifyBase
 from tekore._client.chunked import chunked, join_lists
-from tekore._client.decor import scopes, send_and_process
+from tekore._client.decor import scopes, send_and_process, stored_entities
 from tekore._client.process import model_list, single
 from tekore.model import FullEpisode
 
@@ -11,6 +11,7 @@ class SpotifyEpisode(SpotifyBase):
     """Episode API endpoints."""
 
     @scopes()
+    @stored_entities(FullEpisode, "episode_id", 1)
     @send_and_process(single(FullEpisode))
     def episode(self, episode_id: str, market: str | None = None) -> FullEpisode:
         """
@@ -30,6 +31,7 @@ class SpotifyEpisode(SpotifyBase):
         return self._get("episodes/" + episode_id, market=market)
 
     @scopes()
+    @stored_entities(FullEpisode, "episode_ids", 1, many=True)
     @chunked("episode_ids", 1, 50, join_lists)
     @send_and_process(model_list(FullEpisode, "episodes"))
     def episodes(
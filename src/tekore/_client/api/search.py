@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from tekore._client.base import SpotifyBase
 from tekore._client.decor import maximise_limit, scopes, send_and_process
+from tekore._client.process import build, intern, raw_models
 from tekore.model import (
     FullArtistOffsetPaging,
     FullTrackPaging,
@@ -25,7 +26,9 @@ paging_type = {
 
 def search_result(json: dict):
     """Unpack search result dicts into respective paging type constructors."""
-    return tuple(paging_type[key](**json[key]) for key in json)
+    if raw_models.get():
+        return intern(tuple(json[key] for key in json))
+    return intern(tuple(build(paging_type[key], json[key]) for key in json))
 
 
 class SpotifySearch(SpotifyBase):
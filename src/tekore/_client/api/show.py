@@ -3,7 +3,12 @@ from __future__ import annotations
 from tekore._auth import scope
 from tekore._client.base import SpotifyBase
 from tekore._client.chunked import chunked, join_lists
-from tekore._client.decor import maximise_limit, scopes, send_and_process
+from tekore._client.decor import (
+    maximise_limit,
+    scopes,
+    send_and_process,
+    stored_entities,
+)
 from tekore._client.process import model_list, single
 from tekore.model import FullShow, SimpleEpisodePaging
 
@@ -12,6 +17,7 @@ class SpotifyShow(SpotifyBase):
     """Show API endpoints."""
 
     @scopes(optional=[scope.user_read_playback_position])
+    @stored_entities(FullShow, "show_id", 1)
     @send_and_process(single(FullShow))
     def show(self, show_id: str, market: str | None = None) -> FullShow:
         """
@@ -34,6 +40,7 @@ class SpotifyShow(SpotifyBase):
         return self._get("shows/" + show_id, market=market)
 
     @scopes(optional=[scope.user_read_playback_position])
+    @stored_entities(FullShow, "show_ids", 1, many=True)
     @chunked("show_ids", 1, 50, join_lists)
     @send_and_process(model_list(FullShow, "shows"))
     def shows(self, show_ids: list[str], market: str | None = None) -> list[FullShow]:
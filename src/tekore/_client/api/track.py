@@ -1,16 +1,55 @@
 from __future__ import annotations
 
+from collections.abc import AsyncGenerator, Generator
+
+from httpx import codes
+
 from tekore._client.base import SpotifyBase
 from tekore._client.chunked import chunked, join_lists
-from tekore._client.decor import scopes, send_and_process
+from tekore._client.decor import (
+    handle_errors,
+    scopes,
+    send_and_process,
+    stored_entities,
+)
 from tekore._client.process import model_list, single
-from tekore.model import AudioAnalysis, AudioFeatures, FullTrack
+from tekore._client.stream import ObjectStreamParser
+from tekore._sender import LazyResponse, Request, StreamedResponse
+from tekore.model import (
+    AudioAnalysis,
+    AudioFeatures,
+    ColumnarAudioAnalysis,
+    FullTrack,
+    Model,
+    Section,
+    Segment,
+    TimeInterval,
+)
+
+_analysis_items = {
+    "bars": TimeInterval,
+    "beats": TimeInterval,
+    "sections": Section,
+    "segments": Segment,
+    "tatums": TimeInterval,
+}
+
+
+def _analysis_item(key: str, value: dict) -> tuple[str, Model | dict]:
+    type_ = _analysis_items.get(key)
+    return key, type_(**value) if type_ is not None else value
+
+
+def _raise_for_status(request: Request, response: StreamedResponse, raw: bytes) -> None:
+    error = LazyResponse(response.url, response.headers, response.status_code, raw)
+    handle_errors(request, error)
 
 
 class SpotifyTrack(SpotifyBase):
     """Track API endpoints."""
 
     @scopes()
+    @stored_entities(FullTrack, "track_id", 1)
     @send_and_process(single(FullTrack))
     def track(self, track_id: str, market: str | None = None) -> FullTrack:
         """
@@ -26,6 +65,7 @@ class SpotifyTrack(SpotifyBase):
         return self._get("tracks/" + track_id, market=market)
 
     @scopes()
+    @stored_entities(FullTrack, "track_ids", 1, many=True)
     @chunked("track_ids", 1, 50, join_lists)
     @send_and_process(model_list(FullTrack, "tracks"))
     def tracks(
@@ -58,6 +98,82 @@ class SpotifyTrack(SpotifyBase):
         """
         return self._get("audio-analysis/" + track_id)
 
+    @scopes()
+    @send_and_process(ColumnarAudioAnalysis.from_json)
+    def track_audio_analysis_columnar(self, track_id: str) -> ColumnarAudioAnalysis:
+        """
+        Get a detailed audio analysis for a track in NumPy arrays.
+
+        .. warning::
+
+            This endpoint is unavailable to new third-party applications (:issue:`331`)
+
+        Intervals, sections and segments are read into columns
+        directly from the response without constructing a model for each item.
+        Requires :mod:`numpy`, which is an optional dependency
+        installed with ``pip install tekore[numpy]``.
+        """
+        return self._get("audio-analysis/" + track_id)
+
+    @scopes()
+    def track_audio_analysis_stream(
+        self, track_id: str
+    ) -> (
+        Generator[tuple[str, Model | dict], None, None]
+        | AsyncGenerator[tuple[str, Model | dict], None]
+    ):
+        """
+        Stream a detailed audio analysis for a track.
+
+        .. warning::
+
+            This endpoint is unavailable to new third-party applications (:issue:`331`)
+
+        Parts of the analysis are parsed and yielded as they arrive
+        instead of reading the whole analysis into memory.
+        Each part is a tuple of the name of an attribute of
+        :class:`AudioAnalysis <model.AudioAnalysis>` and its value.
+        Lists of bars, beats, sections, segments and tatums are yielded
+        one item at a time, so the same name is repeated for each item.
+        Iterate asynchronously with an asynchronous client.
+
+        The request is sent with the underlying sender directly,
+        so extending senders like :class:`CachingSender` are bypassed.
+        """
+        request = Request("GET", "audio-analysis/" + track_id)
+        if self.is_async:
+            return self._async_stream_analysis(request)
+        return self._stream_analysis(request)
+
+    def _stream_analysis(
+        self, request: Request
+    ) -> Generator[tuple[str, Model | dict], None, None]:
+        parser = ObjectStreamParser(_analysis_items)
+        with self.stream(request) as response:
+            if codes.is_error(response.status_code):
+                _raise_for_status(request, response, b"".join(response.chunks))
+
+            for chunk in response.chunks:
+                for key, value in parser.feed(chunk):
+                    yield _analysis_item(key, value)
+        for key, value in parser.close():
+            yield _analysis_item(key, value)
+
+    async def _async_stream_analysis(
+        self, request: Request
+    ) -> AsyncGenerator[tuple[str, Model | dict], None]:
+        parser = ObjectStreamParser(_analysis_items)
+        async with self.stream(request) as response:
+            if codes.is_error(response.status_code):
+                raw = b"".join([chunk async for chunk in response.chunks])
+                _raise_for_status(request, response, raw)
+
+            async for chunk in response.chunks:
+                for key, value in parser.feed(chunk):
+                    yield _analysis_item(key, value)
+        for key, value in parser.close():
+            yield _analysis_item(key, value)
+
     @scopes()
     @send_and_process(single(AudioFeatures))
     def track_audio_features(self, track_id: str) -> AudioFeatures:
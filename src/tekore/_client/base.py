@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 from collections.abc import Coroutine
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from contextvars import ContextVar
 
-from tekore._sender import Client, Request, Response, Sender
+from tekore._sender import Client, Request, Response, Sender, StreamedResponse
+from tekore.model import EntityStore, Interner
 
 prefix = "https://api.spotify.com/v1/"
 
@@ -27,6 +29,12 @@ class SpotifyBase(Client):
     _token_cv = ContextVar("_token_cv")
     _max_limits_on_cv = ContextVar("_max_limits_on_cv")
     _chunked_on_cv = ContextVar("_chunked_on_cv")
+    _chunked_concurrency_cv = ContextVar("_chunked_concurrency_cv")
+    _lazy_on_cv = ContextVar("_lazy_on_cv")
+    _raw_on_cv = ContextVar("_raw_on_cv")
+    _interner_cv = ContextVar("_interner_cv")
+    _entity_store_cv = ContextVar("_entity_store_cv")
+    _trusted_on_cv = ContextVar("_trusted_on_cv")
 
     def __init__(
         self,
@@ -35,12 +43,24 @@ class SpotifyBase(Client):
         asynchronous: bool | None = None,
         max_limits_on: bool = False,
         chunked_on: bool = False,
+        chunked_concurrency: int = 1,
+        lazy_on: bool = False,
+        raw_on: bool = False,
+        interner: Interner | None = None,
+        entity_store: EntityStore | None = None,
+        trusted_on: bool = False,
     ) -> None:
         # Docstring in the main client
         super().__init__(sender, asynchronous)
         self._token = token
         self._max_limits_on = max_limits_on
         self._chunked_on = chunked_on
+        self._chunked_concurrency = chunked_concurrency
+        self._lazy_on = lazy_on
+        self._raw_on = raw_on
+        self._interner = interner
+        self._entity_store = entity_store
+        self._trusted_on = trusted_on
 
     @property
     def token(self):
@@ -84,11 +104,101 @@ class SpotifyBase(Client):
         else:
             self._chunked_on_cv.set(value)
 
+    @property
+    def chunked_concurrency(self) -> int:
+        """Chunked concurrency getter."""
+        return self._chunked_concurrency_cv.get(self._chunked_concurrency)
+
+    @chunked_concurrency.setter
+    def chunked_concurrency(self, value: int) -> None:
+        try:
+            self._chunked_concurrency_cv.get()
+        except LookupError:
+            self._chunked_concurrency = value
+        else:
+            self._chunked_concurrency_cv.set(value)
+
+    @property
+    def lazy_on(self) -> bool:
+        """Lazy paging items getter."""
+        return self._lazy_on_cv.get(self._lazy_on)
+
+    @lazy_on.setter
+    def lazy_on(self, value: bool) -> None:
+        try:
+            self._lazy_on_cv.get()
+        except LookupError:
+            self._lazy_on = value
+        else:
+            self._lazy_on_cv.set(value)
+
+    @property
+    def raw_on(self) -> bool:
+        """Raw responses getter."""
+        return self._raw_on_cv.get(self._raw_on)
+
+    @raw_on.setter
+    def raw_on(self, value: bool) -> None:
+        try:
+            self._raw_on_cv.get()
+        except LookupError:
+            self._raw_on = value
+        else:
+            self._raw_on_cv.set(value)
+
+    @property
+    def interner(self) -> Interner | None:
+        """Interner getter."""
+        return self._interner_cv.get(self._interner)
+
+    @interner.setter
+    def interner(self, value: Interner | None) -> None:
+        try:
+            self._interner_cv.get()
+        except LookupError:
+            self._interner = value
+        else:
+            self._interner_cv.set(value)
+
+    @property
+    def entity_store(self) -> EntityStore | None:
+        """Entity store getter."""
+        return self._entity_store_cv.get(self._entity_store)
+
+    @entity_store.setter
+    def entity_store(self, value: EntityStore | None) -> None:
+        try:
+            self._entity_store_cv.get()
+        except LookupError:
+            self._entity_store = value
+        else:
+            self._entity_store_cv.set(value)
+
+    @property
+    def trusted_on(self) -> bool:
+        """Trusted responses getter."""
+        return self._trusted_on_cv.get(self._trusted_on)
+
+    @trusted_on.setter
+    def trusted_on(self, value: bool) -> None:
+        try:
+            self._trusted_on_cv.get()
+        except LookupError:
+            self._trusted_on = value
+        else:
+            self._trusted_on_cv.set(value)
+
     def __repr__(self) -> str:
         options = [
             f"token={self.token!r}",
             f"max_limits_on={self.max_limits_on}",
             f"chunked_on={self.chunked_on}",
+            f"chunked_concurrency={self.chunked_concurrency}",
+            f"lazy_on={self.lazy_on}",
+            f"raw_on={self.raw_on}",
+            f"interner={self.interner!r}",
+            f"entity_store={self.entity_store!r}",
+            f"trusted_on={self.trusted_on}",
             f"sender={self.sender!r}",
         ]
         return type(self).__name__ + "(" + ", ".join(options) + ")"
@@ -105,12 +215,25 @@ class SpotifyBase(Client):
         It may also come in handy if a bugfix or a feature is not implemented
         in a timely manner, or in debugging related to the client or Web API.
         """
+        self._prepare(request)
+        return self.sender.send(request)
+
+    def stream(
+        self, request: Request
+    ) -> (
+        AbstractContextManager[StreamedResponse]
+        | AbstractAsyncContextManager[StreamedResponse]
+    ):
+        """Build request url and headers, and stream with underlying sender."""
+        self._prepare(request)
+        return self.sender.stream(request)
+
+    def _prepare(self, request: Request) -> None:
         request.url = build_url(request.url)
         headers = self._create_headers()
         if request.headers is not None:
             headers.update(request.headers)
         request.headers = headers
-        return self.sender.send(request)
 
     @staticmethod
     def _request(
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import asyncio
 import operator
 from collections.abc import Callable, Generator
-from functools import reduce, wraps
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial, reduce, wraps
 
 from .base import SpotifyBase
 
@@ -42,6 +45,25 @@ def _replace_arg(position: int, name: str, value, args, kwargs):
     return args, kwargs
 
 
+async def _async_concurrent(calls: list[Callable], concurrency: int, process):
+    """Await calls with bounded concurrency and process results in order."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def limited(call: Callable):
+        async with semaphore:
+            return await call()
+
+    responses = await asyncio.gather(*[limited(call) for call in calls])
+    return process(list(responses))
+
+
+def _concurrent(calls: list[Callable], concurrency: int) -> list:
+    """Run calls in a thread pool in the current context, keeping order."""
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = [executor.submit(copy_context().run, call) for call in calls]
+        return [future.result() for future in futures]
+
+
 def chunked(  # noqa: C901
     arg_name: str,
     arg_pos: int,
@@ -57,6 +79,11 @@ def chunked(  # noqa: C901
 
     Optionally chain the return value of the previous request
     to the specified variable in the next request.
+    Chunks are sent concurrently according to ``chunked_concurrency``
+    of the client, unless the chunks are chained or their order
+    can be reversed, which requires sending them in order.
+    Asynchronous calls are gathered and synchronous calls are sent
+    in a thread pool, copying the current context for each chunk.
 
     Parameters
     ----------
@@ -103,6 +130,10 @@ def chunked(  # noqa: C901
 
             return process(responses)
 
+        def call_chunk(self: SpotifyBase, chunk, args, kwargs):
+            args, kwargs = replace(chunk, None, args, dict(kwargs))
+            return function(self, *args, **kwargs)
+
         @wraps(function)
         def wrapper(self: SpotifyBase, *args, **kwargs):
             arg_val = _get_arg(arg_pos, arg_name, args, kwargs)
@@ -122,6 +153,13 @@ def chunked(  # noqa: C901
 
             chunks = _chunks(arg_val, chunk_size, reverse=reverse_bool)
 
+            concurrency = self.chunked_concurrency
+            if chain is None and reverse is None and concurrency > 1:
+                calls = [partial(call_chunk, self, c, args, kwargs) for c in chunks]
+                if self.is_async:
+                    return _async_concurrent(calls, concurrency, process)
+                return process(_concurrent(calls, concurrency))
+
             if self.is_async:
                 return async_wrapper(self, chunks, chain_val, args, kwargs)
 
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Coroutine
 from functools import wraps
 
 from tekore._auth import Scope, scope
 from tekore._client.base import SpotifyBase
-from tekore._sender import Request, Response
+from tekore._client.chunked import _get_arg, _replace_arg
+from tekore._client.process import (
+    lazy_paging,
+    model_interner,
+    raw_models,
+    trusted_models,
+)
+from tekore._sender import LazyResponse, Request, Response
 from tekore._sender import send_and_process as _send_and_process
+from tekore.model import EntityStore, Interner, Model
 
 from .handle import handle_errors
 
@@ -15,17 +23,156 @@ def send_and_process(post_func: Callable) -> Callable:
     """
     Decorate a Spotify endpoint to send a request and process its content.
 
+    The processing options of the client at the time of the call
+    are passed along with the request and set during processing.
+    If ``post_func`` has a ``from_bytes`` attribute, it is called with
+    the undecoded body of unparsed :class:`LazyResponse` objects instead,
+    unless the response is processed lazily, as raw JSON or without validation.
+    Full entities of the result are recorded in the entity store of the client,
+    unless the response is raw JSON or the request has a market.
+
     Parameters
     ----------
     post_func
         function to call with response JSON content
     """
 
-    def parse_response(request: Request, response: Response):
+    def parse_response(
+        request: Request,
+        response: Response,
+        lazy: bool,
+        raw: bool,
+        interner: Interner | None,
+        store: EntityStore | None,
+        trusted: bool,
+    ):
         handle_errors(request, response)
-        return post_func(response.content)
+        lazy_token = lazy_paging.set(lazy)
+        raw_token = raw_models.set(raw)
+        interner_token = model_interner.set(interner)
+        trusted_token = trusted_models.set(trusted)
+        from_bytes = getattr(post_func, "from_bytes", None)
+        try:
+            if (
+                from_bytes is not None
+                and not (lazy or raw or trusted)
+                and isinstance(response, LazyResponse)
+                and not response.parsed
+                and response.raw
+            ):
+                result = from_bytes(response.raw)
+            else:
+                result = post_func(response.content)
+        finally:
+            trusted_models.reset(trusted_token)
+            model_interner.reset(interner_token)
+            raw_models.reset(raw_token)
+            lazy_paging.reset(lazy_token)
+
+        if store is not None and not raw and "market" not in (request.params or {}):
+            store.record(result)
+        return result
+
+    process = _send_and_process(parse_response)
+
+    def decorator(function: Callable) -> Callable:
+        @wraps(function)
+        def with_options(self: SpotifyBase, *args, **kwargs):
+            request, params = function(self, *args, **kwargs)
+            options = (
+                self.lazy_on,
+                self.raw_on,
+                self.interner,
+                self.entity_store,
+                self.trusted_on,
+            )
+            return request, (*params, *options)
+
+        return process(with_options)
+
+    return decorator
+
+
+async def _async_value(value: object) -> object:
+    return value
+
 
-    return _send_and_process(parse_response)
+async def _async_merge(response: Coroutine, merge: Callable) -> list:
+    return merge(await response)
+
+
+def _only_argument(position: int, name: str, args, kwargs) -> bool:
+    """Check that no argument other than the one specified is set."""
+    others = [*args[:position], *args[position + 1 :]]
+    others += [v for k, v in kwargs.items() if k != name]
+    return all(v is None for v in others)
+
+
+def stored_entities(
+    type_: type[Model], arg_name: str, arg_pos: int, *, many: bool = False
+) -> Callable:
+    """
+    Decorate an endpoint to return entities from the entity store of the client.
+
+    If every argument other than the IDs is ``None``, stored entities are
+    returned without a request. For lists of IDs, only the missing entities
+    are requested, and the result is returned in the order of the IDs.
+    The store is not used in raw mode.
+
+    Parameters
+    ----------
+    type_
+        type of the entities
+    arg_name
+        name of the ID argument
+    arg_pos
+        index of the ID argument in the argument list
+    many
+        the argument is a list of IDs
+    """
+    position = arg_pos - 1
+
+    def stored_one(function: Callable, self: SpotifyBase, store, args, kwargs):
+        entity = store.get(type_, _get_arg(position, arg_name, args, kwargs))
+        if entity is None:
+            return function(self, *args, **kwargs)
+        return _async_value(entity) if self.is_async else entity
+
+    def stored_many(function: Callable, self: SpotifyBase, store, args, kwargs):
+        ids = _get_arg(position, arg_name, args, kwargs)
+        stored = {i: store.get(type_, i) for i in ids}
+        missing = [i for i, entity in stored.items() if entity is None]
+
+        def merge(response: list) -> list:
+            stored.update(zip(missing, response, strict=False))
+            return [stored[i] for i in ids]
+
+        if not missing:
+            result = merge([])
+            return _async_value(result) if self.is_async else result
+
+        args, kwargs = _replace_arg(position, arg_name, missing, args, kwargs)
+        response = function(self, *args, **kwargs)
+        return _async_merge(response, merge) if self.is_async else merge(response)
+
+    def decorator(function: Callable) -> Callable:
+        stored = stored_many if many else stored_one
+
+        @wraps(function)
+        def wrapper(self: SpotifyBase, *args, **kwargs):
+            store = self.entity_store
+            if (
+                store is None
+                or self.raw_on
+                or _get_arg(position, arg_name, args, kwargs) is None
+                or not _only_argument(position, arg_name, args, kwargs)
+            ):
+                return function(self, *args, **kwargs)
+            return stored(function, self, store, args, kwargs)
+
+        return wrapper
+
+    return decorator
 
 
 def maximise_limit(max_limit: int) -> Callable:
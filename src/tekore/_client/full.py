@@ -1,6 +1,10 @@
+from __future__ import annotations
+
 from collections.abc import Generator
 from contextlib import contextmanager
 
+from tekore.model import EntityStore, Interner
+
 from .api import (
     SpotifyAlbum,
     SpotifyArtist,
@@ -60,6 +64,18 @@ class Spotify(
         use maximum limits in paging calls, overrided by endpoint arguments
     chunked_on
         use chunking when requesting lists of resources
+    chunked_concurrency
+        maximum number of chunks requested concurrently, see :meth:`chunked`
+    lazy_on
+        validate paging items on first access, see :meth:`lazy`
+    raw_on
+        return JSON instead of response models, see :meth:`raw`
+    interner
+        share identical values between responses, see :meth:`interning`
+    entity_store
+        reuse full entities of responses, see :meth:`storing_entities`
+    trusted_on
+        build response models without validation, see :meth:`trusted`
 
     Attributes
     ----------
@@ -71,10 +87,22 @@ class Spotify(
         use maximum limits in paging calls, overrided by endpoint arguments
     chunked_on
         use chunking when requesting lists of resources
+    chunked_concurrency
+        maximum number of chunks requested concurrently
+    lazy_on
+        validate paging items on first access
+    raw_on
+        return JSON instead of response models
+    interner
+        share identical values between responses
+    entity_store
+        reuse full entities of responses
+    trusted_on
+        build response models without validation
     """
 
     @contextmanager
-    def token_as(self, token) -> Generator["Spotify", None, None]:
+    def token_as(self, token) -> Generator[Spotify, None, None]:
         """
         Use a different token with requests. Context manager, async safe.
 
@@ -105,7 +133,7 @@ class Spotify(
         self._token_cv.reset(cv_token)
 
     @contextmanager
-    def max_limits(self, on: bool = True) -> Generator["Spotify", None, None]:
+    def max_limits(self, on: bool = True) -> Generator[Spotify, None, None]:
         """
         Toggle using maximum limits in paging calls. Context manager, async safe.
 
@@ -136,14 +164,27 @@ class Spotify(
         self._max_limits_on_cv.reset(cv_token)
 
     @contextmanager
-    def chunked(self, on: bool = True) -> Generator["Spotify", None, None]:
+    def chunked(
+        self, on: bool = True, concurrency: int | None = None
+    ) -> Generator[Spotify, None, None]:
         """
         Toggle chunking lists of resources. Context manager, async safe.
 
+        Chunks can be requested concurrently by setting ``concurrency``
+        above one. Asynchronous clients gather the requests, and synchronous
+        clients send them from a pool of threads sharing the same sender.
+        The results are still returned in the order of the input.
+        Endpoints whose chunks depend on each other,
+        e.g. :meth:`playlist_add` and :meth:`playlist_remove`,
+        are always requested one chunk at a time.
+
         Parameters
         ----------
         on
             enable or disable chunking
+        concurrency
+            maximum number of chunks requested concurrently,
+            if not specified the current value is used
 
         Returns
         -------
@@ -161,7 +202,222 @@ class Spotify(
             spotify = Spotify(token, chunked_on=True)
             with spotify.chunked(False):
                 tracks = spotify.search(many_ids[:50])
+
+            spotify = Spotify(token)
+            with spotify.chunked(True, concurrency=8):
+                tracks = spotify.tracks(many_ids)
         """
         cv_token = self._chunked_on_cv.set(on)
+        if concurrency is not None:
+            cc_token = self._chunked_concurrency_cv.set(concurrency)
         yield self
+        if concurrency is not None:
+            self._chunked_concurrency_cv.reset(cc_token)
         self._chunked_on_cv.reset(cv_token)
+
+    @contextmanager
+    def lazy(self, on: bool = True) -> Generator[Spotify, None, None]:
+        """
+        Toggle validating paging items lazily. Context manager, async safe.
+
+        Pagings that are returned from endpoints and paging navigation
+        keep their items as JSON in :class:`LazyItems <tekore.model.LazyItems>`
+        and validate each item only when it is first accessed.
+        Nested objects of an item, e.g. the album of a track,
+        are validated together with the item.
+        This saves time and memory when only a few items are used.
+        Pagings nested in other objects are validated immediately.
+
+        Parameters
+        ----------
+        on
+            enable or disable lazy paging items
+
+        Returns
+        -------
+        Generator[Spotify, None, None]
+            self as context
+
+        Examples
+        --------
+        .. code:: python
+
+            spotify = Spotify(token)
+            with spotify.lazy():
+                tracks = spotify.saved_tracks(limit=50)
+            first = tracks.items[0]
+
+            spotify = Spotify(token, lazy_on=True)
+            with spotify.lazy(False):
+                tracks = spotify.saved_tracks(limit=50)
+        """
+        cv_token = self._lazy_on_cv.set(on)
+        yield self
+        self._lazy_on_cv.reset(cv_token)
+
+    @contextmanager
+    def raw(self, on: bool = True) -> Generator[Spotify, None, None]:
+        """
+        Toggle returning JSON instead of models. Context manager, async safe.
+
+        Endpoints return the JSON content of responses as dictionaries
+        and lists instead of validating them into response models,
+        which is faster when the content is stored or passed on as JSON.
+        The content is unpacked as usual, so for example :meth:`search`
+        still returns a tuple of pagings.
+        Paging navigation like :meth:`next` and :meth:`all_items`
+        accepts paging JSON, and returns JSON pages and items.
+        Raw mode takes precedence over :meth:`lazy`.
+
+        Parameters
+        ----------
+        on
+            enable or disable raw responses
+
+        Returns
+        -------
+        Generator[Spotify, None, None]
+            self as context
+
+        Examples
+        --------
+        .. code:: python
+
+            spotify = Spotify(token)
+            with spotify.raw():
+                tracks = spotify.saved_tracks(limit=50)
+                ids = [item["track"]["id"] for item in spotify.all_items(tracks)]
+
+            spotify = Spotify(token, raw_on=True)
+            with spotify.raw(False):
+                track = spotify.track(track_id)
+        """
+        cv_token = self._raw_on_cv.set(on)
+        yield self
+        self._raw_on_cv.reset(cv_token)
+
+    @contextmanager
+    def trusted(self, on: bool = True) -> Generator[Spotify, None, None]:
+        """
+        Toggle building models without validation. Context manager, async safe.
+
+        Response models are built from JSON assuming that it is valid,
+        converting only nested models, timestamps and enumerations.
+        Invalid responses are not detected, and values are not coerced
+        to the types of the model.
+        The kind of playlist items is selected from their flags,
+        and identical ``track`` and ``item`` are built once.
+        With Pydantic 2, trusted construction takes roughly as long
+        as validation, and less for playlist items.
+        With Pydantic 1, models are validated regardless.
+        :meth:`raw` and :meth:`lazy` take precedence over trusted mode.
+
+        Parameters
+        ----------
+        on
+            enable or disable building models without validation
+
+        Returns
+        -------
+        Generator[Spotify, None, None]
+            self as context
+
+        Examples
+        --------
+        .. code:: python
+
+            spotify = Spotify(token)
+            with spotify.trusted():
+                items = spotify.playlist_items(playlist_id)
+
+            spotify = Spotify(token, trusted_on=True)
+            with spotify.trusted(False):
+                track = spotify.track(track_id)
+        """
+        cv_token = self._trusted_on_cv.set(on)
+        yield self
+        self._trusted_on_cv.reset(cv_token)
+
+    @contextmanager
+    def interning(self, interner: Interner | None) -> Generator[Spotify, None, None]:
+        """
+        Share identical values in responses. Context manager, async safe.
+
+        Responses are interned with :class:`Interner <tekore.model.Interner>`
+        after they are validated into models, or as JSON in :meth:`raw` mode.
+        Repeated strings, lists and objects are then kept in memory only once
+        within a response, or across all responses using the same interner.
+
+        Parameters
+        ----------
+        interner
+            interner to use, or ``None`` to disable interning
+
+        Returns
+        -------
+        Generator[Spotify, None, None]
+            self as context
+
+        Examples
+        --------
+        .. code:: python
+
+            from tekore.model import Interner
+
+            spotify = Spotify(token)
+            with spotify.interning(Interner()):
+                tracks = spotify.album_tracks(album_id, limit=50)
+
+            spotify = Spotify(token, interner=Interner())
+            with spotify.interning(None):
+                track = spotify.track(track_id)
+        """
+        cv_token = self._interner_cv.set(interner)
+        yield self
+        self._interner_cv.reset(cv_token)
+
+    @contextmanager
+    def storing_entities(
+        self, store: EntityStore | None
+    ) -> Generator[Spotify, None, None]:
+        """
+        Reuse full entities of responses. Context manager, async safe.
+
+        Full albums, artists, audiobooks, chapters, episodes, shows and tracks
+        in responses are recorded in :class:`EntityStore
+        <tekore.model.EntityStore>` by their ID.
+        Endpoints retrieving these entities by ID return stored entities
+        without sending a request, and batch endpoints only request
+        the entities that are missing from the store.
+        Calls with a market or other arguments besides the IDs are always sent,
+        and responses to requests with a market are not recorded.
+        Stored entities are not used in :meth:`raw` mode.
+
+        Parameters
+        ----------
+        store
+            entity store to use, or ``None`` to disable storing entities
+
+        Returns
+        -------
+        Generator[Spotify, None, None]
+            self as context
+
+        Examples
+        --------
+        .. code:: python
+
+            from tekore.model import EntityStore
+
+            spotify = Spotify(token)
+            with spotify.storing_entities(EntityStore(ttl=600)):
+                artists = spotify.artists([id_a, id_b, id_c])
+                artist = spotify.artist(id_b)  # no request
+
+            spotify = Spotify(token, entity_store=EntityStore())
+            with spotify.storing_entities(None):
+                track = spotify.track(track_id)
+        """
+        cv_token = self._entity_store_cv.set(store)
+        yield self
+        self._entity_store_cv.reset(cv_token)
@@ -1,7 +1,15 @@
 from __future__ import annotations
 
-from collections.abc import Generator
-
+import asyncio
+from collections import deque
+from collections.abc import Coroutine, Generator, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from itertools import islice
+from typing import Any
+from urllib.parse import parse_qsl, quote, urlencode, urlsplit, urlunsplit
+
+from tekore._model.trusted import construct_trusted
 from tekore._sender import BadRequest
 from tekore.model import Model, OffsetPaging, Paging
 
@@ -19,6 +27,37 @@ def parse_paging_result(result: dict) -> dict:
     return result
 
 
+def offset_url(url: str, offset: int) -> str:
+    """Replace the offset query parameter of a paging URL."""
+    parts = urlsplit(url)
+    query = dict(parse_qsl(parts.query, keep_blank_values=True))
+    query["offset"] = str(offset)
+    return urlunsplit(parts._replace(query=urlencode(query, quote_via=quote)))
+
+
+def field(page: Paging | dict, name: str) -> Any:
+    """Get a field of a paging model or raw paging JSON."""
+    return page[name] if isinstance(page, dict) else getattr(page, name)
+
+
+def is_offset_paging(page: Paging | dict) -> bool:
+    """Determine whether a paging model or raw paging JSON is offset-based."""
+    return (
+        "offset" in page if isinstance(page, dict) else isinstance(page, OffsetPaging)
+    )
+
+
+def remaining_offset_urls(page: Paging | dict) -> Iterator[str]:
+    """Generate URLs of the pages after an offset paging."""
+    next_ = field(page, "next")
+    if next_ is None or not is_offset_paging(page) or field(page, "limit") < 1:
+        return iter(())
+
+    limit = field(page, "limit")
+    offsets = range(field(page, "offset") + limit, field(page, "total"), limit)
+    return (offset_url(next_, offset) for offset in offsets)
+
+
 class SpotifyPaging(SpotifyBase):
     """Paging navigation endpoints."""
 
@@ -43,22 +82,43 @@ class SpotifyPaging(SpotifyBase):
         if self.is_async:
             return self._async_next(page)
 
-        if page.next is None:
+        if field(page, "next") is None:
             return None
 
-        try:
-            next_set = self._get_paging_result(page.next)
-            return type(page)(**next_set)
-        except BadRequest:
-            return None
+        return self._page_at(page, field(page, "next"))
 
     async def _async_next(self, page: Paging) -> Paging | None:
-        if page.next is None:
+        if field(page, "next") is None:
             return None
 
+        return await self._async_page_at(page, field(page, "next"))
+
+    def _create_paging(self, type_: type[Paging | dict], json: dict) -> Paging | dict:
+        if issubclass(type_, dict):
+            page = json
+        else:
+            if self.lazy_on:
+                page = type_.lazy_validate(json)
+            elif self.trusted_on:
+                page = construct_trusted(type_, json)
+            else:
+                page = type_(**json)
+            store = self.entity_store
+            if store is not None and "market=" not in (json.get("href") or ""):
+                store.record(page)
+        return page if self.interner is None else self.interner.intern(page)
+
+    def _page_at(self, page: Paging, url: str) -> Paging | None:
         try:
-            next_set = await self._get_paging_result(page.next)
-            return type(page)(**next_set)
+            result = self._get_paging_result(url)
+            return self._create_paging(type(page), result)
+        except BadRequest:
+            return None
+
+    async def _async_page_at(self, page: Paging, url: str) -> Paging | None:
+        try:
+            result = await self._get_paging_result(url)
+            return self._create_paging(type(page), result)
         except BadRequest:
             return None
 
@@ -79,30 +139,41 @@ class SpotifyPaging(SpotifyBase):
         if self.is_async:
             return self._async_previous(page)
 
-        if page.previous is None:
+        if field(page, "previous") is None:
             return None
 
-        previous_set = self._get_paging_result(page.previous)
-        return type(page)(**previous_set)
+        previous_set = self._get_paging_result(field(page, "previous"))
+        return self._create_paging(type(page), previous_set)
 
     async def _async_previous(self, page: OffsetPaging) -> OffsetPaging | None:
-        if page.previous is None:
+        if field(page, "previous") is None:
             return None
 
-        previous_set = await self._get_paging_result(page.previous)
-        return type(page)(**previous_set)
+        previous_set = await self._get_paging_result(field(page, "previous"))
+        return self._create_paging(type(page), previous_set)
 
-    def all_pages(self, page: Paging) -> Generator[Paging, None, None]:
+    def all_pages(
+        self, page: Paging, prefetch: int = 0
+    ) -> Generator[Paging, None, None]:
         """
         Retrieve all pages of a paging.
 
         Request and yield new (next) pages until the end of the paging.
         The paging that was given as an argument is yielded as the first result.
 
+        Pages can be requested ahead of time while the previous ones
+        are being processed by specifying ``prefetch``.
+        Offset pagings calculate the addresses of the remaining pages
+        from their total, so that many pages are requested concurrently.
+        Cursor pagings can only be read one page ahead.
+        Synchronous clients request pages in a pool of threads.
+
         Parameters
         ----------
         page
             paging object
+        prefetch
+            maximum number of pages to request ahead of time
 
         Returns
         -------
@@ -110,7 +181,11 @@ class SpotifyPaging(SpotifyBase):
             all pages within a paging
         """
         if self.is_async:
+            if prefetch > 0:
+                return self._async_prefetch_pages(page, prefetch)
             return self._async_all_pages(page)
+        if prefetch > 0:
+            return self._sync_prefetch_pages(page, prefetch)
         return self._sync_all_pages(page)
 
     def _sync_all_pages(self, page: Paging):
@@ -125,17 +200,84 @@ class SpotifyPaging(SpotifyBase):
             yield current
             current = await self._async_next(current)
 
-    def all_items(self, page: Paging) -> Generator[Model, None, None]:
+    def _sync_prefetch_pages(self, page: Paging, prefetch: int):
+        executor = ThreadPoolExecutor(max_workers=prefetch)
+
+        def submit(func, *args):
+            return executor.submit(copy_context().run, func, *args)
+
+        futures: deque = deque()
+        urls: Iterator[str] = iter(())
+        current = page
+        try:
+            while True:
+                has_next = field(current, "next") is not None
+                if has_next and not futures:
+                    urls = remaining_offset_urls(current)
+                    futures.extend(
+                        submit(self._page_at, page, u) for u in islice(urls, prefetch)
+                    )
+                    if not futures:
+                        futures.append(submit(self.next, current))
+
+                yield current
+                if not has_next:
+                    break
+
+                current = futures.popleft().result()
+                if current is None:
+                    break
+                futures.extend(submit(self._page_at, page, u) for u in islice(urls, 1))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _async_prefetch_pages(self, page: Paging, prefetch: int):
+        tasks: deque[asyncio.Future] = deque()
+        urls: Iterator[str] = iter(())
+        current = page
+        try:
+            while True:
+                has_next = field(current, "next") is not None
+                if has_next and not tasks:
+                    urls = remaining_offset_urls(current)
+                    tasks.extend(
+                        asyncio.ensure_future(self._async_page_at(page, u))
+                        for u in islice(urls, prefetch)
+                    )
+                    if not tasks:
+                        tasks.append(asyncio.ensure_future(self._async_next(current)))
+
+                yield current
+                if not has_next:
+                    break
+
+                current = await tasks.popleft()
+                if current is None:
+                    break
+                tasks.extend(
+                    asyncio.ensure_future(self._async_page_at(page, u))
+                    for u in islice(urls, 1)
+                )
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    def all_items(
+        self, page: Paging, prefetch: int = 0
+    ) -> Generator[Model, None, None]:
         """
         Retrieve all items from all pages of a paging.
 
         Request and yield new (next) items until the end of the paging.
         The items in the paging that was given as an argument are yielded first.
+        See :meth:`all_pages` for requesting pages ahead of time.
 
         Parameters
         ----------
         page
             paging object
+        prefetch
+            maximum number of pages to request ahead of time
 
         Returns
         -------
@@ -143,14 +285,51 @@ class SpotifyPaging(SpotifyBase):
             all items within a paging
         """
         if self.is_async:
-            return self._async_all_items(page)
-        return self._sync_all_items(page)
+            return self._async_all_items(page, prefetch)
+        return self._sync_all_items(page, prefetch)
 
-    def _sync_all_items(self, paging: Paging):
-        for page in self.all_pages(paging):
-            yield from page.items
+    def _sync_all_items(self, paging: Paging, prefetch: int = 0):
+        for page in self.all_pages(paging, prefetch):
+            yield from field(page, "items")
 
-    async def _async_all_items(self, paging: Paging):
-        async for page in self._async_all_pages(paging):
-            for item in page.items:
+    async def _async_all_items(self, paging: Paging, prefetch: int = 0):
+        async for page in self.all_pages(paging, prefetch):
+            for item in field(page, "items"):
                 yield item
+
+    def all_items_parallel(
+        self, page: Paging, concurrency: int = 8
+    ) -> list[Model] | Coroutine[None, None, list[Model]]:
+        """
+        Retrieve all items from all pages of a paging concurrently.
+
+        The addresses of the remaining pages of an offset paging
+        are calculated from the first page, and requested concurrently.
+        The items are returned in order as a list once all pages are retrieved.
+        If the total number of items grows while retrieving the pages,
+        the new pages are requested as well. If it shrinks,
+        retrieval stops at the new last page.
+        Cursor pagings can only be requested one page at a time.
+        See also :meth:`all_items` with ``prefetch``.
+
+        Parameters
+        ----------
+        page
+            paging object
+        concurrency
+            maximum number of pages requested at once
+
+        Returns
+        -------
+        list[Model]
+            all items within a paging
+        """
+        if self.is_async:
+            return self._async_all_items_parallel(page, concurrency)
+
+        pages = self._sync_prefetch_pages(page, concurrency)
+        return [item for p in pages for item in field(p, "items")]
+
+    async def _async_all_items_parallel(self, page: Paging, concurrency: int):
+        pages = self._async_prefetch_pages(page, concurrency)
+        return [item async for p in pages for item in field(p, "items")]
@@ -1,8 +1,81 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from contextvars import ContextVar
+from functools import cache
 
-from tekore.model import Model
+from pydantic import VERSION as PYDANTIC_VERSION
+
+from tekore._model.trusted import construct_trusted
+from tekore.model import Interner, Model, Paging
+
+lazy_paging = ContextVar("lazy_paging", default=False)
+raw_models = ContextVar("raw_models", default=False)
+model_interner: ContextVar[Interner | None] = ContextVar("model_interner", default=None)
+trusted_models = ContextVar("trusted_models", default=False)
+
+
+def intern(value: object) -> object:
+    """Intern value with ``model_interner`` if it is set."""
+    interner = model_interner.get()
+    return value if interner is None else interner.intern(value)
+
+
+def build(type_: type[Model], json: dict) -> Model:
+    """Build model, without validation if ``trusted_models`` is set."""
+    if trusted_models.get():
+        return construct_trusted(type_, json)
+    return type_(**json)
+
+
+if PYDANTIC_VERSION.startswith("1."):
+    validates_json = False
+
+    def validate_list(type_: type[Model], json: list) -> list[Model | None]:
+        """Construct models from a list of dicts, keeping Nones."""
+        return [type_(**i) if i is not None else None for i in json]
+
+else:
+    from pydantic import TypeAdapter, create_model
+
+    validates_json = True
+
+    @cache
+    def _list_adapter(type_: type[Model]) -> TypeAdapter:
+        return TypeAdapter(list[type_ | None])
+
+    def validate_list(type_: type[Model], json: list) -> list[Model | None]:
+        """
+        Construct models from a list of dicts, keeping Nones.
+
+        The list is validated in one call with a cached adapter.
+        """
+        return _list_adapter(type_).validate_python(json)
+
+    @cache
+    def _json_adapter(
+        type_: type[Model], from_item: str | None, many: bool
+    ) -> TypeAdapter:
+        content = list[type_ | None] if many else type_ | None
+        if from_item is not None:
+            content = create_model(
+                f"{type_.__name__}Content", **{from_item: (content, ...)}
+            )
+        return TypeAdapter(content)
+
+    def validate_json(
+        type_: type[Model], raw: bytes, from_item: str | None, many: bool = False
+    ) -> Model | list[Model | None] | None:
+        """
+        Construct models directly from response bytes.
+
+        No intermediate dictionaries are created,
+        and other items next to ``from_item`` are skipped.
+        """
+        content = _json_adapter(type_, from_item, many).validate_json(raw)
+        if from_item is None:
+            return content
+        return getattr(content, from_item)
 
 
 def nothing(json: dict) -> dict:
@@ -24,22 +97,57 @@ def single(type_: type[Model], from_item: str | None = None) -> Callable:
     Unpack dict or items in ``from_item`` into single constructor.
 
     If dict or ``from_item`` is None - does nothing and returns None.
+    With Pydantic 2, ``from_bytes`` of the processor validates response bytes.
+    Pagings are created with lazy items if ``lazy_paging`` is set,
+    and JSON is returned as is if ``raw_models`` is set.
+    Models are built without validation if ``trusted_models`` is set.
+    The result is interned if ``model_interner`` is set.
     """
+    lazy = issubclass(type_, Paging)
 
-    def post_func(json: dict) -> Model | None:
+    def post_func(json: dict) -> Model | dict | None:
         json = json if from_item is None else json[from_item]
-        return type_(**json) if json is not None else None
+        if json is None:
+            return None
+        if raw_models.get():
+            return intern(json)
+        if lazy and lazy_paging.get():
+            return intern(type_.lazy_validate(json))
+        return intern(build(type_, json))
+
+    if validates_json:
+
+        def from_bytes(raw: bytes) -> Model | None:
+            return intern(validate_json(type_, raw, from_item))
 
+        post_func.from_bytes = from_bytes
     return post_func
 
 
 def model_list(type_: type[Model], from_item: str | None = None) -> Callable:
-    """Unpack items inside ``from_item`` of dict into constructors."""
+    """
+    Unpack items inside ``from_item`` of dict into constructors.
 
-    def post_func(json: dict) -> list[Model | None]:
+    With Pydantic 2, ``from_bytes`` of the processor validates response bytes.
+    JSON is returned as is if ``raw_models`` is set.
+    Models are built without validation if ``trusted_models`` is set.
+    The result is interned if ``model_interner`` is set.
+    """
+
+    def post_func(json: dict) -> list[Model | dict | None]:
         json = json if from_item is None else json[from_item]
-        return [type_(**i) if i is not None else None for i in json]
+        if raw_models.get():
+            return intern(json)
+        if trusted_models.get():
+            return intern([None if i is None else build(type_, i) for i in json])
+        return intern(validate_list(type_, json))
+
+    if validates_json:
+
+        def from_bytes(raw: bytes) -> list[Model | None]:
+            return intern(validate_json(type_, raw, from_item, many=True))
 
+        post_func.from_bytes = from_bytes
     return post_func
 
 
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from collections.abc import Iterable, Iterator
+
+_whitespace = " \t\n\r"
+_number_tail = re.compile(r"[0-9.eE+-]*\Z")
+
+
+class ObjectStreamParser:
+    """
+    Incrementally parse the members of a JSON object.
+
+    Data is fed to the parser in chunks, and members are returned
+    as soon as they have been received completely.
+    Arrays of streamed members are returned item by item,
+    so that only one item of them needs to be held in memory.
+
+    Parameters
+    ----------
+    streamed
+        keys of arrays that are returned item by item
+    """
+
+    def __init__(self, streamed: Iterable[str] = ()) -> None:
+        self.streamed = set(streamed)
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = self._start
+        self._key = ""
+        self._final = False
+
+    def feed(self, data: bytes) -> list[tuple[str, object]]:
+        """
+        Parse a chunk of data.
+
+        Parameters
+        ----------
+        data
+            next chunk of the UTF-8 encoded document
+
+        Returns
+        -------
+        list[tuple[str, object]]
+            key and value of completed members or items of streamed arrays
+        """
+        self._extend(self._decoder.decode(data))
+        return list(self._parse())
+
+    def close(self) -> list[tuple[str, object]]:
+        """
+        Parse the rest of the data.
+
+        Returns
+        -------
+        list[tuple[str, object]]
+            key and value of completed members or items of streamed arrays
+
+        Raises
+        ------
+        ValueError
+            if the document is incomplete or invalid
+        """
+        self._final = True
+        self._extend(self._decoder.decode(b"", final=True))
+        items = list(self._parse())
+        if self._state != self._end:
+            msg = "Incomplete JSON document!"
+            raise ValueError(msg)
+        return items
+
+    def _extend(self, text: str) -> None:
+        self._buffer = self._buffer[self._pos :] + text
+        self._pos = 0
+
+    def _parse(self) -> Iterator[tuple[str, object]]:
+        while True:
+            self._skip_whitespace()
+            if self._pos >= len(self._buffer):
+                return
+            state = self._state
+            result = state()
+            if self._state == state and result is None:
+                return
+            if result is not None:
+                yield result
+            if self._state == self._end:
+                return
+
+    def _skip_whitespace(self) -> None:
+        buffer = self._buffer
+        while self._pos < len(buffer) and buffer[self._pos] in _whitespace:
+            self._pos += 1
+
+    def _expect(self, chars: str) -> str:
+        char = self._buffer[self._pos]
+        if char not in chars:
+            msg = f"Expected one of {chars!r}, got {char!r} at {self._pos}!"
+            raise ValueError(msg)
+        self._pos += 1
+        return char
+
+    def _decode(self) -> tuple[bool, object]:
+        """Decode a complete value at the current position if possible."""
+        try:
+            value, end = self._json.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            return False, None
+
+        # A trailing number or literal may be continued in the next chunk,
+        # also when a partial number like "1." was decoded as a shorter one
+        if not self._final and _number_tail.match(self._buffer, end):
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _start(self) -> None:
+        self._expect("{")
+        self._state = self._first_key
+
+    def _first_key(self) -> None:
+        if self._buffer[self._pos] == "}":
+            self._pos += 1
+            self._state = self._end
+            return
+        self._state = self._member_key
+
+    def _member_key(self) -> None:
+        if self._buffer[self._pos] != '"':
+            msg = f"Expected a string key at {self._pos}!"
+            raise ValueError(msg)
+        done, key = self._decode()
+        if not done:
+            return
+        self._key = key
+        self._state = self._colon
+
+    def _colon(self) -> None:
+        self._expect(":")
+        self._state = self._member_value
+
+    def _member_value(self) -> tuple[str, object] | None:
+        if self._key in self.streamed and self._buffer[self._pos] == "[":
+            self._pos += 1
+            self._state = self._first_item
+            return None
+
+        done, value = self._decode()
+        if not done:
+            return None
+        self._state = self._member_end
+        return self._key, value
+
+    def _member_end(self) -> None:
+        char = self._expect(",}")
+        self._state = self._member_key if char == "," else self._end
+
+    def _first_item(self) -> None:
+        if self._buffer[self._pos] == "]":
+            self._pos += 1
+            self._state = self._member_end
+            return
+        self._state = self._item
+
+    def _item(self) -> tuple[str, object] | None:
+        done, value = self._decode()
+        if not done:
+            return None
+        self._state = self._item_end
+        return self._key, value
+
+    def _item_end(self) -> None:
+        char = self._expect(",]")
+        self._state = self._item if char == "," else self._member_end
+
+    def _end(self) -> None:
+        msg = "Unexpected data after the end of the document!"
+        raise ValueError(msg)
@@ -7,7 +7,16 @@ from .artist import (
     FullArtistOffsetPaging,
     SimpleArtist,
 )
-from .audio_analysis import AudioAnalysis, Section, Segment, TimeInterval
+from .audio_analysis import (
+    AudioAnalysis,
+    ColumnarAudioAnalysis,
+    IntervalColumns,
+    Section,
+    SectionColumns,
+    Segment,
+    SegmentColumns,
+    TimeInterval,
+)
 from .audio_features import AudioFeatures
 from .audiobook import (
     Audiobook,
@@ -21,6 +30,7 @@ from .base import Identifiable, Item
 from .category import Category, CategoryPaging
 from .chapter import Chapter, SimpleChapter, SimpleChapterPaging
 from .chapter.full import FullChapter
+from .compact import compact, compact_type
 from .context import Context, ContextType
 from .currently_playing import (
     Actions,
@@ -32,6 +42,7 @@ from .currently_playing import (
     RepeatState,
 )
 from .device import Device, DeviceType
+from .entity import EntityStore
 from .episode import (
     Episode,
     FullEpisode,
@@ -41,6 +52,7 @@ from .episode import (
     SimpleEpisodePaging,
 )
 from .error import PlayerErrorReason
+from .intern import Interner
 from .local import LocalAlbum, LocalArtist, LocalItem, LocalTrack
 from .member import (
     Copyright,
@@ -50,7 +62,7 @@ from .member import (
     Restrictions,
     ResumePoint,
 )
-from .paging import Cursor, CursorPaging, OffsetPaging, Paging
+from .paging import Cursor, CursorPaging, LazyItems, OffsetPaging, Paging
 from .play_history import PlayHistory, PlayHistoryCursor, PlayHistoryPaging
 from .playlist import (
     FullPlaylist,
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
+from dataclasses import dataclass, fields
+from math import nan
+from typing import TYPE_CHECKING
+
 from .serialise import Model
 
+if TYPE_CHECKING:
+    from numpy import ndarray
+
 
 class TimeInterval(Model):
     """
@@ -71,3 +78,142 @@ class AudioAnalysis(Model):
     tatums: list[TimeInterval]
     meta: dict
     track: dict
+
+
+def _import_numpy():
+    try:
+        import numpy as np  # noqa: PLC0415
+    except ImportError as e:
+        msg = (
+            "NumPy is required for columnar audio analyses! "
+            "Install it with `pip install tekore[numpy]`."
+        )
+        raise ImportError(msg) from e
+    return np
+
+
+def _columns(cls: type, items: list[dict]) -> object:
+    """Build columns of ``cls`` from items, missing values are NaN."""
+    np = _import_numpy()
+    columns = {}
+    for field in fields(cls):
+        name = field.name
+        if name in {"pitches", "timbre"}:
+            matrix = np.full((len(items), 12), nan, dtype=np.float32)
+            for row, item in enumerate(items):
+                vector = item.get(name, None)
+                if vector is not None:
+                    matrix[row] = vector
+            columns[name] = matrix
+            continue
+
+        values = (item.get(name, None) for item in items)
+        columns[name] = np.fromiter(
+            (nan if v is None else v for v in values),
+            dtype=np.float64,
+            count=len(items),
+        )
+    return cls(**columns)
+
+
+@dataclass
+class IntervalColumns:
+    """
+    Time intervals of an analysis as columns.
+
+    Each attribute is a 1-D :class:`numpy.ndarray`,
+    where missing values are NaN.
+    """
+
+    start: ndarray
+    duration: ndarray
+    confidence: ndarray
+
+
+@dataclass
+class SectionColumns:
+    """
+    Sections of an analysis as columns.
+
+    Each attribute is a 1-D :class:`numpy.ndarray`,
+    where missing values are NaN.
+    """
+
+    start: ndarray
+    duration: ndarray
+    confidence: ndarray
+    loudness: ndarray
+    tempo: ndarray
+    tempo_confidence: ndarray
+    key: ndarray
+    key_confidence: ndarray
+    mode: ndarray
+    mode_confidence: ndarray
+    time_signature: ndarray
+    time_signature_confidence: ndarray
+
+
+@dataclass
+class SegmentColumns:
+    """
+    Segments of an analysis as columns.
+
+    Pitches and timbre are ``(n, 12)`` float32 matrices.
+    Other attributes are 1-D :class:`numpy.ndarray`,
+    where missing values are NaN.
+    """
+
+    start: ndarray
+    duration: ndarray
+    confidence: ndarray
+    loudness_start: ndarray
+    loudness_max: ndarray
+    loudness_max_time: ndarray
+    loudness_end: ndarray
+    pitches: ndarray
+    timbre: ndarray
+
+
+@dataclass
+class ColumnarAudioAnalysis:
+    """
+    Track audio analysis stored in NumPy arrays.
+
+    Intervals, sections and segments are stored as columns
+    instead of lists of models, which saves memory
+    and is convenient for numerical processing.
+    Requires :mod:`numpy`, which is an optional dependency.
+    """
+
+    bars: IntervalColumns
+    beats: IntervalColumns
+    sections: SectionColumns
+    segments: SegmentColumns
+    tatums: IntervalColumns
+    meta: dict
+    track: dict
+
+    @classmethod
+    def from_json(cls, json: dict) -> ColumnarAudioAnalysis:
+        """
+        Build columns directly from an audio analysis response.
+
+        Parameters
+        ----------
+        json
+            audio analysis as returned by the Web API
+
+        Returns
+        -------
+        ColumnarAudioAnalysis
+            columnar analysis
+        """
+        return cls(
+            bars=_columns(IntervalColumns, json["bars"]),
+            beats=_columns(IntervalColumns, json["beats"]),
+            sections=_columns(SectionColumns, json["sections"]),
+            segments=_columns(SegmentColumns, json["segments"]),
+            tatums=_columns(IntervalColumns, json["tatums"]),
+            meta=json["meta"],
+            track=json["track"],
+        )
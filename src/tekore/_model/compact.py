@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from dataclasses import make_dataclass
+from functools import cache
+from typing import Any
+
+from pydantic import VERSION as PYDANTIC_VERSION
+
+from .paging import LazyItems
+from .serialise import Model
+
+
+def _field_names(model: type[Model]) -> list[str]:
+    if PYDANTIC_VERSION.startswith("1."):
+        return list(model.__fields__)
+    return list(model.model_fields)
+
+
+def _rebuild(model: type[Model], values: tuple) -> object:
+    return compact_type(model)(*values)
+
+
+def _reduce(self) -> tuple:
+    fields = self.__dataclass_fields__
+    return _rebuild, (self.__model__, tuple(getattr(self, f) for f in fields))
+
+
+@cache
+def compact_type(model: type[Model]) -> type:
+    """
+    Get the compact counterpart of a model.
+
+    Compact types are slotted dataclasses with the same fields as the model.
+    They have no per-instance dictionary or validation state,
+    so they use a fraction of the memory of models.
+    The type is created on first use and reused after that.
+
+    Parameters
+    ----------
+    model
+        model type
+
+    Returns
+    -------
+    type
+        dataclass named after the model with a ``Compact`` prefix
+    """
+    return make_dataclass(
+        "Compact" + model.__name__,
+        [(name, Any) for name in _field_names(model)],
+        namespace={
+            "__model__": model,
+            "__module__": "tekore.model",
+            "__reduce__": _reduce,
+        },
+        slots=True,
+    )
+
+
+def compact(value: Any) -> Any:
+    """
+    Convert models to their compact counterparts.
+
+    Models nested in the value, also within lists and paging items,
+    are converted as well.
+    Other values are returned as is, so the compact instances
+    share their strings and dictionaries with the original models.
+    Properties and methods of models are not available in compact types.
+
+    Parameters
+    ----------
+    value
+        model, list of models or other value
+
+    Returns
+    -------
+    Any
+        value with models replaced by instances of :func:`compact_type`
+
+    Examples
+    --------
+    .. code:: python
+
+        from tekore.model import compact
+
+        tracks = spotify.saved_tracks(limit=50)
+        artists = [compact(t.track.artists) for t in tracks.items]
+    """
+    if isinstance(value, Model):
+        type_ = compact_type(type(value))
+        fields = type_.__dataclass_fields__
+        return type_(*(compact(getattr(value, name)) for name in fields))
+    if isinstance(value, (list, LazyItems)):
+        return [compact(item) for item in value]
+    return value
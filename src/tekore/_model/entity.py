@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import TypeVar
+
+from .album.full import FullAlbum
+from .artist import FullArtist
+from .audiobook.full import FullAudiobook
+from .chapter.full import FullChapter
+from .episode import FullEpisode
+from .serialise import Model
+from .show.full import FullShow
+from .track import FullTrack
+
+Entity = TypeVar("Entity", bound=Model)
+
+_entity_types = (
+    FullAlbum,
+    FullArtist,
+    FullAudiobook,
+    FullChapter,
+    FullEpisode,
+    FullShow,
+    FullTrack,
+)
+
+
+class EntityStore:
+    """
+    Store full entities by their ID.
+
+    Albums, artists, audiobooks, chapters, episodes, shows and tracks
+    are recorded wherever they appear in a response,
+    for example the tracks of saved tracks or search results.
+    Entities are stored by their exact type,
+    so playlist tracks are not used as tracks.
+
+    Parameters
+    ----------
+    ttl
+        seconds to keep entities, ``None`` to keep them until evicted
+    max_size
+        maximum number of entities stored,
+        the least recently used entities are evicted first
+    """
+
+    def __init__(self, ttl: float | None = 3600, max_size: int | None = None) -> None:
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entities: OrderedDict[tuple[type, str], tuple[Model, float | None]] = (
+            OrderedDict()
+        )
+        self._lock = Lock()
+
+    def __repr__(self) -> str:
+        options = [f"ttl={self.ttl}", f"max_size={self.max_size}"]
+        return f"{type(self).__name__}({', '.join(options)})"
+
+    def __len__(self) -> int:
+        """Return the number of stored entities, including expired ones."""
+        return len(self._entities)
+
+    def clear(self) -> None:
+        """Discard all stored entities."""
+        with self._lock:
+            self._entities.clear()
+
+    def get(self, type_: type[Entity], id_: str) -> Entity | None:
+        """
+        Get a stored entity.
+
+        Parameters
+        ----------
+        type_
+            type of the entity
+        id_
+            entity ID
+
+        Returns
+        -------
+        Model | None
+            the entity, or ``None`` if it is not stored or has expired
+        """
+        key = (type_, id_)
+        with self._lock:
+            item = self._entities.get(key, None)
+            if item is None:
+                return None
+            entity, expires_at = item
+            if expires_at is not None and expires_at <= time.time():
+                del self._entities[key]
+                return None
+            self._entities.move_to_end(key)
+            return entity
+
+    def put(self, entity: Model) -> None:
+        """
+        Store an entity by its type and ID.
+
+        Parameters
+        ----------
+        entity
+            full entity to store
+        """
+        expires_at = None if self.ttl is None else time.time() + self.ttl
+        key = (type(entity), entity.id)
+        with self._lock:
+            self._entities[key] = (entity, expires_at)
+            self._entities.move_to_end(key)
+            while self.max_size is not None and len(self._entities) > self.max_size:
+                self._entities.popitem(last=False)
+
+    def record(self, value: object) -> None:
+        """
+        Store the full entities contained in a value.
+
+        Models, lists and tuples are searched recursively.
+        Lazily validated paging items are not searched.
+
+        Parameters
+        ----------
+        value
+            model, list or tuple of models or other value
+        """
+        if isinstance(value, (list, tuple)):
+            for item in value:
+                self.record(item)
+        elif isinstance(value, Model):
+            if type(value) in _entity_types and getattr(value, "id", None):
+                self.put(value)
+            for item in value.__dict__.values():
+                if isinstance(item, (Model, list, tuple)):
+                    self.record(item)
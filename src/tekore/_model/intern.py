@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from collections.abc import Hashable
+from typing import Any
+
+from .serialise import Model
+
+_containers = (Model, list, tuple, dict)
+
+
+def _key(value: object) -> Hashable:
+    """Key of an interned value, identity for containers."""
+    if type(value) is str:
+        return value
+    if isinstance(value, _containers):
+        return id(value)
+    try:
+        hash(value)
+    except TypeError:
+        return id(value)
+    return type(value), value
+
+
+class Interner:
+    """
+    Share identical values between models.
+
+    Strings, lists, dictionaries and models are replaced with
+    a shared instance if an identical value has been interned before.
+    For example the repeated album, artists and available markets
+    of tracks are only kept in memory once.
+    Values are shared for the lifetime of the interner,
+    so an interner can be used for a single response or a whole session.
+    The shared values are kept in the interner until it is cleared.
+
+    Shared models and lists should not be modified,
+    because the modification would be visible in every place they are used.
+    Lazily validated paging items are not interned.
+    """
+
+    def __init__(self) -> None:
+        self._values: dict[Hashable, Any] = {}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(<{len(self)} values>)"
+
+    def __len__(self) -> int:
+        """Return the number of interned values."""
+        return len(self._values)
+
+    def clear(self) -> None:
+        """Discard all interned values."""
+        self._values.clear()
+
+    def intern(self, value: Any) -> Any:
+        """
+        Intern a value and its contents.
+
+        Models, lists and dictionaries are modified in place
+        to contain the shared instances of their items.
+
+        Parameters
+        ----------
+        value
+            model or JSON value
+
+        Returns
+        -------
+        Any
+            shared instance of the value
+        """
+        if isinstance(value, Model):
+            fields = value.__dict__
+            for name, item in fields.items():
+                fields[name] = self.intern(item)
+            key = (type(value), *map(_key, fields.values()))
+        elif isinstance(value, list):
+            value[:] = [self.intern(item) for item in value]
+            key = (list, *map(_key, value))
+        elif isinstance(value, tuple):
+            value = tuple(self.intern(item) for item in value)
+            key = (tuple, *map(_key, value))
+        elif isinstance(value, dict):
+            for name, item in value.items():
+                value[name] = self.intern(item)
+            key = (dict, *((_key(k), _key(v)) for k, v in value.items()))
+        elif type(value) is str:
+            key = value
+        else:
+            return value
+        return self._values.setdefault(key, value)
@@ -1,18 +1,161 @@
 from __future__ import annotations
 
-from collections.abc import Sequence
+from collections.abc import Iterator, Sequence
+from functools import cache
+from typing import Any, get_args
+
+from pydantic import VERSION as PYDANTIC_VERSION
 
 from .serialise import Model
 
+_unset = object()
+
+
+class LazyItems(Sequence):
+    """
+    Paging items that are validated on first access.
+
+    Items are kept as JSON until they are accessed.
+    After that the model is kept and the JSON is discarded.
+    Nested models of an item are validated together with the item.
+
+    Parameters
+    ----------
+    type_
+        model of the items
+    items
+        JSON of the items
+    """
+
+    def __init__(self, type_: type[Model], items: list[dict | None]) -> None:
+        self._type = type_
+        self._json = list(items)
+        self._items: list[Any] = [_unset] * len(self._json)
+
+    def _item(self, index: int) -> Model | None:
+        item = self._items[index]
+        if item is _unset:
+            json = self._json[index]
+            item = self._type(**json) if json is not None else None
+            self._items[index] = item
+            self._json[index] = None
+        return item
+
+    def __getitem__(self, index: int | slice) -> Model | None | list[Model | None]:
+        """Get an item, validating it if it has not been accessed."""
+        if isinstance(index, slice):
+            return [self._item(i) for i in range(*index.indices(len(self)))]
+        return self._item(index)
+
+    def __iter__(self) -> Iterator[Model | None]:
+        """Iterate over items, validating them as they are reached."""
+        return (self._item(i) for i in range(len(self)))
+
+    def __len__(self) -> int:
+        """Return the number of items."""
+        return len(self._items)
+
+    def __eq__(self, other: object) -> bool:
+        """Compare items to another sequence."""
+        if not isinstance(other, Sequence) or isinstance(other, str):
+            return NotImplemented
+        return list(self) == list(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        validated = sum(item is not _unset for item in self._items)
+        return (
+            f"{type(self).__name__}({self._type.__name__}, "
+            f"{validated}/{len(self)} validated)"
+        )
+
+
+@cache
+def _item_type(cls: type[Paging]) -> type[Model] | None:
+    """Get the model of paging items, ``None`` if not a single model."""
+    if PYDANTIC_VERSION.startswith("1."):
+        annotation = cls.__fields__["items"].outer_type_
+    else:
+        annotation = cls.model_fields["items"].annotation
+
+    args = get_args(annotation)
+    if len(args) != 1:
+        return None
+    types = [t for t in get_args(args[0]) or args if t is not type(None)]
+    if len(types) == 1 and isinstance(types[0], type) and issubclass(types[0], Model):
+        return types[0]
+    return None
+
 
 class Paging(Model):
-    """Paging base."""
+    """
+    Paging base.
+
+    Pagings can also be created with lazily validated items,
+    see :meth:`lazy_validate`.
+    """
 
     href: str
     items: Sequence[Model | None]
     limit: int
     next: str | None
 
+    @classmethod
+    def lazy_validate(cls, json: dict) -> Paging:
+        """
+        Create a paging whose items are validated on first access.
+
+        Other fields are validated immediately.
+        If the items are not models, they are validated immediately too.
+
+        Parameters
+        ----------
+        json
+            paging JSON
+
+        Returns
+        -------
+        Paging
+            paging with :class:`LazyItems`
+        """
+        type_ = _item_type(cls)
+        if type_ is None:
+            return cls(**json)
+
+        paging = cls(**{**json, "items": []})
+        paging.__dict__["items"] = LazyItems(type_, json["items"])
+        return paging
+
+    def _validate_items(self) -> None:
+        items = self.__dict__["items"]
+        if isinstance(items, LazyItems):
+            self.__dict__["items"] = list(items)
+
+    if PYDANTIC_VERSION.startswith("1."):
+
+        def dict(self, **kwargs):
+            """Validate lazy items and convert to a dictionary."""
+            self._validate_items()
+            return super().dict(**kwargs)
+
+        def json(self, **kwargs) -> str:
+            """Validate lazy items and convert to JSON."""
+            self._validate_items()
+            return super().json(**kwargs)
+
+    else:
+
+        def model_dump(self, **kwargs) -> dict[str, Any]:
+            """Validate lazy items and convert to a dictionary."""
+            self._validate_items()
+            return super().model_dump(**kwargs)
+
+        def model_dump_json(self, **kwargs) -> str:
+            """Validate lazy items and convert to JSON."""
+            self._validate_items()
+            return super().model_dump_json(**kwargs)
+
 
 class OffsetPaging(Paging):
     """
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Literal
+from typing import Annotated, Any, Literal
+
+from pydantic import VERSION as PYDANTIC_VERSION
 
 from .base import Item
 from .episode import FullEpisode
@@ -12,6 +14,9 @@ from .serialise import Model
 from .track import FullTrack, Tracks
 from .user import PublicUser
 
+if not PYDANTIC_VERSION.startswith("1."):
+    from pydantic import model_validator
+
 
 class FullPlaylistTrack(FullTrack):
     """
@@ -52,23 +57,69 @@ class LocalPlaylistTrack(LocalTrack):
     track: Literal[True] = True
 
 
+def _item_kind(item: Any) -> str:
+    """Determine the kind of a playlist item from its flags."""
+    if isinstance(item, dict):
+        is_local = item.get("is_local", False)
+        episode = item.get("episode", False)
+    else:
+        is_local = getattr(item, "is_local", False)
+        episode = getattr(item, "episode", False)
+
+    if is_local:
+        return "local"
+    return "episode" if episode else "track"
+
+
+try:
+    from pydantic import Discriminator, Tag
+except ImportError:  # Pydantic 1 and older versions of 2
+    PlaylistItem = FullPlaylistTrack | FullPlaylistEpisode | LocalPlaylistTrack
+else:
+    PlaylistItem = Annotated[
+        Annotated[FullPlaylistTrack, Tag("track")]
+        | Annotated[FullPlaylistEpisode, Tag("episode")]
+        | Annotated[LocalPlaylistTrack, Tag("local")],
+        Discriminator(_item_kind),
+    ]
+
+
 class PlaylistTrack(Model):
     """
     Track or episode on a playlist.
 
     `track` and `item` are the same, but `track` is deprecated
     and may be removed in a future version.
+    With Pydantic 2, identical items are validated once and shared.
     """
 
     added_at: datetime
     added_by: PublicUser
     is_local: bool
-    track: FullPlaylistTrack | FullPlaylistEpisode | LocalPlaylistTrack | None = None
-    item: FullPlaylistTrack | FullPlaylistEpisode | LocalPlaylistTrack | None = None
+    track: PlaylistItem | None = None
+    item: PlaylistItem | None = None
 
     primary_color: str | None
     video_thumbnail: dict | None
 
+    if not PYDANTIC_VERSION.startswith("1."):
+
+        @model_validator(mode="wrap")
+        @classmethod
+        def _share_item(cls, data: Any, handler: Any) -> PlaylistTrack:
+            if not isinstance(data, dict):
+                return handler(data)
+
+            track = data.get("track")
+            if track is None or not (
+                track is data.get("item") or track == data.get("item")
+            ):
+                return handler(data)
+
+            playlist_track = handler({**data, "track": None})
+            playlist_track.__dict__["track"] = playlist_track.item
+            return playlist_track
+
 
 class PlaylistTrackPaging(OffsetPaging):
     """Paging of playlist tracks."""
@@ -1,6 +1,8 @@
+from collections.abc import Iterable
 from enum import Enum, EnumMeta
 from warnings import warn
 
+from pydantic import VERSION as PYDANTIC_VERSION
 from pydantic import BaseModel
 
 
@@ -40,20 +42,61 @@ class StrEnum(str, Enum, metaclass=StrEnumMeta):
         return self.name
 
 
-class Model(BaseModel):
-    """Response model base."""
-
-    def __init__(self, **data) -> None:
-        """"""  # noqa: D419
-        super().__init__(**data)
-        unknowns = set(data.keys()) - set(self.__dict__.keys())
-        cls_name = self.__class__.__name__
-        for arg in unknowns:
-            msg = (
-                f"{cls_name} contains unknown attribute: `{arg}`, which was discarded."
-                " This warning may be safely ignored. Please consider upgrading Tekore."
-            )
-            warn(msg, UnknownModelAttributeWarning, stacklevel=5)
+def _warn_unknowns(cls: type, unknowns: Iterable[str]) -> None:
+    for arg in unknowns:
+        msg = (
+            f"{cls.__name__} contains unknown attribute: `{arg}`, which was discarded."
+            " This warning may be safely ignored. Please consider upgrading Tekore."
+        )
+        warn(msg, UnknownModelAttributeWarning, stacklevel=6)
+
+
+if PYDANTIC_VERSION.startswith("1."):
+
+    class Model(BaseModel):
+        """Response model base."""
+
+        def __init__(self, **data) -> None:
+            """"""  # noqa: D419
+            super().__init__(**data)
+            fields = self.__fields__.keys()
+            if not data.keys() <= fields:
+                _warn_unknowns(type(self), data.keys() - fields)
+
+else:
+    from pydantic import ConfigDict
+
+    def _drop_extra(schema: dict) -> None:
+        # Extra values are only collected for warnings, not accepted
+        schema.pop("additionalProperties", None)
+
+    class Model(BaseModel):
+        """
+        Response model base.
+
+        Unknown attributes are collected as extra values during validation,
+        and discarded with a warning after it.
+        This avoids overriding ``__init__``,
+        which would make Pydantic call back to Python for each nested model.
+        Assigning unknown attributes is rejected as with ignored extra values.
+        """
+
+        model_config = ConfigDict(extra="allow", json_schema_extra=_drop_extra)
+
+        def __setattr__(self, name: str, value: object) -> None:
+            """Reject unknown attributes."""
+            cls = type(self)
+            if name not in cls.model_fields and name not in cls.__private_attributes__:
+                msg = f'"{cls.__name__}" object has no field "{name}"'
+                raise ValueError(msg)
+            super().__setattr__(name, value)
+
+        def model_post_init(self, _context: object, /) -> None:
+            """Discard unknown attributes."""
+            extra = self.__pydantic_extra__
+            if extra:
+                _warn_unknowns(type(self), list(extra))
+                object.__setattr__(self, "__pydantic_extra__", {})
 
 
 class UnknownModelAttributeWarning(RuntimeWarning):
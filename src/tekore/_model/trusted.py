@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime
+from enum import Enum
+from functools import cache
+from types import NoneType, UnionType
+from typing import Annotated, Any, Union, get_args, get_origin
+
+from pydantic import VERSION as PYDANTIC_VERSION
+
+from .serialise import Model, _warn_unknowns
+
+Converter = Callable[[Any], Any]
+
+
+def _validator(annotation: Any) -> Converter:
+    from pydantic import TypeAdapter  # noqa: PLC0415
+
+    return TypeAdapter(annotation).validate_python
+
+
+def _datetime_converter() -> Converter:
+    validate = _validator(datetime)
+
+    def parse(value: Any) -> Any:
+        if isinstance(value, str):
+            try:
+                return datetime.fromisoformat(value.replace("Z", "+00:00"))
+            except ValueError:
+                pass
+        return validate(value)
+
+    return parse
+
+
+def _list_converter(convert: Converter) -> Converter:
+    def list_of(value: list) -> list:
+        return [None if item is None else convert(item) for item in value]
+
+    return list_of
+
+
+def _tagged_converter(annotation: Any) -> Converter | None:
+    """Convert a union with a callable discriminator to the selected member."""
+    try:
+        from pydantic import Discriminator, Tag  # noqa: PLC0415
+    except ImportError:
+        return None
+
+    union, *metadata = get_args(annotation)
+    discriminator = next((m for m in metadata if isinstance(m, Discriminator)), None)
+    if discriminator is None or not callable(discriminator.discriminator):
+        return None
+
+    converters = {}
+    for member in get_args(union):
+        type_, *tags = get_args(member)
+        tag = next((t.tag for t in tags if isinstance(t, Tag)), None)
+        if tag is None:
+            return None
+        converters[tag] = _converter(type_) or _validator(type_)
+
+    choose = discriminator.discriminator
+
+    def tagged(value: Any) -> Any:
+        return converters[choose(value)](value)
+
+    return tagged
+
+
+def _converter(annotation: Any) -> Converter | None:  # noqa: PLR0911
+    """Create a function converting JSON to ``annotation``, None if not needed."""
+    origin = get_origin(annotation)
+    if origin is Annotated:
+        return _tagged_converter(annotation) or _validator(annotation)
+    if origin in {Union, UnionType}:
+        members = [a for a in get_args(annotation) if a is not NoneType]
+        if len(members) == 1:
+            return _converter(members[0])
+        if all(_converter(m) is None for m in members):
+            return None
+        return _validator(annotation)
+    if origin is list:
+        convert = _converter(get_args(annotation)[0])
+        return None if convert is None else _list_converter(convert)
+    if not isinstance(annotation, type):
+        return None
+    if issubclass(annotation, Model):
+        return _constructor(annotation)
+    if issubclass(annotation, datetime):
+        return _datetime_converter()
+    if issubclass(annotation, Enum):
+        return annotation
+    return None
+
+
+def _field_converters(type_: type[Model]) -> list[tuple[str, Converter, str | None]]:
+    """Create field converters with an earlier field of the same type to share."""
+    converted = []
+    annotations = []
+    for name, field in type_.model_fields.items():
+        annotation = field.annotation
+        convert = _converter(annotation)
+        if convert is None:
+            continue
+        shared = None
+        if annotation in annotations:
+            shared = converted[annotations.index(annotation)][0]
+        annotations.append(annotation)
+        converted.append((name, convert, shared))
+    return converted
+
+
+@cache
+def _constructor(type_: type[Model]) -> Converter:
+    model_fields = type_.model_fields
+    names = frozenset(model_fields)
+    defaults = {
+        name: (field.default, field.default_factory)
+        for name, field in model_fields.items()
+        if not field.is_required()
+    }
+    converted = _field_converters(type_)
+    new = type_.__new__
+    set_attribute = object.__setattr__
+
+    def construct(json: dict) -> Model:
+        values = json.copy()
+        if len(values) != len(names) or not names.issuperset(values):
+            unknown = [k for k in values if k not in names]
+            if unknown:
+                _warn_unknowns(type_, unknown)
+                for name in unknown:
+                    del values[name]
+            for name in names.difference(values):
+                if name in defaults:
+                    default, factory = defaults[name]
+                    values[name] = default if factory is None else factory()
+
+        for name, convert, shared in converted:
+            value = json.get(name)
+            if value is None:
+                continue
+            if shared is not None and (
+                value is json.get(shared) or value == json.get(shared)
+            ):
+                values[name] = values[shared]
+            else:
+                values[name] = convert(value)
+
+        instance = new(type_)
+        set_attribute(instance, "__dict__", values)
+        set_attribute(instance, "__pydantic_fields_set__", names.intersection(json))
+        set_attribute(instance, "__pydantic_extra__", {})
+        set_attribute(instance, "__pydantic_private__", None)
+        return instance
+
+    return construct
+
+
+def construct_trusted(type_: type[Model], json: dict) -> Model:
+    """
+    Build a model from trusted JSON without validating it.
+
+    Nested models are built recursively, and timestamps and enumerations
+    are converted, but other values are used as is.
+    Members of tagged unions are selected with their discriminator,
+    and other unions of several models are validated.
+    With Pydantic 1 the model is validated.
+
+    Parameters
+    ----------
+    type_
+        model type
+    json
+        response JSON
+
+    Returns
+    -------
+    Model
+        model instance
+    """
+    if PYDANTIC_VERSION.startswith("1."):
+        return type_(**json)
+    return _constructor(type_)(json)
@@ -1,4 +1,4 @@
-from .base import Request, Response, Sender
+from .base import LazyResponse, Request, Response, Sender, StreamedResponse
 from .client import Client, SenderConflictWarning, send_and_process
 from .concrete import AsyncSender, SyncSender
 from .error import (
@@ -14,4 +14,12 @@ from .error import (
     TooManyRequests,
     Unauthorised,
 )
-from .extending import CachingSender, ExtendingSender, RetryingSender
+from .extending import (
+    CachingSender,
+    CoalescingSender,
+    ExtendingSender,
+    RateLimitingSender,
+    RetryingSender,
+    RetryPolicy,
+)
+from .storage import CacheStats, CacheStorage, MemoryCacheStorage, SQLiteCacheStorage
@@ -1,9 +1,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Coroutine
+from collections.abc import AsyncIterator, Coroutine, Iterator, Mapping
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from dataclasses import dataclass
 
+try:
+    from orjson import loads
+except ImportError:
+    from json import loads
+
 
 @dataclass
 class Request:
@@ -28,6 +34,87 @@ class Response:
     content: dict | None
 
 
+@dataclass
+class StreamedResponse:
+    """Wrapper for result of a HTTP request with a streamed body."""
+
+    url: str
+    headers: Mapping[str, str]
+    status_code: int
+    chunks: Iterator[bytes] | AsyncIterator[bytes]
+
+
+def parse_json(content: bytes) -> dict | None:
+    """Parse json content or return None if not successful."""
+    if not content:
+        return None
+    try:
+        return loads(content)
+    except ValueError:
+        return None
+
+
+_unparsed = object()
+
+
+class LazyResponse(Response):
+    """
+    Response that parses its headers and JSON content on first access.
+
+    Content is decoded with :mod:`orjson` if it is installed
+    and with :mod:`json` otherwise.
+    Responses that are never inspected, like empty player responses
+    or those replaced by a cached response, are then cheap to construct.
+
+    Parameters
+    ----------
+    url
+        URL of the response
+    headers
+        response headers, converted to :class:`dict` when accessed
+    status_code
+        HTTP status code
+    raw
+        undecoded response body
+    """
+
+    def __init__(
+        self, url: str, headers: Mapping[str, str], status_code: int, raw: bytes
+    ) -> None:
+        self.url = url
+        self.status_code = status_code
+        self.raw = raw
+        self._headers = headers
+        self._content = _unparsed
+
+    @property
+    def headers(self) -> dict:
+        """Response headers."""
+        if not isinstance(self._headers, dict):
+            self._headers = dict(self._headers)
+        return self._headers
+
+    @headers.setter
+    def headers(self, value: dict) -> None:
+        self._headers = value
+
+    @property
+    def content(self) -> dict | None:
+        """Response content parsed as JSON, or None if not successful."""
+        if self._content is _unparsed:
+            self._content = parse_json(self.raw)
+        return self._content
+
+    @content.setter
+    def content(self, value: dict | None) -> None:
+        self._content = value
+
+    @property
+    def parsed(self) -> bool:
+        """Whether the content has been parsed or set."""
+        return self._content is not _unparsed
+
+
 class Sender(ABC):
     """Sender interface for requests."""
 
@@ -50,6 +137,31 @@ class Sender(ABC):
             resulting response
         """
 
+    def stream(
+        self, request: Request
+    ) -> (
+        AbstractContextManager[StreamedResponse]
+        | AbstractAsyncContextManager[StreamedResponse]
+    ):
+        """
+        Send a request and stream the response body.
+
+        Streaming is optional for senders to implement.
+
+        Parameters
+        ----------
+        request
+            request to send
+
+        Returns
+        -------
+        AbstractContextManager[StreamedResponse]
+            context manager for a response whose body is read in chunks,
+            asynchronous for asynchronous senders
+        """
+        msg = f"{type(self).__name__} does not support streaming!"
+        raise NotImplementedError(msg)
+
     @property
     @abstractmethod
     def is_async(self) -> bool:
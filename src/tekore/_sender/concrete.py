@@ -1,17 +1,11 @@
 from __future__ import annotations
 
-from httpx import AsyncClient, Client
-from httpx import Response as HTTPXResponse
-
-from .base import Request, Response, Sender
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
 
+from httpx import AsyncClient, Client
 
-def try_parse_json(response: HTTPXResponse) -> dict | None:
-    """Parse json content or return None if not successful."""
-    try:
-        return response.json()
-    except ValueError:
-        return None
+from .base import LazyResponse, Request, Response, Sender, StreamedResponse
 
 
 class SyncSender(Sender):
@@ -44,13 +38,32 @@ class SyncSender(Sender):
             json=request.json,
             content=request.content,
         )
-        return Response(
+        return LazyResponse(
             url=str(response.url),
-            headers=dict(response.headers),
+            headers=response.headers,
             status_code=response.status_code,
-            content=try_parse_json(response),
+            raw=response.content,
         )
 
+    @contextmanager
+    def stream(self, request: Request) -> Iterator[StreamedResponse]:
+        """Send request with :class:`httpx.Client` and stream the response."""
+        with self.client.stream(
+            method=request.method,
+            url=request.url,
+            params=request.params,
+            headers=request.headers,
+            data=request.data,
+            json=request.json,
+            content=request.content,
+        ) as response:
+            yield StreamedResponse(
+                url=str(response.url),
+                headers=response.headers,
+                status_code=response.status_code,
+                chunks=response.iter_bytes(),
+            )
+
     @property
     def is_async(self) -> bool:
         """Sender asynchronicity, always :class:`False`."""
@@ -91,13 +104,32 @@ class AsyncSender(Sender):
             json=request.json,
             content=request.content,
         )
-        return Response(
+        return LazyResponse(
             url=str(response.url),
-            headers=dict(response.headers),
+            headers=response.headers,
             status_code=response.status_code,
-            content=try_parse_json(response),
+            raw=response.content,
         )
 
+    @asynccontextmanager
+    async def stream(self, request: Request) -> AsyncIterator[StreamedResponse]:
+        """Send request with :class:`httpx.AsyncClient` and stream the response."""
+        async with self.client.stream(
+            method=request.method,
+            url=request.url,
+            params=request.params,
+            headers=request.headers,
+            data=request.data,
+            json=request.json,
+            content=request.content,
+        ) as response:
+            yield StreamedResponse(
+                url=str(response.url),
+                headers=response.headers,
+                status_code=response.status_code,
+                chunks=response.aiter_bytes(),
+            )
+
     @property
     def is_async(self) -> bool:
         """Sender asynchronicity, always :class:`True`."""
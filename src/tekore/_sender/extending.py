@@ -1,15 +1,19 @@
 from __future__ import annotations
 
 import asyncio
+import random
+import threading
 import time
-from collections import deque
-from collections.abc import Coroutine
+from collections.abc import Coroutine, Iterable
+from concurrent.futures import Future
+from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from urllib.parse import urlencode
 
-from httpx import codes
+from httpx import TransportError, codes
 
-from .base import Request, Response
+from .base import LazyResponse, Request, Response, StreamedResponse
 from .concrete import Sender, SyncSender
+from .storage import CacheStats, CacheStorage, MemoryCacheStorage
 
 
 class ExtendingSender(Sender):
@@ -30,6 +34,15 @@ class ExtendingSender(Sender):
         """Sender asynchronicity, delegated to the underlying sender."""
         return self.sender.is_async
 
+    def stream(
+        self, request: Request
+    ) -> (
+        AbstractContextManager[StreamedResponse]
+        | AbstractAsyncContextManager[StreamedResponse]
+    ):
+        """Stream request with the underlying sender, bypassing any extensions."""
+        return self.sender.stream(request)
+
     def close(self) -> None | Coroutine[None, None, None]:
         """
         Close the underlying sender.
@@ -40,6 +53,133 @@ class ExtendingSender(Sender):
         return self.sender.close()
 
 
+class RetryPolicy:
+    """
+    Policy for retrying unsuccessful requests.
+
+    Rate limited requests are always retried after waiting
+    for the time specified in the `Retry-After` header.
+    Server errors and transport errors such as timeouts
+    are retried the set amount of times for idempotent methods.
+    The delay before each retry grows exponentially up to a maximum.
+    With jitter, a random delay up to the exponential delay is used instead,
+    so that clients failing at the same time don't retry in lockstep.
+
+    Subclass and override :meth:`delay` to customise the policy further.
+
+    Parameters
+    ----------
+    retries
+        maximum number of retries on server and transport errors
+    backoff
+        delay in seconds before the first retry, doubled on each retry
+    max_delay
+        maximum delay in seconds between retries
+    jitter
+        randomise delays between zero and the exponential delay
+    deadline
+        maximum total time in seconds spent on a request including retries,
+        after which the last response is returned or error raised
+    methods
+        request methods that are retried on server and transport errors
+    exceptions
+        transport exceptions that are retried
+    """
+
+    def __init__(
+        self,
+        retries: int = 0,
+        backoff: float = 1,
+        max_delay: float = 60,
+        jitter: bool = True,
+        deadline: float | None = None,
+        methods: Iterable[str] = ("GET", "PUT", "DELETE"),
+        exceptions: tuple[type[Exception], ...] = (TransportError,),
+    ) -> None:
+        self.retries = retries
+        self.backoff = backoff
+        self.max_delay = max_delay
+        self.jitter = jitter
+        self.deadline = deadline
+        self.methods = {m.upper() for m in methods}
+        self.exceptions = exceptions
+
+    def __repr__(self) -> str:
+        options = [
+            f"retries={self.retries}",
+            f"backoff={self.backoff}",
+            f"max_delay={self.max_delay}",
+            f"jitter={self.jitter}",
+            f"deadline={self.deadline}",
+        ]
+        return type(self).__name__ + "(" + ", ".join(options) + ")"
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Determine the delay before retrying a failed request.
+
+        Parameters
+        ----------
+        attempt
+            number of retries already made
+
+        Returns
+        -------
+        float
+            seconds to wait
+        """
+        delay = min(self.backoff * 2**attempt, self.max_delay)
+        if self.jitter:
+            delay = random.uniform(0, delay)  # noqa: S311
+        return delay
+
+    def delay(
+        self,
+        request: Request,
+        response: Response | None,
+        error: Exception | None,
+        attempt: int,
+        elapsed: float,
+    ) -> float | None:
+        """
+        Determine whether and when to retry a request.
+
+        Parameters
+        ----------
+        request
+            request that was sent
+        response
+            resulting response, or ``None`` if sending raised an error
+        error
+            error raised when sending, or ``None`` if a response was received
+        attempt
+            number of retries already made, excluding rate limited ones
+        elapsed
+            seconds since the request was first sent
+
+        Returns
+        -------
+        float | None
+            seconds to wait before retrying, or ``None`` to stop retrying
+        """
+        if response is not None and response.status_code == codes.TOO_MANY_REQUESTS:
+            delay = int(response.headers.get("Retry-After", 1)) + 1
+        else:
+            failed = (
+                isinstance(error, self.exceptions)
+                if error is not None
+                else codes.is_server_error(response.status_code)
+            )
+            idempotent = request.method.upper() in self.methods
+            if not failed or not idempotent or attempt >= self.retries:
+                return None
+            delay = self.backoff_delay(attempt)
+
+        if self.deadline is not None and elapsed + delay > self.deadline:
+            return None
+        return delay
+
+
 class RetryingSender(ExtendingSender):
     """
     Retry requests if unsuccessful.
@@ -47,6 +187,9 @@ class RetryingSender(ExtendingSender):
     On server errors the set amount of retries are used to resend requests.
     On :class:`TooManyRequests` the `Retry-After` header is checked and used
     to wait before requesting again.
+    The exact behavior is determined by a :class:`RetryPolicy`,
+    which also retries transport errors, waits for a random exponential
+    delay between retries and only retries idempotent requests by default.
 
     .. note::
 
@@ -56,9 +199,13 @@ class RetryingSender(ExtendingSender):
     Parameters
     ----------
     retries
-        maximum number of retries on server errors before giving up
+        maximum number of retries on server errors before giving up,
+        ignored if a policy is specified
     sender
         request sender, :class:`SyncSender` if not specified
+    policy
+        retry policy, if not specified a default policy with
+        the number of ``retries`` is used
 
     Examples
     --------
@@ -73,14 +220,35 @@ class RetryingSender(ExtendingSender):
     .. code:: python
 
         tk.RetryingSender(retries=3)
+
+    Specify a policy to customise retries further.
+
+    .. code:: python
+
+        policy = tk.RetryPolicy(retries=5, max_delay=10, deadline=60)
+        tk.RetryingSender(policy=policy)
     """
 
-    def __init__(self, retries: int = 0, sender: Sender | None = None) -> None:
+    def __init__(
+        self,
+        retries: int = 0,
+        sender: Sender | None = None,
+        policy: RetryPolicy | None = None,
+    ) -> None:
         super().__init__(sender)
-        self.retries = retries
+        self.policy = policy or RetryPolicy(retries=max(retries, 0))
+
+    @property
+    def retries(self) -> int:
+        """Maximum number of retries of the policy."""
+        return self.policy.retries
+
+    @retries.setter
+    def retries(self, value: int) -> None:
+        self.policy.retries = max(value, 0)
 
     def __repr__(self) -> str:
-        contains = f"(retries={self.retries}, sender={self.sender!r})"
+        contains = f"(policy={self.policy!r}, sender={self.sender!r})"
         return type(self).__name__ + contains
 
     def send(self, request: Request) -> Response | Coroutine[None, None, Response]:
@@ -88,40 +256,276 @@ class RetryingSender(ExtendingSender):
         if self.is_async:
             return self._async_send(request)
 
-        retries = max(self.retries, 0)
-        delay_seconds = 1
+        attempt = 0
+        start = time.monotonic()
 
         while True:
-            r = self.sender.send(request)
-
-            if r.status_code == codes.TOO_MANY_REQUESTS:
-                seconds = r.headers.get("Retry-After", 1)
-                time.sleep(int(seconds) + 1)
-            elif codes.is_server_error(r.status_code) and retries > 0:
-                retries -= 1
-                time.sleep(delay_seconds)
-                delay_seconds *= 2
-            else:
+            response, error = None, None
+            try:
+                response = self.sender.send(request)
+            except Exception as e:  # noqa: BLE001
+                error = e
+
+            elapsed = time.monotonic() - start
+            delay = self.policy.delay(request, response, error, attempt, elapsed)
+            if delay is None:
                 break
-        return r
+            if not _is_rate_limited(response):
+                attempt += 1
+            time.sleep(delay)
+
+        if error is not None:
+            raise error
+        return response
 
     async def _async_send(self, request: Request) -> Response:
-        retries = max(self.retries, 0)
-        delay_seconds = 1
+        attempt = 0
+        start = time.monotonic()
 
         while True:
-            r = await self.sender.send(request)
-
-            if r.status_code == codes.TOO_MANY_REQUESTS:
-                seconds = r.headers.get("Retry-After", 1)
-                await asyncio.sleep(int(seconds) + 1)
-            elif codes.is_server_error(r.status_code) and retries > 0:
-                retries -= 1
-                await asyncio.sleep(delay_seconds)
-                delay_seconds *= 2
-            else:
+            response, error = None, None
+            try:
+                response = await self.sender.send(request)
+            except Exception as e:  # noqa: BLE001
+                error = e
+
+            elapsed = time.monotonic() - start
+            delay = self.policy.delay(request, response, error, attempt, elapsed)
+            if delay is None:
                 break
-        return r
+            if not _is_rate_limited(response):
+                attempt += 1
+            await asyncio.sleep(delay)
+
+        if error is not None:
+            raise error
+        return response
+
+
+def _is_rate_limited(response: Response | None) -> bool:
+    return response is not None and response.status_code == codes.TOO_MANY_REQUESTS
+
+
+class RateLimitingSender(ExtendingSender):
+    """
+    Limit the rate of requests to avoid being rate limited.
+
+    Requests are spent from a token bucket which holds at most the number
+    of requests allowed in a time window, and is refilled continuously.
+    When the bucket is empty, requests wait for their turn in order.
+    Synchronous requests block the calling thread
+    and asynchronous requests sleep in their tasks,
+    so the sender can be shared between threads or tasks.
+
+    When :class:`TooManyRequests` is nevertheless received, the bucket is
+    emptied for the duration of the `Retry-After` header and the rate is halved.
+    The rate is then gradually restored with successful requests.
+    Responses are returned as is, so to resend rate limited requests,
+    use a :class:`RetryingSender` on top of this sender.
+
+    Parameters
+    ----------
+    requests
+        number of requests allowed in a time window
+    window
+        length of the time window in seconds
+    sender
+        request sender, :class:`SyncSender` if not specified
+
+    Examples
+    --------
+    Allow on average one request per second and retry rate limited requests.
+
+    .. code:: python
+
+        tk.RetryingSender(sender=tk.RateLimitingSender(requests=30, window=30))
+    """
+
+    def __init__(
+        self, requests: int, window: float = 30, sender: Sender | None = None
+    ) -> None:
+        super().__init__(sender)
+        self.requests = requests
+        self.window = window
+        self._rate = requests / window
+        self._tokens = float(requests)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        contains = (
+            f"(requests={self.requests}, window={self.window}, sender={self.sender!r})"
+        )
+        return type(self).__name__ + contains
+
+    @property
+    def rate(self) -> float:
+        """
+        Current rate of requests per second.
+
+        Returns
+        -------
+        float
+            rate of requests
+        """
+        return self._rate
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        refilled = self._tokens + (now - self._updated) * self._rate
+        self._tokens = min(refilled, float(self.requests))
+        self._updated = now
+
+    def _reserve(self) -> float:
+        """Reserve a request, returning the seconds to wait before sending."""
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            return max(-self._tokens / self._rate, 0)
+
+    def _adapt(self, response: Response) -> None:
+        max_rate = self.requests / self.window
+        with self._lock:
+            self._refill()
+            if response.status_code == codes.TOO_MANY_REQUESTS:
+                seconds = int(response.headers.get("Retry-After", 1))
+                self._rate = max(self._rate / 2, max_rate / self.requests)
+                self._tokens = min(self._tokens, -seconds * self._rate)
+            else:
+                self._rate = min(self._rate + max_rate / self.requests, max_rate)
+
+    def send(self, request: Request) -> Response | Coroutine[None, None, Response]:
+        """Delegate request to underlying sender when allowed by rate."""
+        if self.is_async:
+            return self._async_send(request)
+
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+        response = self.sender.send(request)
+        self._adapt(response)
+        return response
+
+    async def _async_send(self, request: Request) -> Response:
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        response = await self.sender.send(request)
+        self._adapt(response)
+        return response
+
+
+class CoalescingSender(ExtendingSender):
+    """
+    Coalesce identical concurrent GET requests.
+
+    When a GET request is already in flight, identical requests wait for
+    and share its response instead of sending a new request.
+    Requests are identical when their URL, parameters and headers match,
+    so requests with different tokens are never coalesced.
+    Errors raised while sending are raised to all waiting callers.
+    Asynchronous requests are sent in their own task,
+    so cancelling a caller does not cancel the request for the others.
+    The sender can be shared between threads or tasks.
+
+    Combine with :class:`CachingSender` to avoid duplicate requests
+    when many callers request the same uncached resource at once.
+
+    Parameters
+    ----------
+    sender
+        request sender, :class:`SyncSender` if not specified
+
+    Examples
+    --------
+    .. code:: python
+
+        tk.CachingSender(sender=tk.CoalescingSender(tk.AsyncSender()))
+    """
+
+    def __init__(self, sender: Sender | None = None) -> None:
+        super().__init__(sender)
+        self._in_flight: dict[tuple, Future | asyncio.Task] = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return type(self).__name__ + f"(sender={self.sender!r})"
+
+    @staticmethod
+    def _key(request: Request) -> tuple:
+        params = tuple(sorted((request.params or {}).items()))
+        headers = tuple(sorted((request.headers or {}).items()))
+        return request.url, params, headers
+
+    def send(self, request: Request) -> Response | Coroutine[None, None, Response]:
+        """Delegate request to underlying sender or wait for identical request."""
+        if self.is_async:
+            return self._async_send(request)
+
+        if request.method.lower() != "get":
+            return self.sender.send(request)
+
+        key = self._key(request)
+        with self._lock:
+            future = self._in_flight.get(key, None)
+            leader = future is None
+            if leader:
+                future = self._in_flight[key] = Future()
+
+        if not leader:
+            return future.result()
+
+        try:
+            response = self.sender.send(request)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    async def _async_send(self, request: Request) -> Response:
+        if request.method.lower() != "get":
+            return await self.sender.send(request)
+
+        key = self._key(request)
+        with self._lock:
+            task = self._in_flight.get(key, None)
+            if task is None:
+                task = self._in_flight[key] = asyncio.ensure_future(
+                    self._async_send_shared(key, request)
+                )
+                # Retrieve errors, even if every caller was cancelled
+                task.add_done_callback(_retrieve_exception)
+
+        # Cancelling a caller leaves the shared request and other callers as is
+        return await asyncio.shield(task)
+
+    async def _async_send_shared(self, key: tuple, request: Request) -> Response:
+        try:
+            return await self.sender.send(request)
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+
+def _retrieve_exception(task: asyncio.Task) -> None:
+    if not task.cancelled():
+        task.exception()
+
+
+def _detached(response: Response) -> Response:
+    """Copy a lazy response, so that decoding the copy leaves the original as is."""
+    if not isinstance(response, LazyResponse):
+        return response
+    return LazyResponse(
+        response.url, response.headers, response.status_code, response.raw
+    )
 
 
 class CachingSender(ExtendingSender):
@@ -129,101 +533,165 @@ class CachingSender(ExtendingSender):
     Cache successful GET requests.
 
     The Web API provides response headers for caching.
-    Resources are cached based on Cache-Control, ETag and Vary headers.
+    Resources are cached based on Cache-Control, ETag, Last-Modified
+    and Vary headers.
     Thus :class:`CachingSender` can be used with user tokens too.
     Resources marked as private, errors and ``Vary: *`` are not cached.
 
+    Cached responses are kept in a :class:`CacheStorage`.
+    By default they are stored in memory, but they can also be stored
+    in e.g. a database shared between processes and persisted between runs.
+
     When using asynchronous senders, the cache is protected with
     :class:`asyncio.Lock` to prevent concurrent access.
     The lock is instantiated on the first asynchronous call,
     so using only one :func:`asyncio.run` (per sender) is advised.
+    Synchronous senders are protected with :class:`threading.Lock`
+    to allow sharing the sender between threads.
 
     Note that if the cache has no maximum size it can grow without limit.
     Use :meth:`CachingSender.clear` to empty the cache.
+    The size can be limited by the number of resources or by their estimated
+    size in memory, which is more precise because responses vary greatly
+    in size. Cache usage is reported in :attr:`CachingSender.stats`.
+    Undecoded :class:`LazyResponse` objects are stored as is,
+    and every cache hit returns a copy that decodes its content separately,
+    so that stored responses keep their estimated size.
+
+    Stale responses can optionally be returned while they are refreshed
+    in the background, a daemon thread for synchronous senders
+    and a task for asynchronous ones, or in place of server errors.
+    Failed refreshes keep the stale response and are counted in the stats.
 
     Parameters
     ----------
     max_size
-        maximum cache size (amount of responses), if specified the least
-        recently used response is discarded when the cache would overflow
+        maximum cache size (amount of resources), if specified the least
+        recently used resource is discarded when the cache would overflow,
+        ignored if ``storage`` is specified
     sender
         request sender, :class:`SyncSender` if not specified
+    storage
+        storage of cached responses, :class:`MemoryCacheStorage`
+        if not specified
+    max_bytes
+        maximum estimated cache size in bytes, if specified least recently
+        used resources are discarded until a new resource fits,
+        ignored if ``storage`` is specified
+    stale_while_revalidate
+        seconds after expiring during which a stale response is returned
+        immediately and refreshed in the background
+    stale_if_error
+        seconds after expiring during which a stale response is returned
+        if the Web API responds with a server error
+
+    Examples
+    --------
+    Share cached responses between processes.
+
+    .. code:: python
+
+        storage = tk.SQLiteCacheStorage("cache.db", max_size=10_000)
+        tk.CachingSender(storage=storage)
     """
 
     def __init__(
-        self, max_size: int | None = None, sender: Sender | None = None
+        self,
+        max_size: int | None = None,
+        sender: Sender | None = None,
+        storage: CacheStorage | None = None,
+        max_bytes: int | None = None,
+        stale_while_revalidate: float = 0,
+        stale_if_error: float = 0,
     ) -> None:
         super().__init__(sender)
-        self._max_size = max_size
-        self._cache: dict[str, tuple] = {}
-        self._deque: deque = deque(maxlen=self.max_size)
+        if storage is None:
+            storage = MemoryCacheStorage(max_size, max_bytes)
+        self.storage = storage
+        self.stale_while_revalidate = stale_while_revalidate
+        self.stale_if_error = stale_if_error
         self._lock: asyncio.Lock | None = None
+        self._thread_lock = threading.Lock()
+        self._refreshing: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+        self._refresh_errors = 0
 
     def __repr__(self) -> str:
-        contains = f"(max_size={self._max_size}, sender={self.sender!r})"
+        contains = f"(storage={self.storage!r}, sender={self.sender!r})"
         return type(self).__name__ + contains
 
     @property
     def max_size(self) -> int | None:
         """
-        Maximum amount of requests stored in the cache.
+        Maximum amount of resources stored in the cache.
 
         Returns
         -------
         int | None
             maximum cache size
         """
-        return self._max_size
+        return self.storage.max_size
+
+    @property
+    def stats(self) -> CacheStats:
+        """
+        Current cache statistics.
+
+        Hits are requests answered from the cache including stale responses,
+        misses are requests sent without a cached response and revalidations
+        are conditional requests sent with the validators of a stale response.
+        Refresh errors are failed background refreshes of stale responses.
+
+        Returns
+        -------
+        CacheStats
+            statistics of the sender and its storage
+        """
+        return CacheStats(
+            entries=len(self.storage),
+            bytes=self.storage.bytes_used,
+            hits=self._hits,
+            misses=self._misses,
+            revalidations=self._revalidations,
+            evictions=self.storage.evictions,
+            refresh_errors=self._refresh_errors,
+        )
 
     def clear(self) -> None:
         """Clear sender cache."""
-        self._cache = {}
-        self._deque.clear()
+        self.storage.clear()
 
     @staticmethod
-    def _vary_key(request: Request, vary: list[str] | None) -> str | None:
+    def _vary_key(request: Request, vary: list[str] | None) -> str:
         if vary is not None:
             return " ".join(request.headers[k] for k in vary)
-        return None
+        return ""
 
     @staticmethod
-    def _cc_fresh(item: dict) -> bool:
-        return item["expires_at"] > time.time()
+    def _has_validator(item: dict) -> bool:
+        return item["etag"] is not None or item["last_modified"] is not None
 
     @staticmethod
-    def _has_etag(item: dict) -> bool:
-        return item["etag"] is not None
-
-    def _is_fresh(self, url: str, vary_key: str) -> bool:
-        item = self._cache[url][1][vary_key]
-        return self._cc_fresh(item) or self._has_etag(item)
-
-    def _delete(self, url: str, vary_key: str) -> None:
-        item = self._cache[url]
-        del item[1][vary_key]
-        if not item[1]:
-            del item
+    def _max_age(cc: str) -> int:
+        if "max-age=" not in cc:
+            return 0
+        return int(cc.split("max-age=")[1].split(",", maxsplit=1)[0])
 
-    def _remove_stale_items(self) -> None:
-        if len(self._deque) == self._deque.maxlen:
-            deque_items = list(self._deque)
-            self._deque.clear()
-
-            for item in deque_items:
-                fresh = self._is_fresh(*item)
-
-                if fresh:
-                    self._deque.append(item)
-                else:
-                    self._delete(*item)
-
-    def _append_item(self, item: tuple[str, str | None]) -> None:
-        # Remove LRU item
-        if len(self._deque) == self._deque.maxlen:
-            d_url, d_vary_key = self._deque.popleft()
-            self._delete(d_url, d_vary_key)
-
-        self._deque.append(item)
+    @staticmethod
+    def _add_conditions(request: Request, item: dict) -> None:
+        if item["etag"] is not None:
+            request.headers["If-None-Match"] = item["etag"]
+        if item["last_modified"] is not None:
+            request.headers["If-Modified-Since"] = item["last_modified"]
+
+    def _expires_at(self, variants: dict[str, dict]) -> float | None:
+        if any(self._has_validator(item) for item in variants.values()):
+            return None
+        expires_at = max(item["expires_at"] for item in variants.values())
+        return expires_at + max(self.stale_while_revalidate, self.stale_if_error)
 
     def _maybe_save(self, request: Request, response: Response) -> None:
         cc = response.headers.get("Cache-Control", "private, max-age=0")
@@ -231,7 +699,7 @@ class CachingSender(ExtendingSender):
         if codes.is_error(response.status_code) or "private" in cc:
             return
 
-        age = int(cc.split("max-age=")[1].split(",")[0])
+        age = self._max_age(cc)
         vary = response.headers.get("Vary", None)
         if vary is not None:
             if "*" in vary:
@@ -239,62 +707,115 @@ class CachingSender(ExtendingSender):
             vary = vary.split(", ")
 
         # Construct cached response
-        cache_item = self._cache.setdefault(response.url, (vary, {}))
+        cached = self.storage.get(response.url)
+        variants = cached[1] if cached is not None else {}
         cached_response = {
-            "response": response,
+            "response": _detached(response),
             "expires_at": time.time() + age - 1,
             "etag": response.headers.get("ETag", None),
+            "last_modified": response.headers.get("Last-Modified", None),
         }
-        vary_key = self._vary_key(request, vary)
-        cache_item[1].update({vary_key: cached_response})
-
-        # Manage cache size
-        if self.max_size is None:
-            return
-
-        self._remove_stale_items()
-        self._append_item((response.url, vary_key))
-
-    def _update_usage(self, item: tuple[str, str | None]) -> None:
-        if self.max_size is None:
-            return
+        variants[self._vary_key(request, vary)] = cached_response
+        self.storage.set(response.url, (vary, variants), self._expires_at(variants))
 
-        self._deque.remove(item)
-        self._deque.append(item)
-
-    def _load(self, request: Request) -> tuple:
+    @staticmethod
+    def _url(request: Request) -> str:
         params = ("&" + urlencode(request.params)) if request.params else ""
-        url = request.url + params
-        item = self._cache.get(url, None)
+        return request.url + params
 
+    def _refresh_expiry(self, request: Request, fresh: Response, cached: dict) -> None:
+        url = cached["response"].url
+        item = self.storage.get(url)
         if item is None:
-            return None, None
+            return
 
+        variants = item[1]
         vary_key = self._vary_key(request, item[0])
-        cached = item[1].get(vary_key, None)
+        if vary_key not in variants:
+            return
 
-        if cached is not None:
-            response = cached["response"]
-            deque_item = (url, vary_key)
-            if self._cc_fresh(cached):
-                self._update_usage(deque_item)
-                return response, None
-            if self._has_etag(cached):
-                self._update_usage(deque_item)
-                return response, cached["etag"]
-            if self.max_size is not None:
-                self._deque.remove(deque_item)
-
-        return None, None
+        cached_headers = cached["response"].headers
+        cc = fresh.headers.get("Cache-Control", None)
+        cc = cc or cached_headers.get("Cache-Control", "max-age=0")
+        stored = variants[vary_key]
+        stored["expires_at"] = time.time() + self._max_age(cc) - 1
+        stored["etag"] = fresh.headers.get("ETag", stored["etag"])
+        stored["last_modified"] = fresh.headers.get(
+            "Last-Modified", stored["last_modified"]
+        )
+        self.storage.set(url, item, self._expires_at(variants))
+
+    def _load(self, request: Request) -> tuple[dict | None, float]:
+        item = self.storage.get(self._url(request))
+        cached = None
+        if item is not None:
+            vary_key = self._vary_key(request, item[0])
+            cached = item[1].get(vary_key, None)
+
+        if cached is None:
+            self._misses += 1
+            return None, 0
+
+        staleness = time.time() - cached["expires_at"]
+        if staleness < 0:
+            self._hits += 1
+            return cached, staleness
+
+        if staleness < self.stale_while_revalidate:
+            self._hits += 1
+        if self._has_validator(cached):
+            self._revalidations += 1
+        elif staleness >= self.stale_while_revalidate:
+            self._misses += 1
+        return cached, staleness
+
+    def _serve_stale(
+        self, fresh: Response, cached: dict | None, staleness: float
+    ) -> bool:
+        return (
+            cached is not None
+            and codes.is_server_error(fresh.status_code)
+            and staleness < self.stale_if_error
+        )
 
     def _handle_fresh(
-        self, request: Request, fresh: Response, cached: Response
+        self, request: Request, fresh: Response, cached: dict | None
     ) -> Response:
-        if fresh.status_code == codes.NOT_MODIFIED:
-            return cached
+        if fresh.status_code == codes.NOT_MODIFIED and cached is not None:
+            self._refresh_expiry(request, fresh, cached)
+            return _detached(cached["response"])
         self._maybe_save(request, fresh)
         return fresh
 
+    def _start_refresh(self, url: str) -> bool:
+        if url in self._refreshing:
+            return False
+        self._refreshing.add(url)
+        return True
+
+    def _refresh(self, request: Request, cached: dict, url: str) -> None:
+        try:
+            fresh = self.sender.send(request)
+            with self._thread_lock:
+                self._handle_fresh(request, fresh, cached)
+        except Exception:  # noqa: BLE001
+            with self._thread_lock:
+                self._refresh_errors += 1
+        finally:
+            with self._thread_lock:
+                self._refreshing.discard(url)
+
+    async def _async_refresh(self, request: Request, cached: dict, url: str) -> None:
+        try:
+            fresh = await self.sender.send(request)
+            async with self._lock:
+                self._handle_fresh(request, fresh, cached)
+        except Exception:  # noqa: BLE001
+            self._refresh_errors += 1
+        finally:
+            async with self._lock:
+                self._refreshing.discard(url)
+
     def send(self, request: Request) -> Response | Coroutine[None, None, Response]:
         """Maybe load request from cache, or delegate to underlying sender."""
         if self.is_async:
@@ -303,14 +824,31 @@ class CachingSender(ExtendingSender):
         if request.method.lower() != "get":
             return self.sender.send(request)
 
-        cached, etag = self._load(request)
-        if cached is not None and etag is None:
-            return cached
-        if etag is not None:
-            request.headers.update(ETag=etag)
+        with self._thread_lock:
+            cached, staleness = self._load(request)
+
+        if cached is not None:
+            if staleness < 0:
+                return _detached(cached["response"])
+            if self._has_validator(cached):
+                self._add_conditions(request, cached)
+            if staleness < self.stale_while_revalidate:
+                url = self._url(request)
+                with self._thread_lock:
+                    start = self._start_refresh(url)
+                if start:
+                    args = (request, cached, url)
+                    thread = threading.Thread(
+                        target=self._refresh, args=args, daemon=True
+                    )
+                    thread.start()
+                return _detached(cached["response"])
 
         fresh = self.sender.send(request)
-        return self._handle_fresh(request, fresh, cached)
+        if self._serve_stale(fresh, cached, staleness):
+            return _detached(cached["response"])
+        with self._thread_lock:
+            return self._handle_fresh(request, fresh, cached)
 
     async def _async_send(self, request: Request) -> Response:
         if request.method.lower() != "get":
@@ -320,13 +858,24 @@ class CachingSender(ExtendingSender):
             self._lock = asyncio.Lock()
 
         async with self._lock:
-            cached, etag = self._load(request)
+            cached, staleness = self._load(request)
 
-        if cached is not None and etag is None:
-            return cached
-        if etag is not None:
-            request.headers.update(ETag=etag)
+        if cached is not None:
+            if staleness < 0:
+                return _detached(cached["response"])
+            if self._has_validator(cached):
+                self._add_conditions(request, cached)
+            if staleness < self.stale_while_revalidate:
+                url = self._url(request)
+                if self._start_refresh(url):
+                    refresh = self._async_refresh(request, cached, url)
+                    task = asyncio.create_task(refresh)
+                    self._tasks.add(task)
+                    task.add_done_callback(self._tasks.discard)
+                return _detached(cached["response"])
 
         fresh = await self.sender.send(request)
+        if self._serve_stale(fresh, cached, staleness):
+            return _detached(cached["response"])
         async with self._lock:
             return self._handle_fresh(request, fresh, cached)
@@ -0,0 +1,390 @@
+from __future__ import annotations
+
+import heapq
+import json
+import sqlite3
+import sys
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from .base import Response
+
+
+@dataclass
+class CacheStats:
+    """Statistics of a :class:`CachingSender` and its storage."""
+
+    entries: int
+    bytes: int
+    hits: int
+    misses: int
+    revalidations: int
+    evictions: int
+    refresh_errors: int = 0
+
+
+class CacheStorage(ABC):
+    """
+    Storage interface for :class:`CachingSender`.
+
+    Storages map resource URLs to cached values,
+    and manage the size of the cache by discarding values.
+    Values consist of plain Python containers and :class:`Response` objects.
+    When the storage would overflow, expired values are discarded first
+    and then the least recently used values.
+
+    Parameters
+    ----------
+    max_size
+        maximum number of values stored
+    max_bytes
+        maximum estimated size of stored values in bytes,
+        values larger than this are not stored at all
+    """
+
+    def __init__(
+        self, max_size: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.evictions = 0
+
+    def __repr__(self) -> str:
+        options = f"max_size={self.max_size}, max_bytes={self.max_bytes}"
+        return type(self).__name__ + f"({options})"
+
+    @property
+    def _bounded(self) -> bool:
+        return self.max_size is not None or self.max_bytes is not None
+
+    def _is_full(self, length: int, n_bytes: int, size: int) -> bool:
+        return (self.max_size is not None and length >= self.max_size) or (
+            self.max_bytes is not None and n_bytes + size > self.max_bytes
+        )
+
+    @property
+    @abstractmethod
+    def bytes_used(self) -> int:
+        """Estimated size of stored values in bytes."""
+
+    @abstractmethod
+    def get(self, key: str) -> object | None:
+        """
+        Get a value and mark it recently used.
+
+        Parameters
+        ----------
+        key
+            key of the value
+
+        Returns
+        -------
+        object | None
+            stored value, or ``None`` if not found
+        """
+
+    @abstractmethod
+    def set(self, key: str, value: object, expires_at: float | None) -> None:
+        """
+        Store a value and mark it recently used.
+
+        Parameters
+        ----------
+        key
+            key of the value
+        value
+            value to store
+        expires_at
+            timestamp after which the value can be discarded,
+            ``None`` if the value doesn't expire
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Delete a value if it exists.
+
+        Parameters
+        ----------
+        key
+            key of the value
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Delete all values."""
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Return the number of stored values."""
+
+
+def _estimate_size(obj: object) -> int:
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        size += sum(_estimate_size(k) + _estimate_size(v) for k, v in obj.items())
+    elif isinstance(obj, (list, tuple)):
+        size += sum(_estimate_size(item) for item in obj)
+    elif isinstance(obj, Response):
+        size += sum(_estimate_size(v) for v in vars(obj).values())
+    return size
+
+
+class MemoryCacheStorage(CacheStorage):
+    """
+    Store cached values in memory.
+
+    The values are local to the process and lost when it exits.
+    Usage is tracked in constant time, and expired values are discarded
+    lazily from a heap ordered by expiry only when the storage is full.
+    The size of values is estimated recursively with :func:`sys.getsizeof`.
+
+    Parameters
+    ----------
+    max_size
+        maximum number of values stored
+    max_bytes
+        maximum estimated size of stored values in bytes
+    """
+
+    def __init__(
+        self, max_size: int | None = None, max_bytes: int | None = None
+    ) -> None:
+        super().__init__(max_size, max_bytes)
+        self._items: OrderedDict[str, tuple[object, float | None, int]] = OrderedDict()
+        self._expiry: list[tuple[float, str]] = []
+        self._bytes = 0
+
+    @property
+    def bytes_used(self) -> int:
+        """Estimated size of stored values in bytes."""
+        return self._bytes
+
+    def _push_expiry(self, key: str, expires_at: float | None) -> None:
+        if not self._bounded or expires_at is None:
+            return
+
+        heapq.heappush(self._expiry, (expires_at, key))
+        if len(self._expiry) > 2 * len(self._items) + 16:
+            self._expiry = [
+                (item[1], k) for k, item in self._items.items() if item[1] is not None
+            ]
+            heapq.heapify(self._expiry)
+
+    def _remove_expired_items(self) -> None:
+        now = time.time()
+        while self._expiry and self._expiry[0][0] <= now:
+            expires_at, key = heapq.heappop(self._expiry)
+            item = self._items.get(key, None)
+            if item is not None and item[1] == expires_at:
+                self._evict(key)
+
+    def _evict(self, key: str) -> None:
+        self.delete(key)
+        self.evictions += 1
+
+    def _make_room(self, size: int) -> None:
+        if not self._is_full(len(self._items), self._bytes, size):
+            return
+
+        self._remove_expired_items()
+        while self._items and self._is_full(len(self._items), self._bytes, size):
+            self._evict(next(iter(self._items)))
+
+    def get(self, key: str) -> object | None:
+        """Get a value and mark it recently used."""
+        item = self._items.get(key, None)
+        if item is None:
+            return None
+
+        self._items.move_to_end(key)
+        return item[0]
+
+    def set(self, key: str, value: object, expires_at: float | None) -> None:
+        """Store a value and mark it recently used."""
+        size = _estimate_size(value)
+        self.delete(key)
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        self._make_room(size)
+        self._items[key] = (value, expires_at, size)
+        self._bytes += size
+        self._push_expiry(key, expires_at)
+
+    def delete(self, key: str) -> None:
+        """Delete a value if it exists."""
+        item = self._items.pop(key, None)
+        if item is not None:
+            self._bytes -= item[2]
+
+    def clear(self) -> None:
+        """Delete all values."""
+        self._items.clear()
+        self._expiry.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        """Return the number of stored values."""
+        return len(self._items)
+
+
+def _encode(value: object) -> str:
+    def default(obj: object) -> dict:
+        if isinstance(obj, Response):
+            return {"__response__": asdict(obj)}
+        msg = f"Value of type {type(obj).__name__} cannot be stored!"
+        raise TypeError(msg)
+
+    return json.dumps(value, default=default)
+
+
+def _decode(value: str) -> object:
+    def object_hook(obj: dict) -> object:
+        if "__response__" in obj:
+            return Response(**obj["__response__"])
+        return obj
+
+    return json.loads(value, object_hook=object_hook)
+
+
+class SQLiteCacheStorage(CacheStorage):
+    """
+    Store cached values in an SQLite database.
+
+    The values persist between runs, and the database file can be shared
+    between processes on the same host, which then share cached responses.
+    Values are stored as JSON, so they are loaded as new objects.
+    The size of values is the length of their JSON encoding.
+
+    Parameters
+    ----------
+    path
+        path to the database file
+    max_size
+        maximum number of values stored
+    max_bytes
+        maximum size of stored values in bytes
+    timeout
+        seconds to wait for other processes to release the database
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_size: int | None = None,
+        max_bytes: int | None = None,
+        timeout: float = 10,
+    ) -> None:
+        super().__init__(max_size, max_bytes)
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(
+            path, timeout=timeout, check_same_thread=False, isolation_level=None
+        )
+        with self._lock:
+            self._connection.execute("PRAGMA journal_mode=WAL")
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, "
+                "expires_at REAL, used INTEGER NOT NULL, size INTEGER NOT NULL)"
+            )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS cache_used ON cache (used, size)"
+            )
+
+    def __repr__(self) -> str:
+        options = f"max_size={self.max_size}, max_bytes={self.max_bytes}"
+        return type(self).__name__ + f"(path={self.path!r}, {options})"
+
+    def _execute(self, sql: str, *params) -> list:
+        with self._lock:
+            return self._connection.execute(sql, params).fetchall()
+
+    @property
+    def bytes_used(self) -> int:
+        """Size of stored values in bytes."""
+        return self._execute("SELECT COALESCE(SUM(size), 0) FROM cache")[0][0]
+
+    def get(self, key: str) -> object | None:
+        """Get a value and mark it recently used."""
+        with self._lock:
+            execute = self._connection.execute
+            row = execute("SELECT value FROM cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            execute(
+                "UPDATE cache SET used = "
+                "(SELECT COALESCE(MAX(used), 0) + 1 FROM cache) WHERE key = ?",
+                (key,),
+            )
+        return _decode(row[0])
+
+    def set(self, key: str, value: object, expires_at: float | None) -> None:
+        """Store a value and mark it recently used."""
+        encoded = _encode(value)
+        size = len(encoded.encode())
+        with self._lock:
+            self._connection.execute("BEGIN IMMEDIATE")
+            try:
+                self._connection.execute("DELETE FROM cache WHERE key = ?", (key,))
+                if self.max_bytes is not None and size > self.max_bytes:
+                    self._connection.execute("COMMIT")
+                    return
+                self._make_room(size)
+                self._connection.execute(
+                    "INSERT INTO cache (key, value, expires_at, used, size) "
+                    "VALUES (?, ?, ?, "
+                    "(SELECT COALESCE(MAX(used), 0) + 1 FROM cache), ?)",
+                    (key, encoded, expires_at, size),
+                )
+            except BaseException:
+                self._connection.execute("ROLLBACK")
+                raise
+            self._connection.execute("COMMIT")
+
+    def _make_room(self, size: int) -> None:
+        if not self._bounded:
+            return
+
+        execute = self._connection.execute
+        length, n_bytes = execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM cache"
+        ).fetchone()
+        if not self._is_full(length, n_bytes, size):
+            return
+
+        expired = execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        max_length = self.max_size - 1 if self.max_size is not None else None
+        max_bytes = self.max_bytes - size if self.max_bytes is not None else None
+        evicted = execute(
+            "DELETE FROM cache WHERE key IN ("
+            "SELECT key FROM ("
+            "SELECT key, "
+            "ROW_NUMBER() OVER (ORDER BY used DESC) AS n, "
+            "SUM(size) OVER (ORDER BY used DESC) AS total FROM cache"
+            ") WHERE n > COALESCE(?, n) OR total > COALESCE(?, total))",
+            (max_length, max_bytes),
+        )
+        self.evictions += expired.rowcount + evicted.rowcount
+
+    def delete(self, key: str) -> None:
+        """Delete a value if it exists."""
+        self._execute("DELETE FROM cache WHERE key = ?", key)
+
+    def clear(self) -> None:
+        """Delete all values."""
+        self._execute("DELETE FROM cache")
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def __len__(self) -> int:
+        """Return the number of stored values."""
+        return self._execute("SELECT COUNT(*) FROM cache")[0][0]
@@ -13,6 +13,7 @@ from tekore._model import (
     Category,
     CategoryPaging,
     Chapter,
+    ColumnarAudioAnalysis,
     Context,
     ContextType,
     Copyright,
@@ -24,6 +25,7 @@ from tekore._model import (
     Device,
     DeviceType,
     Disallows,
+    EntityStore,
     Episode,
     ExplicitContent,
     Followers,
@@ -42,7 +44,10 @@ from tekore._model import (
     FullTrackPaging,
     Identifiable,
     Image,
+    Interner,
+    IntervalColumns,
     Item,
+    LazyItems,
     LocalAlbum,
     LocalArtist,
     LocalItem,
@@ -78,7 +83,9 @@ from tekore._model import (
     SavedTrack,
     SavedTrackPaging,
     Section,
+    SectionColumns,
     Segment,
+    SegmentColumns,
     Show,
     SimpleAlbum,
     SimpleAlbumPaging,
@@ -102,6 +109,8 @@ from tekore._model import (
     Tracks,
     UnknownModelAttributeWarning,
     User,
+    compact,
+    compact_type,
 )
 
 # Change the module of classes to hide module structure
@@ -124,6 +133,10 @@ _classes = [
     TimeInterval,
     Section,
     Segment,
+    ColumnarAudioAnalysis,
+    IntervalColumns,
+    SectionColumns,
+    SegmentColumns,
     AudioFeatures,
     Author,
     Narrator,
@@ -171,6 +184,7 @@ _classes = [
     OffsetPaging,
     Cursor,
     CursorPaging,
+    LazyItems,
     PlayHistory,
     PlayHistoryCursor,
     PlayHistoryPaging,
@@ -208,6 +222,10 @@ _classes = [
     PublicUser,
     Model,
     StrEnum,
+    Interner,
+    EntityStore,
+    compact,
+    compact_type,
 ]
 
 for _cls in _classes:
@@ -1,11 +1,15 @@
 import asyncio
+import threading
+import time
 from inspect import getmembers, ismethod
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
-from tekore import BadRequest, Scope, Spotify, Unauthorised
-from tekore._client.chunked import chunked, return_last, return_none
+from tekore import BadRequest, Response, Scope, Spotify, Unauthorised
+from tekore._client.chunked import chunked, join_lists, return_last, return_none
+from tekore._client.decor import stored_entities
+from tekore.model import EntityStore, FullArtist, Interner
 
 
 @pytest.fixture
@@ -64,6 +68,16 @@ class TestSpotifyUnits:
             client.max_limits_on = True
         assert client.max_limits_on is False
 
+    def test_chunked_concurrency_used_in_context(self, client):
+        with client.chunked(on=True, concurrency=4):
+            assert client.chunked_concurrency == 4
+        assert client.chunked_concurrency == 1
+
+    def test_chunked_context_keeps_concurrency_if_not_specified(self):
+        client = Spotify("token", chunked_concurrency=4)
+        with client.chunked(on=True):
+            assert client.chunked_concurrency == 4
+
     def test_set_chunked_without_context(self, client):
         client.chunked_on = True
         assert client.chunked_on is True
@@ -87,6 +101,65 @@ class TestSpotifyUnits:
             client.chunked_on = True
         assert client.chunked_on is False
 
+    def test_set_lazy_without_context(self, client):
+        client.lazy_on = True
+        assert client.lazy_on is True
+
+    def test_new_lazy_used_in_context(self, client):
+        with client.lazy(on=True):
+            assert client.lazy_on is True
+
+    def test_old_lazy_restored_after_context(self, client):
+        with client.lazy(on=True):
+            pass
+        assert client.lazy_on is False
+
+    def test_set_raw_without_context(self, client):
+        client.raw_on = True
+        assert client.raw_on is True
+
+    def test_new_raw_used_in_context(self, client):
+        with client.raw(on=True):
+            assert client.raw_on is True
+
+    def test_old_raw_restored_after_context(self, client):
+        with client.raw(on=True):
+            pass
+        assert client.raw_on is False
+
+    def test_set_trusted_without_context(self, client):
+        client.trusted_on = True
+        assert client.trusted_on is True
+
+    def test_new_trusted_used_in_context(self, client):
+        with client.trusted(on=True):
+            assert client.trusted_on is True
+
+    def test_old_trusted_restored_after_context(self, client):
+        with client.trusted(on=True):
+            pass
+        assert client.trusted_on is False
+
+    def test_set_interner_without_context(self, client):
+        interner = Interner()
+        client.interner = interner
+        assert client.interner is interner
+
+    def test_old_interner_restored_after_context(self, client):
+        with client.interning(Interner()):
+            pass
+        assert client.interner is None
+
+    def test_set_entity_store_without_context(self, client):
+        store = EntityStore()
+        client.entity_store = store
+        assert client.entity_store is store
+
+    def test_old_entity_store_restored_after_context(self, client):
+        with client.storing_entities(EntityStore()):
+            pass
+        assert client.entity_store is None
+
     @pytest.mark.asyncio
     async def test_token_async_interrupt_preserves_context(self, client):
         async def do_a():
@@ -158,13 +231,20 @@ class TestSpotifyUnits:
         # Skip non-endpoint functions
         skips = {
             "send",
+            "stream",
             "close",
             "next",
             "previous",
             "all_pages",
             "all_items",
+            "all_items_parallel",
             "chunked",
             "max_limits",
+            "lazy",
+            "raw",
+            "trusted",
+            "interning",
+            "storing_entities",
             "token_as",
             "follow_short_link",
         }
@@ -301,13 +381,43 @@ class TestSpotifyChunked:
         client.close()
 
 
-def mock_spotify():
+def mock_spotify(is_async: bool = False, concurrency: int = 1):
     slf = MagicMock()
     slf.chunked_on = True
-    slf.is_async = False
+    slf.chunked_concurrency = concurrency
+    slf.is_async = is_async
     return slf
 
 
+def tracking_function():
+    state = {"running": 0, "max_running": 0}
+
+    async def func(_, a, *_args, **_kwargs):
+        state["running"] += 1
+        state["max_running"] = max(state["max_running"], state["running"])
+        await sleep(a[0] % 3)
+        state["running"] -= 1
+        return [a[0]]
+
+    return func, state
+
+
+def threaded_tracking_function():
+    state = {"running": 0, "max_running": 0}
+    lock = threading.Lock()
+
+    def func(_, a, *_args, **_kwargs):
+        with lock:
+            state["running"] += 1
+            state["max_running"] = max(state["max_running"], state["running"])
+        time.sleep(0.01 * (a[0] % 3 + 1))
+        with lock:
+            state["running"] -= 1
+        return [a[0]]
+
+    return func, state
+
+
 class TestSpotifyChunkedUnit:
     def test_chunked_return_none(self):
         func = MagicMock()
@@ -381,3 +491,236 @@ class TestSpotifyChunkedUnit:
         dec = chunked("a", 2, 10, return_last)(func)
         r = dec(mock_spotify(), 0, a=list(range(20)))
         assert r == 1
+
+    @pytest.mark.asyncio
+    async def test_async_concurrent_chunks_preserve_order(self):
+        func, state = tracking_function()
+
+        dec = chunked("a", 1, 1, join_lists)(func)
+        r = await dec(mock_spotify(is_async=True, concurrency=3), list(range(10)))
+        assert r == list(range(10))
+        assert state["max_running"] == 3
+
+    @pytest.mark.asyncio
+    async def test_async_chunks_sequential_by_default(self):
+        func, state = tracking_function()
+
+        dec = chunked("a", 1, 1, join_lists)(func)
+        r = await dec(mock_spotify(is_async=True), list(range(5)))
+        assert r == list(range(5))
+        assert state["max_running"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_chained_chunks_not_concurrent(self):
+        func, state = tracking_function()
+
+        dec = chunked("a", 1, 1, join_lists, chain="ch", chain_pos=2)(func)
+        r = await dec(mock_spotify(is_async=True, concurrency=3), list(range(5)))
+        assert r == list(range(5))
+        assert state["max_running"] == 1
+
+    @pytest.mark.asyncio
+    async def test_async_reversible_chunks_not_concurrent(self):
+        func, state = tracking_function()
+
+        dec = chunked("a", 1, 1, join_lists, reverse="rev", reverse_pos=2)(func)
+        r = await dec(mock_spotify(is_async=True, concurrency=3), list(range(5)))
+        assert r == list(range(5))
+        assert state["max_running"] == 1
+
+    def test_threaded_chunks_preserve_order(self):
+        func, state = threaded_tracking_function()
+
+        dec = chunked("a", 1, 1, join_lists)(func)
+        r = dec(mock_spotify(concurrency=3), list(range(10)))
+        assert r == list(range(10))
+        assert 1 < state["max_running"] <= 3
+
+    def test_threaded_chained_chunks_not_concurrent(self):
+        func, state = threaded_tracking_function()
+
+        dec = chunked("a", 1, 1, join_lists, chain="ch", chain_pos=2)(func)
+        r = dec(mock_spotify(concurrency=3), list(range(5)))
+        assert r == list(range(5))
+        assert state["max_running"] == 1
+
+    def test_threaded_chunks_see_context(self, client):
+        def func(slf, _):
+            return [slf.token]
+
+        dec = chunked("a", 1, 1, join_lists)(func)
+        with client.chunked(on=True, concurrency=2), client.token_as("new"):
+            r = dec(client, list(range(4)))
+        assert r == ["new"] * 4
+
+
+def artist_json(id_: str) -> dict:
+    return {
+        "id": id_,
+        "href": "href",
+        "type": "artist",
+        "uri": "uri",
+        "external_urls": {"spotify": "url"},
+        "name": "name",
+        "followers": {"href": None, "total": 0},
+        "genres": [],
+        "images": [],
+        "popularity": 0,
+    }
+
+
+def artists_sender(is_async: bool = False) -> MagicMock:
+    def send(request):
+        ids = request.params["ids"].split(",")
+        content = {"artists": [artist_json(i) for i in ids]}
+        return Response(request.url, {}, 200, content)
+
+    sender = MagicMock()
+    sender.is_async = is_async
+    sender.send = (
+        AsyncMock(side_effect=send) if is_async else MagicMock(side_effect=send)
+    )
+    return sender
+
+
+def track_json(id_: str) -> dict:
+    item = {"href": "href", "uri": "uri", "external_urls": {}}
+    artists = [{**item, "id": "artist", "type": "artist", "name": "name"}]
+    album = {
+        **item,
+        "id": "album",
+        "type": "album",
+        "album_type": "album",
+        "artists": artists,
+        "images": [],
+        "name": "name",
+        "total_tracks": 1,
+        "release_date": "2020",
+        "release_date_precision": "year",
+    }
+    return {
+        **item,
+        "id": id_,
+        "type": "track",
+        "artists": artists,
+        "disc_number": 1,
+        "duration_ms": 1,
+        "explicit": False,
+        "is_local": False,
+        "name": "name",
+        "preview_url": None,
+        "track_number": 1,
+        "album": album,
+        "external_ids": {},
+        "popularity": 1,
+    }
+
+
+def search_sender() -> MagicMock:
+    def send(request):
+        paging = {
+            "href": "href",
+            "items": [track_json("a")],
+            "limit": 1,
+            "next": None,
+            "offset": 0,
+            "previous": None,
+            "total": 1,
+        }
+        return Response(request.url, {}, 200, {"tracks": paging})
+
+    sender = MagicMock()
+    sender.is_async = False
+    sender.send = MagicMock(side_effect=send)
+    return sender
+
+
+class TestSpotifyTrusted:
+    def test_trusted_models_equal_validated(self):
+        client = Spotify("token", sender=artists_sender())
+        validated = client.artists(["a", "b"])
+        with client.trusted():
+            trusted = client.artists(["a", "b"])
+        assert trusted == validated
+
+    def test_trusted_values_not_coerced(self):
+        sender = artists_sender()
+        send = sender.send.side_effect
+
+        def send_string_popularity(request):
+            response = send(request)
+            response.content["artists"][0]["popularity"] = "5"
+            return response
+
+        sender.send.side_effect = send_string_popularity
+        client = Spotify("token", sender=sender)
+        assert client.artists(["a"])[0].popularity == 5
+        with client.trusted():
+            assert client.artists(["a"])[0].popularity == "5"
+
+    def test_raw_takes_precedence(self):
+        client = Spotify("token", sender=artists_sender())
+        with client.trusted(), client.raw():
+            assert client.artists(["a"]) == [artist_json("a")]
+
+
+class TestSpotifyEntityStore:
+    def test_single_served_from_batch(self):
+        sender = artists_sender()
+        client = Spotify("token", sender=sender, entity_store=EntityStore())
+        artists = client.artists(["a", "b"])
+        assert client.artist("b") is artists[1]
+        assert sender.send.call_count == 1
+
+    def test_batch_requests_only_missing(self):
+        sender = artists_sender()
+        client = Spotify("token", sender=sender, entity_store=EntityStore())
+        client.artists(["a", "b"])
+        artists = client.artists(["c", "b", "a", "c"])
+        assert [a.id for a in artists] == ["c", "b", "a", "c"]
+        assert sender.send.call_args.args[0].params["ids"] == "c"
+
+    @pytest.mark.asyncio
+    async def test_async_batch_requests_only_missing(self):
+        sender = artists_sender(is_async=True)
+        client = Spotify("token", sender=sender, entity_store=EntityStore())
+        await client.artists(["a"])
+        artists = await client.artists(["a", "b"])
+        assert [a.id for a in artists] == ["a", "b"]
+        assert await client.artist("b") is artists[1]
+        assert sender.send.call_count == 2
+
+    def test_single_served_from_search(self):
+        sender = search_sender()
+        client = Spotify("token", sender=sender, entity_store=EntityStore())
+        (tracks,) = client.search("x", types=("track",))
+        assert client.track("a") is tracks.items[0]
+        assert sender.send.call_count == 1
+
+    def test_raw_mode_always_sent(self):
+        sender = artists_sender()
+        client = Spotify("token", sender=sender, entity_store=EntityStore())
+        client.artists(["a"])
+        with client.raw():
+            assert client.artists(["a"]) == [artist_json("a")]
+        assert sender.send.call_count == 2
+
+    def test_other_arguments_always_sent(self):
+        store = EntityStore()
+        store.put(FullArtist(**artist_json("a")))
+        slf = mock_spotify()
+        slf.entity_store = store
+        slf.raw_on = False
+        func = MagicMock()
+
+        dec = stored_entities(FullArtist, "artist_id", 1)(func)
+        assert dec(slf, "a").id == "a"
+        dec(slf, "a", market="FI")
+        func.assert_called_once_with(slf, "a", market="FI")
+
+    def test_without_store_always_sent(self):
+        sender = artists_sender()
+        client = Spotify("token", sender=sender)
+        client.artists(["a"])
+        client.artists(["a"])
+        assert sender.send.call_count == 2
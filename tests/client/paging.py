@@ -1,7 +1,72 @@
+import asyncio
+import threading
+from unittest.mock import MagicMock
+from urllib.parse import parse_qs, urlsplit
+
 import pytest
 
+from tekore import Request, Response, Spotify
+from tekore.model import CategoryPaging, CursorPaging, Interner, LazyItems, OffsetPaging
+from tests._util import AsyncMock
+
 from ._resources import album_id
 
+base_url = "https://api.spotify.com/v1/items"
+
+
+class IntPaging(OffsetPaging):
+    items: list[int]
+
+
+class IntCursorPaging(CursorPaging):
+    items: list[int]
+
+
+def offset_json(offset: int, total: int = 10, limit: int = 2) -> dict:
+    def url(o: int) -> str:
+        return f"{base_url}?market=SE&offset={o}&limit={limit}"
+
+    return {
+        "href": url(offset),
+        "items": list(range(offset, min(offset + limit, total))),
+        "limit": limit,
+        "next": url(offset + limit) if offset + limit < total else None,
+        "offset": offset,
+        "previous": url(offset - limit) if offset > 0 else None,
+        "total": total,
+    }
+
+
+def cursor_json(after: int, total: int = 10, limit: int = 2) -> dict:
+    last = min(after + limit, total)
+    next_ = f"{base_url}?after={last}&limit={limit}" if last < total else None
+    return {
+        "href": f"{base_url}?after={after}&limit={limit}",
+        "items": list(range(after, last)),
+        "limit": limit,
+        "next": next_,
+        "cursors": {"after": str(last)},
+    }
+
+
+def paging_response(request, total: int = 10) -> Response:
+    query = parse_qs(urlsplit(request.url).query)
+    if "after" in query:
+        content = cursor_json(int(query["after"][0]), total)
+    else:
+        content = offset_json(int(query["offset"][0]), total)
+    return Response(url=request.url, headers={}, status_code=200, content=content)
+
+
+def mock_client(side_effect=paging_response, is_async: bool = False) -> Spotify:
+    sender = MagicMock()
+    sender.is_async = is_async
+    if is_async:
+        sender.send = AsyncMock(side_effect=side_effect)
+    else:
+        sender.send.side_effect = side_effect
+    return Spotify("token", sender=sender)
+
 
 @pytest.fixture(scope="class")
 def tracks(data_client):
@@ -13,6 +78,269 @@ def played(data_client):
     return data_client.playback_recently_played()
 
 
+class TestSpotifyPagingUnits:
+    def test_all_items_without_prefetch(self):
+        client = mock_client()
+        items = list(client.all_items(IntPaging(**offset_json(0))))
+        assert items == list(range(10))
+
+    def test_all_items_with_prefetch_in_order(self):
+        client = mock_client()
+        items = list(client.all_items(IntPaging(**offset_json(0)), prefetch=3))
+        assert items == list(range(10))
+        assert client.sender.send.call_count == 4
+
+    def test_prefetch_keeps_query_parameters(self):
+        client = mock_client()
+        list(client.all_pages(IntPaging(**offset_json(0)), prefetch=2))
+        for call in client.sender.send.call_args_list:
+            assert "market=SE" in call.args[0].url
+
+    def test_prefetch_stops_when_total_shrinks(self):
+        client = mock_client(lambda r: paging_response(r, total=5))
+        pages = list(client.all_pages(IntPaging(**offset_json(0)), prefetch=3))
+        assert [i for p in pages for i in p.items] == list(range(5))
+        assert pages[-1].next is None
+
+    def test_prefetch_follows_next_when_total_grows(self):
+        client = mock_client(lambda r: paging_response(r, total=14))
+        items = list(client.all_items(IntPaging(**offset_json(0)), prefetch=3))
+        assert items == list(range(14))
+
+    def test_prefetch_stops_on_bad_request(self):
+        def side_effect(request):
+            if "offset=6" in request.url:
+                return Response(request.url, {}, 400, None)
+            return paging_response(request)
+
+        client = mock_client(side_effect)
+        items = list(client.all_items(IntPaging(**offset_json(0)), prefetch=2))
+        assert items == list(range(6))
+
+    def test_prefetch_single_page(self):
+        client = mock_client()
+        page = IntPaging(**offset_json(0, total=2))
+        pages = list(client.all_pages(page, prefetch=3))
+        assert pages == [page]
+        client.sender.send.assert_not_called()
+
+    def test_all_items_parallel_in_order(self):
+        client = mock_client()
+        items = client.all_items_parallel(IntPaging(**offset_json(0)), concurrency=4)
+        assert items == list(range(10))
+
+    def test_all_items_parallel_from_middle_page(self):
+        client = mock_client()
+        items = client.all_items_parallel(IntPaging(**offset_json(4)), concurrency=4)
+        assert items == list(range(4, 10))
+
+    def test_all_items_parallel_when_total_grows(self):
+        totals = iter([10, 10, 16, 16, 16, 16, 16, 16])
+        client = mock_client(lambda r: paging_response(r, total=next(totals)))
+        items = client.all_items_parallel(IntPaging(**offset_json(0)), concurrency=1)
+        assert items == list(range(16))
+
+    def test_all_items_parallel_when_total_shrinks(self):
+        client = mock_client(lambda r: paging_response(r, total=3))
+        items = client.all_items_parallel(IntPaging(**offset_json(0)), concurrency=4)
+        assert items == list(range(3))
+
+    @pytest.mark.asyncio
+    async def test_async_all_items_parallel_in_order(self):
+        client = mock_client(is_async=True)
+        page = IntPaging(**offset_json(0))
+        items = await client.all_items_parallel(page, concurrency=4)
+        assert items == list(range(10))
+
+    def test_prefetch_cursor_paging(self):
+        client = mock_client()
+        items = list(client.all_items(IntCursorPaging(**cursor_json(0)), prefetch=2))
+        assert items == list(range(10))
+
+    def test_prefetch_cursor_paging_requests_next_while_page_is_used(self):
+        requested = threading.Event()
+
+        def side_effect(request):
+            requested.set()
+            return paging_response(request)
+
+        client = mock_client(side_effect)
+        pages = client.all_pages(IntCursorPaging(**cursor_json(0)), prefetch=2)
+        first = next(pages)
+        assert requested.wait(timeout=1)
+        assert first.items == [0, 1]
+        assert [i for p in pages for i in p.items] == list(range(2, 10))
+
+    @pytest.mark.asyncio
+    async def test_async_prefetch_cursor_paging_requests_next_while_page_is_used(self):
+        client = mock_client(is_async=True)
+        pages = client.all_pages(IntCursorPaging(**cursor_json(0)), prefetch=2)
+        await pages.__anext__()
+        await asyncio.sleep(0)
+        assert client.sender.send.call_count == 1
+        second = await pages.__anext__()
+        await asyncio.sleep(0)
+        assert second.items == [2, 3]
+        assert client.sender.send.call_count == 2
+        await pages.aclose()
+
+    @pytest.mark.asyncio
+    async def test_async_all_items_with_prefetch_in_order(self):
+        client = mock_client(is_async=True)
+        page = IntPaging(**offset_json(0))
+        items = [i async for i in client.all_items(page, prefetch=3)]
+        assert items == list(range(10))
+        assert client.sender.send.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_async_prefetch_follows_next_when_total_grows(self):
+        client = mock_client(lambda r: paging_response(r, total=14), is_async=True)
+        page = IntPaging(**offset_json(0))
+        items = [i async for i in client.all_items(page, prefetch=3)]
+        assert items == list(range(14))
+
+    @pytest.mark.asyncio
+    async def test_async_prefetch_cursor_paging(self):
+        client = mock_client(is_async=True)
+        page = IntCursorPaging(**cursor_json(0))
+        items = [i async for i in client.all_items(page, prefetch=2)]
+        assert items == list(range(10))
+
+
+def category_response(request) -> Response:
+    query = parse_qs(urlsplit(request.url).query)
+    content = offset_json(int(query.get("offset", ["0"])[0]))
+    content["items"] = [
+        {"href": "href", "icons": [], "id": str(i), "name": "name"}
+        for i in content["items"]
+    ]
+    content = {"categories": content}
+    return Response(url=request.url, headers={}, status_code=200, content=content)
+
+
+class TestSpotifyPagingLazy:
+    def test_endpoint_returns_lazy_items(self):
+        client = mock_client(category_response)
+        with client.lazy():
+            page = client.categories()
+        assert isinstance(page.items, LazyItems)
+        assert page.items[1].id == "1"
+
+    def test_endpoint_returns_eager_items_by_default(self):
+        client = mock_client(category_response)
+        page = client.categories()
+        assert isinstance(page.items, list)
+
+    def test_next_returns_lazy_items(self):
+        client = mock_client(category_response)
+        json = category_response(Request("GET", base_url)).content["categories"]
+        page = CategoryPaging(**json)
+        client.lazy_on = True
+        assert isinstance(client.next(page).items, LazyItems)
+
+    def test_all_items_from_lazy_paging(self):
+        client = mock_client(category_response)
+        with client.lazy():
+            page = client.categories()
+            ids = [item.id for item in client.all_items(page)]
+        assert ids == [str(i) for i in range(10)]
+
+    @pytest.mark.asyncio
+    async def test_async_endpoint_returns_lazy_items(self):
+        client = mock_client(category_response, is_async=True)
+        with client.lazy():
+            page = await client.categories()
+            previous = await client.previous(await client.next(page))
+        assert isinstance(previous.items, LazyItems)
+        assert previous.items[0].id == "0"
+
+
+class TestSpotifyPagingRaw:
+    def test_endpoint_returns_json(self):
+        client = mock_client(category_response)
+        with client.raw():
+            page = client.categories()
+        assert page["items"][0] == {
+            "href": "href",
+            "icons": [],
+            "id": "0",
+            "name": "name",
+        }
+
+    def test_raw_takes_precedence_over_lazy(self):
+        client = mock_client(category_response)
+        with client.raw(), client.lazy():
+            page = client.categories()
+        assert isinstance(page, dict)
+
+    def test_search_returns_tuple_of_json(self):
+        def side_effect(request):
+            content = {"tracks": offset_json(0), "albums": offset_json(0)}
+            return Response(request.url, {}, 200, content)
+
+        client = mock_client(side_effect)
+        with client.raw():
+            tracks, albums = client.search("query", types=("track", "album"))
+        assert tracks == offset_json(0)
+        assert albums == offset_json(0)
+
+    def test_next_of_json_returns_json(self):
+        client = mock_client()
+        page = client.next(offset_json(0))
+        assert page == offset_json(2)
+
+    def test_previous_of_json_returns_json(self):
+        client = mock_client()
+        page = client.previous(offset_json(2))
+        assert page == offset_json(0)
+
+    def test_all_items_of_json(self):
+        client = mock_client()
+        items = list(client.all_items(offset_json(0)))
+        assert items == list(range(10))
+
+    def test_all_items_of_json_with_prefetch(self):
+        client = mock_client()
+        items = list(client.all_items(offset_json(0), prefetch=3))
+        assert items == list(range(10))
+        assert client.sender.send.call_count == 4
+
+    def test_all_items_of_cursor_json_with_prefetch(self):
+        client = mock_client()
+        items = list(client.all_items(cursor_json(0), prefetch=2))
+        assert items == list(range(10))
+
+    @pytest.mark.asyncio
+    async def test_async_all_items_parallel_of_json(self):
+        client = mock_client(category_response, is_async=True)
+        with client.raw():
+            page = await client.categories()
+        items = await client.all_items_parallel(page, concurrency=4)
+        assert [item["id"] for item in items] == [str(i) for i in range(10)]
+
+
+class TestSpotifyPagingInterning:
+    def test_endpoint_results_share_values(self):
+        client = mock_client(category_response)
+        with client.interning(Interner()):
+            first = client.categories()
+            second = client.categories()
+        assert first is second
+
+    def test_raw_results_share_values(self):
+        client = mock_client(category_response)
+        with client.interning(Interner()), client.raw():
+            page = client.categories()
+        assert page["items"][0]["icons"] is page["items"][1]["icons"]
+
+    def test_next_shares_values_with_previous_pages(self):
+        client = mock_client(category_response)
+        with client.interning(Interner()):
+            page = client.categories()
+            next_ = client.next(page)
+        assert next_.items[0].href is page.items[0].href
+
+
 @pytest.mark.api
 @pytest.mark.usefixtures("suppress_warnings")
 class TestSpotifyPaging:
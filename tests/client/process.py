@@ -0,0 +1,72 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from tekore import LazyResponse, NotFound, Spotify
+from tekore._client.process import model_list, single, validate_json, validate_list
+from tekore._model.serialise import Model, UnknownModelAttributeWarning
+from tekore.model import Category
+
+
+class Number(Model):
+    i: int
+
+
+def lazy_client(status_code: int, raw: bytes) -> tuple[Spotify, LazyResponse]:
+    response = LazyResponse("url", {}, status_code, raw)
+    sender = MagicMock()
+    sender.is_async = False
+    sender.send.return_value = response
+    return Spotify("token", sender=sender), response
+
+
+category = b'{"href": "h", "icons": [], "id": "c", "name": "n"}'
+
+
+class TestModelList:
+    def test_items_constructed(self):
+        post_func = model_list(Number, "numbers")
+        assert post_func({"numbers": [{"i": 1}, None]}) == [Number(i=1), None]
+
+    def test_invalid_item_raises(self):
+        with pytest.raises(ValueError, match="i"):
+            validate_list(Number, [{"i": 1}, {"i": "a"}])
+
+    def test_unknown_attribute_warns(self):
+        with pytest.warns(UnknownModelAttributeWarning, match="Number"):
+            validate_list(Number, [{"i": 1, "u": 2}])
+
+
+class TestValidateJson:
+    def test_single_from_bytes(self):
+        post_func = single(Number)
+        assert post_func.from_bytes(b'{"i": 1}') == Number(i=1)
+
+    def test_single_none_from_bytes(self):
+        post_func = single(Number, "number")
+        assert post_func.from_bytes(b'{"number": null}') is None
+
+    def test_list_from_item_skips_other_items(self):
+        raw = b'{"numbers": [{"i": 1}, null], "other": {"x": 1}}'
+        assert validate_json(Number, raw, "numbers", many=True) == [Number(i=1), None]
+
+    def test_unknown_attribute_warns(self):
+        with pytest.warns(UnknownModelAttributeWarning, match="Number"):
+            validate_json(Number, b'{"i": 1, "u": 2}', None)
+
+    def test_endpoint_does_not_parse_content(self):
+        client, response = lazy_client(200, category)
+        assert client.category("c") == Category(href="h", icons=[], id="c", name="n")
+        assert not response.parsed
+
+    def test_endpoint_in_raw_mode_parses_content(self):
+        client, response = lazy_client(200, category)
+        with client.raw():
+            assert client.category("c")["id"] == "c"
+        assert response.parsed
+
+    def test_error_content_decoded(self):
+        raw = b'{"error": {"status": 404, "message": "Not here"}}'
+        client, _ = lazy_client(404, raw)
+        with pytest.raises(NotFound, match="Not here"):
+            client.category("c")
@@ -0,0 +1,87 @@
+import json
+
+import pytest
+
+from tekore._client.stream import ObjectStreamParser
+
+document = {
+    "meta": {"status": "ok"},
+    "bars": [],
+    "segments": [{"start": i, "pitches": [0.5] * 12, "name": "ä"} for i in range(5)],
+    "number": 12345,
+    "flag": True,
+}
+
+
+def parse(data: bytes, size: int, streamed=("bars", "segments")) -> list:
+    parser = ObjectStreamParser(streamed)
+    items = []
+    for i in range(0, len(data), size):
+        items += parser.feed(data[i : i + size])
+    return items + parser.close()
+
+
+class TestObjectStreamParser:
+    @pytest.mark.parametrize("size", [1, 2, 7, 100_000])
+    def test_members_parsed_in_chunks(self, size):
+        data = json.dumps(document, ensure_ascii=False, indent=1).encode()
+        items = parse(data, size)
+        assert items == [
+            ("meta", {"status": "ok"}),
+            *[("segments", s) for s in document["segments"]],
+            ("number", 12345),
+            ("flag", True),
+        ]
+
+    def test_not_streamed_array_returned_whole(self):
+        data = json.dumps({"a": [1, 2]}).encode()
+        assert parse(data, 1, streamed=()) == [("a", [1, 2])]
+
+    def test_items_returned_as_soon_as_complete(self):
+        parser = ObjectStreamParser(["a"])
+        assert parser.feed(b'{"a": [{"b": 1}, {"b"') == [("a", {"b": 1})]
+        assert parser.feed(b": 2}]}") == [("a", {"b": 2})]
+        assert parser.close() == []
+
+    def test_trailing_number_waits_for_more_data(self):
+        parser = ObjectStreamParser()
+        assert parser.feed(b'{"a": 12') == []
+        assert parser.feed(b"3}") == [("a", 123)]
+
+    @pytest.mark.parametrize("size", range(1, 40))
+    def test_split_floats_and_exponents(self, size):
+        data = b'{"x": 12.5, "y": -3E+2, "segments": [1.5, 2.25e3, 7e-1], "z": 0.5}'
+        assert parse(data, size) == [
+            ("x", 12.5),
+            ("y", -300.0),
+            ("segments", 1.5),
+            ("segments", 2250.0),
+            ("segments", 0.7),
+            ("z", 0.5),
+        ]
+
+    def test_empty_object(self):
+        assert parse(b" { } ", 1) == []
+
+    def test_incomplete_document_raises(self):
+        parser = ObjectStreamParser()
+        parser.feed(b'{"a": 1')
+        with pytest.raises(ValueError, match="Incomplete"):
+            parser.close()
+
+    def test_invalid_value_raises_on_close(self):
+        parser = ObjectStreamParser()
+        parser.feed(b'{"a": nope}')
+        with pytest.raises(ValueError, match="Expecting value"):
+            parser.close()
+
+    @pytest.mark.parametrize("data", [b"[]", b'{"a" 1}', b"{1: 1}", b'{"a": 1]'])
+    def test_unexpected_character_raises(self, data):
+        with pytest.raises(ValueError, match="Expected"):
+            ObjectStreamParser().feed(data)
+
+    def test_data_after_end_raises(self):
+        parser = ObjectStreamParser()
+        parser.feed(b"{}")
+        with pytest.raises(ValueError, match="after the end"):
+            parser.feed(b"{}")
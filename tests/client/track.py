@@ -1,6 +1,9 @@
+import json
+
 import pytest
 
-from tekore import HTTPError
+from tekore import HTTPError, NotFound, Spotify
+from tekore.model import Segment, TimeInterval
 
 from ._resources import (
     album_id,
@@ -94,3 +97,64 @@ class TestSpotifyTrack:
     def test_tracks_from_token(self, user_client):
         tracks = user_client.tracks(track_ids, market="from_token")
         assert len(tracks) == len(track_ids)
+
+
+analysis = {
+    "meta": {"status_code": 0},
+    "track": {"duration": 1.0},
+    "bars": [{"start": 0.0, "duration": 1.0, "confidence": 0.5}],
+    "beats": [],
+    "sections": [],
+    "segments": [
+        {
+            "start": 0.0,
+            "duration": 1.0,
+            "loudness_start": -60.0,
+            "loudness_max": -50.0,
+            "pitches": [0.5] * 12,
+            "timbre": [1.0] * 12,
+        }
+    ],
+    "tatums": [],
+}
+
+
+class TestSpotifyTrackStream:
+    def test_audio_analysis_streamed(self, httpx_mock):
+        httpx_mock.add_response(content=json.dumps(analysis).encode())
+        client = Spotify("token")
+        parts = list(client.track_audio_analysis_stream(track_id))
+        assert [key for key, _ in parts] == ["meta", "track", "bars", "segments"]
+        assert isinstance(parts[2][1], TimeInterval)
+        assert isinstance(parts[3][1], Segment)
+        assert parts[3][1].pitches == [0.5] * 12
+
+    def test_audio_analysis_stream_error_raises(self, httpx_mock):
+        httpx_mock.add_response(404, json={"error": {"message": "Not found"}})
+        client = Spotify("token")
+        with pytest.raises(NotFound):
+            list(client.track_audio_analysis_stream(track_id))
+
+    @pytest.mark.asyncio
+    async def test_async_audio_analysis_streamed(self, httpx_mock):
+        httpx_mock.add_response(content=json.dumps(analysis).encode())
+        client = Spotify("token", asynchronous=True)
+        parts = [part async for part in client.track_audio_analysis_stream(track_id)]
+        await client.close()
+        assert [key for key, _ in parts] == ["meta", "track", "bars", "segments"]
+
+    @pytest.mark.asyncio
+    async def test_async_audio_analysis_stream_error_raises(self, httpx_mock):
+        httpx_mock.add_response(404, json={"error": {"message": "Not found"}})
+        client = Spotify("token", asynchronous=True)
+        with pytest.raises(NotFound):
+            [part async for part in client.track_audio_analysis_stream(track_id)]
+        await client.close()
+
+    def test_audio_analysis_columnar(self, httpx_mock):
+        pytest.importorskip("numpy")
+        httpx_mock.add_response(json=analysis)
+        client = Spotify("token")
+        columnar = client.track_audio_analysis_columnar(track_id)
+        assert columnar.segments.pitches.shape == (1, 12)
+        assert columnar.bars.confidence.tolist() == [0.5]
@@ -1,8 +1,28 @@
+import pickle
+import sys
 from datetime import datetime
+from unittest.mock import patch
 
 import pytest
 
 from tekore._model.serialise import Model, StrEnum, UnknownModelAttributeWarning
+from tekore._model.trusted import construct_trusted
+from tekore.model import (
+    AlbumType,
+    ColumnarAudioAnalysis,
+    EntityStore,
+    FullArtist,
+    FullPlaylistTrack,
+    Image,
+    Interner,
+    LazyItems,
+    LocalPlaylistTrack,
+    OffsetPaging,
+    PlaylistTrack,
+    SimpleArtist,
+    compact,
+    compact_type,
+)
 
 
 class E(StrEnum):
@@ -88,3 +108,461 @@ class TestModel:
         with pytest.raises(AttributeError):
             assert data.u
         assert "u" not in data.model_dump_json()
+
+    def test_unknown_attribute_in_nested_model_warns(self):
+        class Inner(Model):
+            i: int
+
+        class Outer(Model):
+            inner: Inner
+            inners: list[Inner]
+
+        with pytest.warns(UnknownModelAttributeWarning, match="Inner") as record:
+            outer = Outer(inner={"i": 1, "u": 2}, inners=[{"i": 1}])
+
+        assert len(record) == 1
+        assert outer.inner.model_dump() == {"i": 1}
+
+    def test_assigning_unknown_attribute_raises(self):
+        class Data(Model):
+            i: int
+
+        data = Data(i=1)
+        data.i = 2
+        with pytest.raises(ValueError, match="no field"):
+            data.u = 2
+        assert data.model_dump() == {"i": 2}
+
+    def test_schema_does_not_allow_unknown_attributes(self):
+        class Data(Model):
+            i: int
+
+        schema = Data.model_json_schema()
+        assert schema.get("additionalProperties", False) is False
+
+    def test_known_attributes_do_not_warn(self):
+        class Data(Model):
+            i: int
+            j: int = 0
+
+        assert Data(i=1).j == 0
+
+
+class Number(Model):
+    i: int
+
+
+class NumberPaging(OffsetPaging):
+    items: list[Number | None]
+
+
+class IntPaging(OffsetPaging):
+    items: list[int]
+
+
+def paging_json(items: list) -> dict:
+    return {
+        "href": "href",
+        "items": items,
+        "limit": len(items),
+        "next": None,
+        "offset": 0,
+        "previous": None,
+        "total": len(items),
+    }
+
+
+class TestLazyItems:
+    def test_items_not_validated_before_access(self):
+        paging = NumberPaging.lazy_validate(paging_json([{"i": 1}, {"i": "a"}]))
+        assert isinstance(paging.items, LazyItems)
+        assert paging.items[0] == Number(i=1)
+        with pytest.raises(ValueError, match="i"):
+            paging.items[1]
+
+    def test_item_validated_once(self):
+        paging = NumberPaging.lazy_validate(paging_json([{"i": 1}]))
+        assert paging.items[0] is paging.items[-1]
+
+    def test_none_item_kept(self):
+        paging = NumberPaging.lazy_validate(paging_json([None, {"i": 1}]))
+        assert list(paging.items) == [None, Number(i=1)]
+
+    def test_slice_validates_items_in_slice(self):
+        paging = NumberPaging.lazy_validate(paging_json([{"i": i} for i in range(4)]))
+        assert paging.items[1:3] == [Number(i=1), Number(i=2)]
+        assert "2/4 validated" in repr(paging.items)
+
+    def test_equal_to_eager_paging(self):
+        json = paging_json([{"i": 1}, None])
+        assert NumberPaging.lazy_validate(json) == NumberPaging(**json)
+
+    def test_dump_validates_items(self):
+        json = paging_json([{"i": 1}, None])
+        paging = NumberPaging.lazy_validate(json)
+        assert paging.model_dump() == NumberPaging(**json).model_dump()
+        assert isinstance(paging.items, list)
+
+    def test_non_model_items_validated_immediately(self):
+        paging = IntPaging.lazy_validate(paging_json([1, 2]))
+        assert paging.items == [1, 2]
+        assert isinstance(paging.items, list)
+
+
+def artist_json(i: int = 0) -> dict:
+    return {
+        "id": f"id{i}",
+        "href": "href",
+        "type": "artist",
+        "uri": "uri",
+        "external_urls": {"spotify": "url"},
+        "name": "name",
+    }
+
+
+def full_artist(i: int = 0) -> FullArtist:
+    return FullArtist(
+        **artist_json(i),
+        followers={"href": None, "total": 0},
+        genres=[],
+        images=[],
+        popularity=0,
+    )
+
+
+class TestEntityStore:
+    def test_stored_entity_returned(self):
+        store = EntityStore()
+        artist = full_artist()
+        store.put(artist)
+        assert store.get(FullArtist, "id0") is artist
+
+    def test_other_type_not_returned(self):
+        store = EntityStore()
+        store.put(full_artist())
+        assert store.get(SimpleArtist, "id0") is None
+
+    def test_expired_entity_discarded(self):
+        store = EntityStore(ttl=0)
+        store.put(full_artist())
+        assert store.get(FullArtist, "id0") is None
+        assert len(store) == 0
+
+    def test_least_recently_used_evicted(self):
+        store = EntityStore(max_size=2)
+        for i in range(2):
+            store.put(full_artist(i))
+        store.get(FullArtist, "id0")
+        store.put(full_artist(2))
+        assert store.get(FullArtist, "id0") is not None
+        assert store.get(FullArtist, "id1") is None
+
+    def test_nested_entities_recorded(self):
+        store = EntityStore()
+        store.record({"artists": [full_artist(0)]})
+        store.record([[full_artist(1)], SimpleArtist(**artist_json(2))])
+        assert store.get(FullArtist, "id0") is None
+        assert store.get(FullArtist, "id1") is not None
+        assert len(store) == 1
+
+    def test_tuple_entities_recorded(self):
+        store = EntityStore()
+        store.record(([full_artist(0)], full_artist(1)))
+        assert len(store) == 2
+
+    def test_clear(self):
+        store = EntityStore()
+        store.put(full_artist())
+        store.clear()
+        assert len(store) == 0
+
+
+class TestCompact:
+    def test_type_is_slotted_and_reused(self):
+        type_ = compact_type(Image)
+        assert type_.__name__ == "CompactImage"
+        assert type_.__slots__ == ("url", "height", "width")
+        assert compact_type(Image) is type_
+
+    def test_fields_copied(self):
+        artist = SimpleArtist(**artist_json())
+        small = compact(artist)
+        assert not hasattr(small, "__dict__")
+        assert small.id == artist.id
+        assert small.external_urls is artist.external_urls
+
+    def test_nested_models_converted(self):
+        paging = NumberPaging(**paging_json([{"i": 1}, None]))
+        small = compact(paging)
+        assert small.items == [compact_type(Number)(i=1), None]
+
+    def test_lazy_items_converted(self):
+        paging = NumberPaging.lazy_validate(paging_json([{"i": 1}]))
+        assert compact(paging).items == [compact_type(Number)(i=1)]
+
+    def test_other_values_returned_as_is(self):
+        value = {"a": 1}
+        assert compact(value) is value
+
+    def test_pickled(self):
+        small = compact(SimpleArtist(**artist_json()))
+        assert pickle.loads(pickle.dumps(small)) == small  # noqa: S301
+
+
+class TestInterner:
+    def test_equal_models_shared(self):
+        interner = Interner()
+        artists = interner.intern([SimpleArtist(**artist_json()) for _ in range(2)])
+        assert artists[0] is artists[1]
+
+    def test_different_models_not_shared(self):
+        interner = Interner()
+        a, b = interner.intern([SimpleArtist(**artist_json(i)) for i in range(2)])
+        assert a is not b
+        assert a.href is b.href
+        assert a.external_urls is b.external_urls
+
+    def test_values_shared_across_calls(self):
+        interner = Interner()
+        first = interner.intern({"markets": ["FI", "SE"]})
+        second = interner.intern({"markets": ["FI", "SE"]})
+        assert first is second
+        assert len(interner) == 4
+
+    def test_enum_not_shared_with_string(self):
+        interner = Interner()
+        assert interner.intern(E.a) is E.a
+        assert interner.intern("a") == "a"
+        assert interner.intern(E.a) is E.a
+
+    def test_bool_not_shared_with_int(self):
+        interner = Interner()
+        one, true = interner.intern([[1], [True]])
+        assert one == [1]
+        assert true[0] is True
+
+    def test_tuple_items_interned(self):
+        interner = Interner()
+        a, b = interner.intern((["x"], ["x"]))
+        assert a is b
+
+    def test_clear_discards_values(self):
+        interner = Interner()
+        interner.intern(["x"])
+        interner.clear()
+        assert len(interner) == 0
+
+
+def track_json() -> dict:
+    item = {"href": "href", "type": "track", "uri": "uri", "external_urls": {}}
+    artists = [{**item, "id": "artist", "name": "name"}]
+    album = {
+        **item,
+        "id": "album",
+        "album_type": "album",
+        "artists": artists,
+        "images": [],
+        "name": "name",
+        "total_tracks": 1,
+        "release_date": "2020",
+        "release_date_precision": "year",
+    }
+    return {
+        **item,
+        "id": "track",
+        "artists": artists,
+        "disc_number": 1,
+        "duration_ms": 1,
+        "explicit": False,
+        "is_local": False,
+        "name": "name",
+        "preview_url": None,
+        "track_number": 1,
+        "album": album,
+        "external_ids": {},
+        "popularity": 1,
+        "episode": False,
+        "track": True,
+    }
+
+
+def local_track_json() -> dict:
+    local = {"id": None, "href": None, "name": "name", "type": "track", "uri": None}
+    album = {
+        **local,
+        "type": "album",
+        "album_type": None,
+        "artists": [],
+        "external_urls": {},
+        "images": [],
+        "release_date": None,
+        "release_date_precision": None,
+    }
+    return {
+        **local,
+        "album": album,
+        "artists": [{**local, "type": "artist", "external_urls": {}}],
+        "disc_number": 0,
+        "duration_ms": 1,
+        "explicit": False,
+        "external_ids": {},
+        "external_urls": {},
+        "is_local": True,
+        "popularity": 0,
+        "preview_url": None,
+        "track_number": 0,
+        "uri": "spotify:local:name",
+    }
+
+
+def playlist_track_json(track: dict | None, item: dict | None) -> dict:
+    return {
+        "added_at": "2020-01-01T00:00:00Z",
+        "added_by": {
+            "id": "user",
+            "href": "href",
+            "type": "user",
+            "uri": "uri",
+            "external_urls": {},
+        },
+        "is_local": False,
+        "track": track,
+        "item": item,
+        "primary_color": None,
+        "video_thumbnail": None,
+    }
+
+
+class TestPlaylistTrack:
+    def test_identical_track_and_item_shared(self):
+        json = track_json()
+        playlist_track = PlaylistTrack(**playlist_track_json(json, dict(json)))
+        assert isinstance(playlist_track.item, FullPlaylistTrack)
+        assert playlist_track.track is playlist_track.item
+
+    def test_different_track_and_item_not_shared(self):
+        track = track_json()
+        item = {**track, "name": "other"}
+        playlist_track = PlaylistTrack(**playlist_track_json(track, item))
+        assert playlist_track.track.name == "name"
+        assert playlist_track.item.name == "other"
+
+    def test_missing_track_kept_none(self):
+        playlist_track = PlaylistTrack(**playlist_track_json(None, track_json()))
+        assert playlist_track.track is None
+
+    def test_local_track_discriminated(self):
+        json = local_track_json()
+        playlist_track = PlaylistTrack(**playlist_track_json(json, json))
+        assert isinstance(playlist_track.item, LocalPlaylistTrack)
+
+    def test_dump_contains_both(self):
+        json = track_json()
+        dump = PlaylistTrack(**playlist_track_json(json, json)).model_dump()
+        assert dump["track"] == dump["item"]
+
+
+class TestConstructTrusted:
+    def test_equals_validated(self):
+        json = track_json()
+        json = playlist_track_json(json, json)
+        assert construct_trusted(PlaylistTrack, json) == PlaylistTrack(**json)
+
+    def test_timestamp_converted(self):
+        json = playlist_track_json(None, None)
+        playlist_track = construct_trusted(PlaylistTrack, json)
+        assert isinstance(playlist_track.added_at, datetime)
+        assert playlist_track.added_at.tzinfo is not None
+
+    def test_enum_converted(self):
+        json = track_json()
+        track = construct_trusted(FullPlaylistTrack, json)
+        assert track.album.album_type is AlbumType.album
+
+    def test_identical_track_and_item_shared(self):
+        json = track_json()
+        json = playlist_track_json(json, dict(json))
+        playlist_track = construct_trusted(PlaylistTrack, json)
+        assert isinstance(playlist_track.item, FullPlaylistTrack)
+        assert playlist_track.track is playlist_track.item
+
+    def test_local_track_discriminated(self):
+        json = local_track_json()
+        playlist_track = construct_trusted(
+            PlaylistTrack, playlist_track_json(json, json)
+        )
+        assert isinstance(playlist_track.item, LocalPlaylistTrack)
+
+    def test_values_not_coerced(self):
+        json = {**artist_json(), "popularity": "1"}
+        assert construct_trusted(FullArtist, json).popularity == "1"
+
+    def test_missing_default_filled(self):
+        track = construct_trusted(FullPlaylistTrack, track_json())
+        assert track.available_markets is None
+
+    def test_unknown_attribute_warns_and_dropped(self):
+        json = {**artist_json(), "unknown": 1}
+        with pytest.warns(UnknownModelAttributeWarning):
+            artist = construct_trusted(FullArtist, json)
+        assert "unknown" not in artist.model_dump()
+
+
+def analysis_json(n_segments: int = 3) -> dict:
+    segment = {
+        "start": 0.0,
+        "duration": 1.0,
+        "loudness_start": -60.0,
+        "loudness_max": -50.0,
+        "pitches": [0.5] * 12,
+        "timbre": [1.0] * 12,
+    }
+    return {
+        "bars": [{"start": 0.0, "duration": 1.0, "confidence": 0.5}],
+        "beats": [{"duration": 0.5}],
+        "sections": [],
+        "segments": [segment] * n_segments,
+        "tatums": [],
+        "meta": {"status_code": 0},
+        "track": {"duration": 1.0},
+    }
+
+
+class TestColumnarAudioAnalysis:
+    def test_segments_as_columns(self):
+        np = pytest.importorskip("numpy")
+        analysis = ColumnarAudioAnalysis.from_json(analysis_json())
+        segments = analysis.segments
+        assert segments.pitches.shape == (3, 12)
+        assert segments.pitches.dtype == np.float32
+        assert segments.timbre.shape == (3, 12)
+        assert segments.loudness_max.tolist() == [-50.0] * 3
+
+    def test_missing_values_are_nan(self):
+        np = pytest.importorskip("numpy")
+        analysis = ColumnarAudioAnalysis.from_json(analysis_json())
+        assert np.isnan(analysis.beats.start[0])
+        assert np.isnan(analysis.segments.loudness_end).all()
+
+    def test_missing_vectors_are_nan(self):
+        np = pytest.importorskip("numpy")
+        json = analysis_json(2)
+        json["segments"] = [json["segments"][0], {"start": 1.0, "timbre": None}]
+        segments = ColumnarAudioAnalysis.from_json(json).segments
+        assert segments.pitches.shape == (2, 12)
+        assert segments.pitches[0].tolist() == [0.5] * 12
+        assert np.isnan(segments.pitches[1]).all()
+        assert np.isnan(segments.timbre[1]).all()
+
+    def test_empty_items(self):
+        pytest.importorskip("numpy")
+        analysis = ColumnarAudioAnalysis.from_json(analysis_json(0))
+        assert analysis.segments.pitches.shape == (0, 12)
+        assert analysis.sections.tempo.shape == (0,)
+
+    def test_missing_numpy_raises(self):
+        with (
+            patch.dict(sys.modules, {"numpy": None}),
+            pytest.raises(ImportError, match=r"tekore\[numpy\]"),
+        ):
+            ColumnarAudioAnalysis.from_json(analysis_json())
@@ -1,6 +1,11 @@
+from unittest.mock import MagicMock, patch
+
+import httpx
 import pytest
 
-from tekore import Sender, SyncSender
+from tekore import AsyncSender, CachingSender, LazyResponse, Request, Sender, SyncSender
+
+module = "tekore._sender.base"
 
 
 class TestSender:
@@ -11,3 +16,60 @@ class TestSender:
     def test_repr(self):
         s = SyncSender()
         assert repr(s).startswith("SyncSender(")
+
+    def test_sync_sender_returns_lazy_response(self, httpx_mock):
+        httpx_mock.add_response(json={"a": 1}, headers={"h": "v"})
+        response = SyncSender().send(Request("GET", "https://example.com"))
+        assert isinstance(response, LazyResponse)
+        assert response.content == {"a": 1}
+        assert response.headers["h"] == "v"
+
+    @pytest.mark.asyncio
+    async def test_async_sender_returns_lazy_response(self, httpx_mock):
+        httpx_mock.add_response(json={"a": 1})
+        sender = AsyncSender()
+        response = await sender.send(Request("GET", "https://example.com"))
+        await sender.close()
+        assert response.content == {"a": 1}
+
+    def test_stream_not_implemented_by_default(self):
+        class NoStream(Sender):
+            is_async = False
+            send = close = None
+
+        with pytest.raises(NotImplementedError):
+            NoStream().stream(Request("GET", "url"))
+
+    def test_extending_sender_streams_with_underlying(self, httpx_mock):
+        httpx_mock.add_response(content=b"data")
+        sender = CachingSender(sender=SyncSender())
+        with sender.stream(Request("GET", "https://example.com")) as response:
+            assert b"".join(response.chunks) == b"data"
+
+
+class TestLazyResponse:
+    def test_content_parsed_on_access(self):
+        loads = MagicMock(return_value={"a": 1})
+        with patch(module + ".loads", loads):
+            response = LazyResponse("url", {}, 200, b'{"a": 1}')
+            loads.assert_not_called()
+            assert response.content == {"a": 1}
+            assert response.content == {"a": 1}
+        loads.assert_called_once()
+
+    def test_empty_content_is_none(self):
+        assert LazyResponse("url", {}, 204, b"").content is None
+
+    def test_invalid_content_is_none(self):
+        assert LazyResponse("url", {}, 200, b"not json").content is None
+
+    def test_content_assignable(self):
+        response = LazyResponse("url", {}, 200, b"{}")
+        response.content = {"a": 1}
+        assert response.content == {"a": 1}
+
+    def test_headers_converted_to_dict(self):
+        headers = httpx.Headers({"h": "v"})
+        response = LazyResponse("url", headers, 200, b"")
+        assert response.headers == {"h": "v"}
+        assert isinstance(response.headers, dict)
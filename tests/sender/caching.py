@@ -1,10 +1,12 @@
+import asyncio
+import threading
 from collections.abc import Callable
 from unittest.mock import MagicMock, patch
 from urllib.parse import urlencode
 
 import pytest
 
-from tekore import CachingSender, Request, Response
+from tekore import CachingSender, LazyResponse, Request, Response
 from tests._util import AsyncMock
 
 
@@ -192,7 +194,7 @@ class TestCachingSender:
             sender.sender = mock_sender(p1, p2)
             sender.send(r)
             assert sender.send(r) is p1
-            assert "ETag" in r.headers
+            assert r.headers["If-None-Match"] == "a"
 
     def test_etag_only_fresh_returned_on_success(self, sender):
         r = request("url", {}, {})
@@ -204,7 +206,7 @@ class TestCachingSender:
             sender.sender = mock_sender(p1, p2)
             sender.send(r)
             assert sender.send(r) is p2
-            assert "ETag" in r.headers
+            assert r.headers["If-None-Match"] == "a"
 
     @pytest.mark.asyncio
     async def test_async_etag_only_fresh_returned_on_success(self, sender):
@@ -217,7 +219,7 @@ class TestCachingSender:
             sender.sender = mock_sender(p1, p2, is_async=True)
             await sender.send(r)
             assert await sender.send(r) is p2
-            assert "ETag" in r.headers
+            assert r.headers["If-None-Match"] == "a"
 
     def test_etag_only_stale_replaced_with_new(self, sender):
         r = request("url", {}, {})
@@ -237,7 +239,7 @@ class TestCachingSender:
         p1 = response(200, "url", {}, cc=10, etag="a")
         p2 = response(304, "url", {})
 
-        time = MagicMock(side_effect=[0, 15])
+        time = MagicMock(side_effect=[0, 15, 15])
         with patch(module + ".time.time", time):
             sender.sender = mock_sender(p1, p2)
             sender.send(r)
@@ -309,3 +311,266 @@ class TestCachingSender:
 
         assert sender.send(r1) is p1
         assert sender.send(r2) is p3
+
+    def test_stats_count_hits_and_misses(self, sender):
+        r = request("url", {}, {})
+        p = response(200, "url", {}, cc=10)
+
+        sender.sender = mock_sender(p)
+        sender.send(r)
+        sender.send(r)
+        stats = sender.stats
+        assert (stats.hits, stats.misses, stats.revalidations) == (1, 1, 0)
+        assert stats.entries == 1
+        assert stats.bytes > 0
+
+    def test_stats_count_revalidations(self, sender):
+        r = request("url", {}, {})
+        p1 = response(200, "url", {}, cc=0, etag="a")
+        p2 = response(304, "url", {})
+
+        time = MagicMock(side_effect=[0, 15, 15])
+        with patch(module + ".time.time", time):
+            sender.sender = mock_sender(p1, p2)
+            sender.send(r)
+            sender.send(r)
+        assert sender.stats.revalidations == 1
+
+    def test_exceeding_max_bytes_evicts_lru_item(self):
+        r1, p1 = pair(200, "url1", cc=3600)
+        r2, p2 = pair(200, "url2", cc=3600)
+        r3, p3 = pair(200, "url3", cc=3600)
+        p1.content = p2.content = p3.content = {"data": "x" * 1000}
+
+        sender = CachingSender(sender=mock_sender(p1, p2, p3), max_bytes=6000)
+        sender.send(r1)
+        sender.send(r2)
+        sender.send(r3)
+
+        assert sender.stats.evictions == 1
+        assert sender.stats.bytes <= 6000
+        with pytest.raises(StopIteration):
+            sender.send(r1)
+
+    def test_decoding_cached_lazy_response_keeps_size(self, sender):
+        req = request("url", {}, {})
+        raw = b'{"items": [' + b", ".join([b'{"name": "item"}'] * 1000) + b"]}"
+        headers = {"Cache-Control": "public, max-age=3600"}
+        lazy = LazyResponse("url", headers, 200, raw)
+        sender.sender = mock_sender(lazy)
+
+        assert len(sender.send(req).content["items"]) == 1000
+        size = sender.stats.bytes
+        hits = [sender.send(req) for _ in range(2)]
+
+        assert hits[0] is not hits[1]
+        assert all(len(hit.content["items"]) == 1000 for hit in hits)
+        assert sender.stats.bytes == size
+        assert size < 2 * len(raw)
+        _, variants = sender.storage.get("url")
+        assert not any(v["response"].parsed for v in variants.values())
+
+    def test_last_modified_sent_as_if_modified_since(self, sender):
+        r = request("url", {}, {})
+        date = "Wed, 21 Oct 2015 07:28:00 GMT"
+        p1 = response(200, "url", {}, cc=0)
+        p1.headers["Last-Modified"] = date
+        p2 = response(304, "url", {})
+
+        time = MagicMock(side_effect=[0, 15, 15])
+        with patch(module + ".time.time", time):
+            sender.sender = mock_sender(p1, p2)
+            sender.send(r)
+            assert sender.send(r) is p1
+            assert r.headers["If-Modified-Since"] == date
+            assert "If-None-Match" not in r.headers
+
+    def test_not_modified_refreshes_expiry(self, sender):
+        r1 = request("url", {}, {})
+        r2 = request("url", {}, {})
+        p1 = response(200, "url", {}, cc=0, etag="a")
+        p2 = response(304, "url", {}, cc=60)
+
+        time = MagicMock(side_effect=[0, 15, 15, 30])
+        with patch(module + ".time.time", time):
+            sender.sender = mock_sender(p1, p2)
+            sender.send(r1)
+            sender.send(r1)
+            assert sender.send(r2) is p1
+            assert "If-None-Match" not in r2.headers
+
+    def test_not_modified_updates_validators(self, sender):
+        r = request("url", {}, {})
+        p1 = response(200, "url", {}, cc=0, etag="a")
+        p2 = response(304, "url", {}, cc=0, etag="b")
+        p3 = response(304, "url", {})
+
+        time = MagicMock(side_effect=[0, 15, 15, 30, 30])
+        with patch(module + ".time.time", time):
+            sender.sender = mock_sender(p1, p2, p3)
+            sender.send(r)
+            sender.send(r)
+            assert sender.send(r) is p1
+            assert r.headers["If-None-Match"] == "b"
+
+
+def join_threads(before: set) -> None:
+    for thread in set(threading.enumerate()) - before:
+        thread.join()
+
+
+class TestCachingSenderStale:
+    def test_stale_returned_and_refreshed_in_background(self):
+        r = request("url", {}, {})
+        p1, p2 = multiple(response, 2, 200, "url", {}, cc=10)
+        sender = CachingSender(sender=mock_sender(p1, p2), stale_while_revalidate=60)
+
+        time = MagicMock(return_value=0)
+        with patch(module + ".time.time", time):
+            sender.send(r)
+            time.return_value = 15
+            threads = set(threading.enumerate())
+            assert sender.send(r) is p1
+            join_threads(threads)
+            assert sender.send(r) is p2
+
+    def test_stale_refreshed_in_daemon_thread(self):
+        r = request("url", {}, {})
+        p1, p2 = multiple(response, 2, 200, "url", {}, cc=10)
+        sender = CachingSender(sender=mock_sender(p1, p2), stale_while_revalidate=60)
+
+        time = MagicMock(return_value=0)
+        with patch(module + ".time.time", time):
+            sender.send(r)
+            time.return_value = 15
+            threads = set(threading.enumerate())
+            sender.send(r)
+            refreshes = set(threading.enumerate()) - threads
+            join_threads(threads)
+
+        assert all(t.daemon for t in refreshes)
+
+    def test_failed_refresh_counted(self):
+        r = request("url", {}, {})
+        p1 = response(200, "url", {}, cc=10)
+        sender = CachingSender(
+            sender=mock_sender(p1, ConnectionError()), stale_while_revalidate=60
+        )
+
+        time = MagicMock(return_value=0)
+        with patch(module + ".time.time", time):
+            sender.send(r)
+            time.return_value = 15
+            threads = set(threading.enumerate())
+            assert sender.send(r) is p1
+            join_threads(threads)
+
+        assert sender.stats.refresh_errors == 1
+
+    def test_stale_past_window_not_returned(self):
+        r = request("url", {}, {})
+        p1, p2 = multiple(response, 2, 200, "url", {}, cc=10)
+        sender = CachingSender(sender=mock_sender(p1, p2), stale_while_revalidate=60)
+
+        time = MagicMock(return_value=0)
+        with patch(module + ".time.time", time):
+            sender.send(r)
+            time.return_value = 100
+            assert sender.send(r) is p2
+
+    def test_stale_refreshed_once_at_a_time(self):
+        r = request("url", {}, {})
+        p1, p2 = multiple(response, 2, 200, "url", {}, cc=10)
+        release = threading.Event()
+
+        def send(_):
+            if send.calls:
+                release.wait()
+                return p2
+            send.calls += 1
+            return p1
+
+        send.calls = 0
+        inner = MagicMock()
+        inner.is_async = False
+        inner.send.side_effect = send
+        sender = CachingSender(sender=inner, stale_while_revalidate=60)
+
+        time = MagicMock(return_value=0)
+        with patch(module + ".time.time", time):
+            sender.send(r)
+            time.return_value = 15
+            threads = set(threading.enumerate())
+            assert sender.send(r) is p1
+            assert sender.send(r) is p1
+            release.set()
+            join_threads(threads)
+
+        assert inner.send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_async_stale_returned_and_refreshed_in_background(self):
+        r = request("url", {}, {})
+        p1, p2 = multiple(response, 2, 200, "url", {}, cc=10)
+        sender = CachingSender(
+            sender=mock_sender(p1, p2, is_async=True), stale_while_revalidate=60
+        )
+
+        time = MagicMock(return_value=0)
+        with patch(module + ".time.time", time):
+            await sender.send(r)
+            time.return_value = 15
+            assert await sender.send(r) is p1
+            await asyncio.gather(*sender._tasks)
+            assert await sender.send(r) is p2
+
+    @pytest.mark.asyncio
+    async def test_async_failed_refresh_counted(self):
+        r = request("url", {}, {})
+        p1 = response(200, "url", {}, cc=10)
+        sender = CachingSender(
+            sender=mock_sender(p1, ConnectionError(), is_async=True),
+            stale_while_revalidate=60,
+        )
+
+        time = MagicMock(return_value=0)
+        with patch(module + ".time.time", time):
+            await sender.send(r)
+            time.return_value = 15
+            assert await sender.send(r) is p1
+            await asyncio.gather(*sender._tasks)
+
+        assert sender.stats.refresh_errors == 1
+
+    def test_stale_returned_on_server_error(self):
+        r = request("url", {}, {})
+        p1 = response(200, "url", {}, cc=10)
+        p2 = response(503, "url", {})
+        sender = CachingSender(sender=mock_sender(p1, p2), stale_if_error=60)
+
+        time = MagicMock(side_effect=[0, 15])
+        with patch(module + ".time.time", time):
+            sender.send(r)
+            assert sender.send(r) is p1
+
+    def test_server_error_returned_past_error_window(self):
+        r = request("url", {}, {})
+        p1 = response(200, "url", {}, cc=10)
+        p2 = response(503, "url", {})
+        sender = CachingSender(sender=mock_sender(p1, p2), stale_if_error=60)
+
+        time = MagicMock(side_effect=[0, 100])
+        with patch(module + ".time.time", time):
+            sender.send(r)
+            assert sender.send(r) is p2
+
+    def test_client_error_not_replaced_with_stale(self):
+        r = request("url", {}, {})
+        p1 = response(200, "url", {}, cc=10)
+        p2 = response(404, "url", {})
+        sender = CachingSender(sender=mock_sender(p1, p2), stale_if_error=60)
+
+        time = MagicMock(side_effect=[0, 15])
+        with patch(module + ".time.time", time):
+            sender.send(r)
+            assert sender.send(r) is p2
@@ -0,0 +1,159 @@
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from tekore import CoalescingSender, Request
+
+
+def mock_request(method: str = "GET", params=None, headers=None):
+    return Request(method, "url.com", params=params, headers=headers)
+
+
+def blocking_sender(release: threading.Event, error: Exception | None = None):
+    sender = MagicMock()
+    sender.is_async = False
+
+    def send(_):
+        release.wait(1)
+        if error is not None:
+            raise error
+        return MagicMock()
+
+    sender.send.side_effect = send
+    return sender
+
+
+def async_sender(error: Exception | None = None):
+    sender = MagicMock()
+    sender.is_async = True
+    calls = []
+
+    async def send(request):
+        calls.append(request)
+        await asyncio.sleep(0.01)
+        if error is not None:
+            raise error
+        return MagicMock()
+
+    sender.send = send
+    return sender, calls
+
+
+def send_in_threads(sender, requests) -> tuple[list, list]:
+    responses, errors = [], []
+
+    def send(request):
+        try:
+            responses.append(sender.send(request))
+        except ValueError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=send, args=(r,)) for r in requests]
+    for t in threads:
+        t.start()
+    return threads, (responses, errors)
+
+
+class TestCoalescingSender:
+    def test_repr(self):
+        s = CoalescingSender()
+        assert repr(s).startswith("CoalescingSender(")
+
+    def test_concurrent_identical_requests_coalesced(self):
+        release = threading.Event()
+        s = CoalescingSender(blocking_sender(release))
+        threads, (responses, _) = send_in_threads(s, [mock_request()] * 3)
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert s.sender.send.call_count == 1
+        assert len(responses) == 3
+        assert all(r is responses[0] for r in responses)
+
+    def test_different_requests_not_coalesced(self):
+        release = threading.Event()
+        release.set()
+        s = CoalescingSender(blocking_sender(release))
+        requests = [
+            mock_request(),
+            mock_request(params={"a": 1}),
+            mock_request(headers={"Authorization": "other"}),
+        ]
+        for r in requests:
+            s.send(r)
+        assert s.sender.send.call_count == 3
+
+    def test_sequential_requests_not_coalesced(self):
+        release = threading.Event()
+        release.set()
+        s = CoalescingSender(blocking_sender(release))
+        s.send(mock_request())
+        s.send(mock_request())
+        assert s.sender.send.call_count == 2
+
+    def test_other_methods_not_coalesced(self):
+        sender = MagicMock()
+        sender.is_async = False
+        s = CoalescingSender(sender)
+        s.send(mock_request("POST"))
+        s.send(mock_request("POST"))
+        assert sender.send.call_count == 2
+
+    def test_error_raised_to_all_waiting(self):
+        release = threading.Event()
+        s = CoalescingSender(blocking_sender(release, ValueError("error")))
+        threads, (_, errors) = send_in_threads(s, [mock_request()] * 3)
+        time.sleep(0.05)
+        release.set()
+        for t in threads:
+            t.join()
+
+        assert s.sender.send.call_count == 1
+        assert len(errors) == 3
+
+    @pytest.mark.asyncio
+    async def test_async_concurrent_identical_requests_coalesced(self):
+        sender, calls = async_sender()
+        s = CoalescingSender(sender)
+        responses = await asyncio.gather(*[s.send(mock_request()) for _ in range(3)])
+        assert len(calls) == 1
+        assert all(r is responses[0] for r in responses)
+
+    @pytest.mark.asyncio
+    async def test_async_different_requests_not_coalesced(self):
+        sender, calls = async_sender()
+        s = CoalescingSender(sender)
+        await asyncio.gather(
+            s.send(mock_request()), s.send(mock_request(params={1: 1}))
+        )
+        await asyncio.gather(s.send(mock_request()), s.send(mock_request("PUT")))
+        assert len(calls) == 4
+
+    @pytest.mark.asyncio
+    async def test_async_error_raised_to_all_waiting(self):
+        sender, calls = async_sender(ValueError("error"))
+        s = CoalescingSender(sender)
+        results = await asyncio.gather(
+            *[s.send(mock_request()) for _ in range(3)], return_exceptions=True
+        )
+        assert len(calls) == 1
+        assert all(isinstance(r, ValueError) for r in results)
+
+    @pytest.mark.asyncio
+    async def test_async_cancelled_leader_does_not_cancel_others(self):
+        sender, calls = async_sender()
+        s = CoalescingSender(sender)
+        leader = asyncio.ensure_future(s.send(mock_request()))
+        await asyncio.sleep(0)
+        followers = [asyncio.ensure_future(s.send(mock_request())) for _ in range(2)]
+        await asyncio.sleep(0)
+        leader.cancel()
+        results = await asyncio.gather(leader, *followers, return_exceptions=True)
+        assert isinstance(results[0], asyncio.CancelledError)
+        assert not any(isinstance(r, BaseException) for r in results[1:])
+        assert len(calls) == 1
@@ -0,0 +1,128 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tekore import RateLimitingSender, Request
+from tests._util import AsyncMock
+
+
+def mock_request():
+    return Request("GET", "url.com")
+
+
+def ok_response() -> MagicMock:
+    response = MagicMock()
+    response.status_code = 200
+    return response
+
+
+def rate_limit_response(retry_after: int = 1) -> MagicMock:
+    response = MagicMock()
+    response.status_code = 429
+    response.headers = {"Retry-After": retry_after}
+    return response
+
+
+def mock_sender(*responses, is_async: bool = False):
+    sender = MagicMock()
+    sender.is_async = is_async
+    if is_async:
+        sender.send = AsyncMock(side_effect=responses)
+    else:
+        sender.send.side_effect = responses
+    return sender
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+        self.sleeps = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class AsyncClock(Clock):
+    async def sleep(self, seconds):
+        super().sleep(seconds)
+
+
+module = "tekore._sender.extending"
+
+
+@pytest.fixture
+def clock():
+    clock = Clock()
+    with patch(module + ".time", clock):
+        yield clock
+
+
+class TestRateLimitingSender:
+    def test_repr(self):
+        s = RateLimitingSender(10)
+        assert repr(s).startswith("RateLimitingSender(")
+
+    def test_burst_within_budget_not_delayed(self, clock):
+        sender = mock_sender(*[ok_response() for _ in range(3)])
+        s = RateLimitingSender(3, window=3, sender=sender)
+        for _ in range(3):
+            s.send(mock_request())
+        assert clock.sleeps == []
+
+    def test_request_over_budget_waits_for_refill(self, clock):
+        sender = mock_sender(*[ok_response() for _ in range(3)])
+        s = RateLimitingSender(2, window=4, sender=sender)
+        for _ in range(3):
+            s.send(mock_request())
+        assert clock.sleeps == [pytest.approx(2)]
+
+    def test_budget_refilled_over_time(self, clock):
+        sender = mock_sender(*[ok_response() for _ in range(4)])
+        s = RateLimitingSender(2, window=4, sender=sender)
+        s.send(mock_request())
+        s.send(mock_request())
+        clock.now += 4
+        s.send(mock_request())
+        s.send(mock_request())
+        assert clock.sleeps == []
+
+    @pytest.mark.usefixtures("clock")
+    def test_rate_limited_response_returned(self):
+        fail = rate_limit_response()
+        s = RateLimitingSender(2, sender=mock_sender(fail))
+        assert s.send(mock_request()) is fail
+
+    @pytest.mark.usefixtures("clock")
+    def test_rate_limited_response_halves_rate(self):
+        s = RateLimitingSender(10, window=10, sender=mock_sender(rate_limit_response()))
+        s.send(mock_request())
+        assert s.rate == pytest.approx(0.5)
+
+    def test_rate_limited_response_waits_retry_after(self, clock):
+        sender = mock_sender(rate_limit_response(3), ok_response())
+        s = RateLimitingSender(10, window=10, sender=sender)
+        s.send(mock_request())
+        s.send(mock_request())
+        assert clock.sleeps == [pytest.approx(3 + 1 / 0.5)]
+
+    @pytest.mark.usefixtures("clock")
+    def test_successes_restore_rate(self):
+        responses = [rate_limit_response(0)] + [ok_response() for _ in range(10)]
+        s = RateLimitingSender(10, window=10, sender=mock_sender(*responses))
+        for _ in responses:
+            s.send(mock_request())
+        assert s.rate == pytest.approx(1)
+
+    @pytest.mark.asyncio
+    async def test_async_request_over_budget_waits_for_refill(self):
+        clock = AsyncClock()
+        sender = mock_sender(*[ok_response() for _ in range(3)], is_async=True)
+        with patch(module + ".time", clock), patch(module + ".asyncio", clock):
+            s = RateLimitingSender(2, window=4, sender=sender)
+            for _ in range(3):
+                await s.send(mock_request())
+        assert clock.sleeps == [pytest.approx(2)]
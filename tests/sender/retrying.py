@@ -1,13 +1,14 @@
 from unittest.mock import MagicMock, patch
 
 import pytest
+from httpx import ConnectError, ReadTimeout
 
-from tekore import Request, RetryingSender
+from tekore import Request, RetryingSender, RetryPolicy
 from tests._util import AsyncMock
 
 
-def mock_request():
-    return Request("GET", "url.com")
+def mock_request(method: str = "GET"):
+    return Request(method, "url.com")
 
 
 def ok_response() -> MagicMock:
@@ -178,3 +179,102 @@ class TestRetryingSender:
             await s.send(mock_request())
 
         assert sender.send.call_count == 4
+
+    def test_post_not_retried_on_server_error(self):
+        fail = failed_response()
+        sender = mock_sender(fail, ok_response())
+
+        s = RetryingSender(retries=2, sender=sender)
+        with patch(module + ".time", MagicMock()):
+            r = s.send(mock_request("POST"))
+        assert r is fail
+
+    def test_post_retried_when_rate_limited(self):
+        success = ok_response()
+        sender = mock_sender(rate_limit_response(), success)
+
+        s = RetryingSender(sender=sender)
+        with patch(module + ".time", MagicMock()):
+            r = s.send(mock_request("POST"))
+        assert r is success
+
+    def test_methods_of_policy_retried(self):
+        success = ok_response()
+        sender = mock_sender(failed_response(), success)
+
+        s = RetryingSender(sender=sender, policy=RetryPolicy(1, methods=["post"]))
+        with patch(module + ".time", MagicMock()):
+            r = s.send(mock_request("POST"))
+        assert r is success
+
+    def test_transport_error_retried(self):
+        success = ok_response()
+        sender = mock_sender(ConnectError("error"), ReadTimeout("error"), success)
+
+        s = RetryingSender(retries=2, sender=sender)
+        with patch(module + ".time", MagicMock()):
+            r = s.send(mock_request())
+        assert r is success
+
+    def test_transport_error_raised_when_retries_exhausted(self):
+        sender = mock_sender(ConnectError("error"), ConnectError("error"))
+
+        s = RetryingSender(retries=1, sender=sender)
+        with patch(module + ".time", MagicMock()), pytest.raises(ConnectError):
+            s.send(mock_request())
+        assert sender.send.call_count == 2
+
+    def test_other_errors_not_retried(self):
+        sender = mock_sender(ValueError("error"), ok_response())
+
+        s = RetryingSender(retries=1, sender=sender)
+        with pytest.raises(ValueError, match="error"):
+            s.send(mock_request())
+
+    @pytest.mark.asyncio
+    async def test_async_transport_error_retried(self):
+        success = ok_response()
+        sender = mock_sender(ConnectError("error"), success, is_async=True)
+
+        s = RetryingSender(retries=1, sender=sender)
+        with patch(module + ".asyncio", AsyncMock()):
+            r = await s.send(mock_request())
+        assert r is success
+
+    def test_retries_assignable(self):
+        s = RetryingSender()
+        s.retries = 3
+        assert s.policy.retries == 3
+
+
+class TestRetryPolicy:
+    def test_repr(self):
+        assert repr(RetryPolicy()).startswith("RetryPolicy(")
+
+    def test_delay_doubles_without_jitter(self):
+        p = RetryPolicy(jitter=False, backoff=1)
+        assert [p.backoff_delay(i) for i in range(4)] == [1, 2, 4, 8]
+
+    def test_delay_capped(self):
+        p = RetryPolicy(jitter=False, backoff=1, max_delay=3)
+        assert p.backoff_delay(5) == 3
+
+    def test_jittered_delay_within_exponential_delay(self):
+        p = RetryPolicy(backoff=1, max_delay=10)
+        delays = [p.backoff_delay(2) for _ in range(100)]
+        assert all(0 <= d <= 4 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_no_retry_after_deadline(self):
+        p = RetryPolicy(retries=5, jitter=False, deadline=10)
+        assert p.delay(mock_request(), failed_response(), None, 0, 5) == 1
+        assert p.delay(mock_request(), failed_response(), None, 0, 9.5) is None
+
+    def test_rate_limit_not_retried_after_deadline(self):
+        p = RetryPolicy(deadline=10)
+        assert p.delay(mock_request(), rate_limit_response(1), None, 0, 5) == 2
+        assert p.delay(mock_request(), rate_limit_response(9), None, 0, 5) is None
+
+    def test_successful_response_not_retried(self):
+        p = RetryPolicy(retries=5)
+        assert p.delay(mock_request(), ok_response(), None, 0, 0) is None
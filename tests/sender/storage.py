@@ -0,0 +1,235 @@
+import sqlite3
+from contextlib import closing
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from tekore import (
+    CachingSender,
+    LazyResponse,
+    MemoryCacheStorage,
+    Request,
+    Response,
+    SQLiteCacheStorage,
+)
+
+module = "tekore._sender.storage"
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def make_storage(request, tmp_path):
+    storages = []
+
+    def make(max_size=None, max_bytes=None):
+        if request.param == "memory":
+            return MemoryCacheStorage(max_size, max_bytes)
+        storage = SQLiteCacheStorage(tmp_path / "cache.db", max_size, max_bytes)
+        storages.append(storage)
+        return storage
+
+    yield make
+    for storage in storages:
+        storage.close()
+
+
+class TestCacheStorage:
+    def test_repr(self, make_storage):
+        assert "max_size=2" in repr(make_storage(2))
+
+    def test_missing_value_is_none(self, make_storage):
+        assert make_storage().get("a") is None
+
+    def test_set_value_returned(self, make_storage):
+        storage = make_storage()
+        storage.set("a", {"b": [1, 2]}, None)
+        assert storage.get("a") == {"b": [1, 2]}
+
+    def test_set_value_replaced(self, make_storage):
+        storage = make_storage()
+        storage.set("a", 1, None)
+        storage.set("a", 2, None)
+        assert storage.get("a") == 2
+        assert len(storage) == 1
+
+    def test_response_stored(self, make_storage):
+        storage = make_storage()
+        response = Response("url", {"h": "v"}, 200, {"c": 1})
+        storage.set("a", ["vary", {"": {"response": response}}], None)
+        assert storage.get("a")[1][""]["response"] == response
+
+    def test_delete(self, make_storage):
+        storage = make_storage(2)
+        storage.set("a", 1, None)
+        storage.delete("a")
+        storage.delete("a")
+        assert storage.get("a") is None
+        assert len(storage) == 0
+
+    def test_clear(self, make_storage):
+        storage = make_storage()
+        storage.set("a", 1, None)
+        storage.set("b", 2, None)
+        storage.clear()
+        assert len(storage) == 0
+
+    def test_exceeding_max_size_drops_lru_value(self, make_storage):
+        storage = make_storage(2)
+        storage.set("a", 1, None)
+        storage.set("b", 2, None)
+        storage.get("a")
+        storage.set("c", 3, None)
+        assert storage.get("b") is None
+        assert storage.get("a") == 1
+        assert storage.get("c") == 3
+
+    def test_expired_values_dropped_before_lru(self, make_storage):
+        storage = make_storage(2)
+        storage.set("a", 1, None)
+        storage.set("b", 2, 5)
+        with patch(module + ".time.time", MagicMock(return_value=10)):
+            storage.set("c", 3, None)
+        assert storage.get("a") == 1
+        assert storage.get("b") is None
+
+    def test_replaced_expiry_respected(self, make_storage):
+        storage = make_storage(2)
+        storage.set("a", 1, 5)
+        storage.set("a", 2, 20)
+        storage.set("b", 3, None)
+        with patch(module + ".time.time", MagicMock(return_value=10)):
+            storage.set("c", 4, None)
+        assert storage.get("a") is None
+        assert storage.get("b") == 3
+        assert storage.get("c") == 4
+
+    def test_expired_values_kept_until_full(self, make_storage):
+        storage = make_storage(3)
+        storage.set("a", 1, 5)
+        with patch(module + ".time.time", MagicMock(return_value=10)):
+            storage.set("b", 2, None)
+        assert storage.get("a") == 1
+
+    def test_bytes_used_tracks_values(self, make_storage):
+        storage = make_storage()
+        storage.set("a", "x" * 100, None)
+        storage.set("b", "x" * 100, None)
+        used = storage.bytes_used
+        assert used >= 200
+        storage.delete("a")
+        assert storage.bytes_used < used
+        storage.clear()
+        assert storage.bytes_used == 0
+
+    def test_exceeding_max_bytes_drops_lru_values(self, make_storage):
+        storage = make_storage(max_bytes=1000)
+        storage.set("a", "x" * 400, None)
+        storage.set("b", "x" * 400, None)
+        storage.get("a")
+        storage.set("c", "x" * 400, None)
+        assert storage.get("b") is None
+        assert storage.get("a") is not None
+        assert storage.bytes_used <= 1000
+        assert storage.evictions == 1
+
+    def test_large_value_drops_many_values(self, make_storage):
+        storage = make_storage(max_bytes=1000)
+        for key in "abcd":
+            storage.set(key, "x" * 100, None)
+        storage.set("e", "x" * 900, None)
+        assert len(storage) == 1
+        assert storage.evictions == 4
+
+    def test_value_larger_than_max_bytes_not_stored(self, make_storage):
+        storage = make_storage(max_bytes=1000)
+        storage.set("a", "x" * 100, None)
+        storage.set("b", "x" * 2000, None)
+        assert storage.get("b") is None
+        assert storage.get("a") is not None
+
+    def test_replacing_value_updates_bytes(self, make_storage):
+        storage = make_storage(max_bytes=1000)
+        storage.set("a", "x" * 100, None)
+        storage.set("a", "x" * 500, None)
+        assert 500 <= storage.bytes_used <= 1000
+        assert storage.evictions == 0
+
+    def test_expired_values_count_as_evictions(self, make_storage):
+        storage = make_storage(1)
+        storage.set("a", 1, 5)
+        with patch(module + ".time.time", MagicMock(return_value=10)):
+            storage.set("b", 2, None)
+        assert storage.evictions == 1
+
+
+class TestMemoryCacheStorage:
+    def test_many_replacements_keep_expiry_order(self):
+        storage = MemoryCacheStorage(2)
+        for i in range(100):
+            storage.set("a", i, 100 + i)
+        storage.set("b", 0, 5)
+        with patch(module + ".time.time", MagicMock(return_value=10)):
+            storage.set("c", 0, None)
+        assert storage.get("a") == 99
+        assert storage.get("b") is None
+
+
+class TestSQLiteCacheStorage:
+    def test_values_persist_between_instances(self, tmp_path):
+        path = tmp_path / "cache.db"
+        first = SQLiteCacheStorage(path)
+        first.set("a", 1, None)
+        first.close()
+
+        second = SQLiteCacheStorage(path)
+        assert second.get("a") == 1
+        second.close()
+
+    def test_instances_share_values(self, tmp_path):
+        path = tmp_path / "cache.db"
+        first = SQLiteCacheStorage(path)
+        second = SQLiteCacheStorage(path)
+        first.set("a", 1, None)
+        assert second.get("a") == 1
+        first.close()
+        second.close()
+
+    def test_unsupported_value_raises(self, tmp_path):
+        storage = SQLiteCacheStorage(tmp_path / "cache.db")
+        with pytest.raises(TypeError):
+            storage.set("a", object(), None)
+        storage.close()
+
+    def test_caching_sender_loads_stored_response(self, tmp_path):
+        response = Response(
+            "url", {"Cache-Control": "public, max-age=3600"}, 200, {"a": 1}
+        )
+        sender = MagicMock()
+        sender.is_async = False
+        sender.send.return_value = response
+
+        storage = SQLiteCacheStorage(tmp_path / "cache.db")
+        caching = CachingSender(sender=sender, storage=storage)
+        assert caching.storage is storage
+        caching.send(Request("GET", "url"))
+        cached = caching.send(Request("GET", "url"))
+        storage.close()
+
+        assert cached == response
+        assert sender.send.call_count == 1
+        with closing(sqlite3.connect(tmp_path / "cache.db")) as connection:
+            rows = connection.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        assert rows > 0
+
+    def test_caching_sender_keeps_empty_bounded_storage(self):
+        storage = MemoryCacheStorage(max_size=5)
+        caching = CachingSender(storage=storage)
+        assert caching.storage is storage
+        assert caching.storage.max_size == 5
+
+    def test_lazy_response_stored(self, tmp_path):
+        storage = SQLiteCacheStorage(tmp_path / "cache.db")
+        response = LazyResponse("url", {"h": "v"}, 200, b'{"a": 1}')
+        storage.set("a", response, None)
+        loaded = storage.get("a")
+        storage.close()
+        assert loaded == Response("url", {"h": "v"}, 200, {"a": 1})